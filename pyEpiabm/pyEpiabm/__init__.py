@@ -20,10 +20,14 @@ from . import utility
 # Expose modules in core within pyEpiabm namespace
 
 from .core._compartment_counter import _CompartmentCounter
+from .core._new_cases_counter import _NewCasesCounter
 from .core.cell import Cell
 from .core.household import Household
 from .core.microcell import Microcell
 from .core.parameters import Parameters
 from .core.person import Person
+from .core.person_buffer import PersonBuffer, ThreadSafePersonBuffer
 from .core.place import Place
 from .core.population import Population
+from .core.population_store import PopulationStore
+from .core.simulation_constants import SimulationConstants
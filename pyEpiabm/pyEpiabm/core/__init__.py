@@ -7,10 +7,14 @@
 """
 
 from .parameters import Parameters
+from .population_store import PopulationStore
 from .person import Person
+from .person_buffer import PersonBuffer, ThreadSafePersonBuffer
 from .cell import Cell
 from .household import Household
 from .microcell import Microcell
 from .place import Place
 from .population import Population
+from .simulation_constants import SimulationConstants
 from ._compartment_counter import _CompartmentCounter
+from ._new_cases_counter import _NewCasesCounter
@@ -12,7 +12,9 @@ import pyEpiabm.core
 
 class _CompartmentCounter:
     """Class Component which maintains count of people in each compartment,
-    according to their age group.
+    according to their age group. Counts are stored in a single integer
+    array, indexed by [status value - 1, age group], and may be forwarded
+    to a parent counter which aggregates several counters.
 
     """
 
@@ -34,10 +36,13 @@ class _CompartmentCounter:
         else:
             self.nb_age_groups = 1
 
-        # Internal datastore, returns array with age group for each status
-        # infection
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
+        # Internal datastore, with a row of age group counts for each status
+        self._counts = np.zeros((len(InfectionStatus), self.nb_age_groups),
+                                dtype=int)
+        # Views of each row of the datastore, returned by retrieve
+        self._compartments = {status: self._counts[status.value - 1]
                               for status in InfectionStatus}
+        self._parent = None
 
     @property
     def identifier(self):
@@ -46,6 +51,31 @@ class _CompartmentCounter:
         """
         return self._identifier
 
+    @property
+    def counts(self) -> np.ndarray:
+        """Get the array of counts, indexed by [status value - 1, age group].
+
+        """
+        return self._counts
+
+    def set_parent(self, parent: '_CompartmentCounter'):
+        """Forwards all later changes of this counter to the given parent
+        counter, after adding the current counts to it.
+
+        Parameters
+        ----------
+        parent : _CompartmentCounter
+            Counter aggregating this counter
+
+        """
+        if parent._counts.shape != self._counts.shape:
+            raise ValueError("Parent counter must have the same number of"
+                             + " age groups")
+        if self._parent is not None:
+            self._parent._counts -= self._counts
+        parent._counts += self._counts
+        self._parent = parent
+
     def report(self, old_status: InfectionStatus,
                new_status: InfectionStatus, age_group=0) -> None:
         """Report Person has changed state.
@@ -61,14 +91,16 @@ class _CompartmentCounter:
             Person's associated age group, defaults to 0 if age not implemented
 
         """
-        if self._compartments[old_status][age_group] <= 0:
+        old_index = old_status.value - 1
+        new_index = new_status.value - 1
+        if self._counts[old_index, age_group] <= 0:
             raise ValueError("No people of this status and of this age group \
                               in this cell.")
-        # Initialisation of the age_counter array
-        age_counter = np.zeros(self.nb_age_groups, dtype=int)
-        age_counter[age_group] = 1
-        self._compartments[old_status] -= age_counter
-        self._compartments[new_status] += age_counter
+        self._counts[old_index, age_group] -= 1
+        self._counts[new_index, age_group] += 1
+        if self._parent is not None:
+            self._parent._counts[old_index, age_group] -= 1
+            self._parent._counts[new_index, age_group] += 1
 
     def _increment_compartment(self, n_persons: int,
                                infection_status: InfectionStatus,
@@ -87,16 +119,17 @@ class _CompartmentCounter:
             Person's associated age group
 
         """
-        # Initialisation of the age_counter array
-        age_counter = np.zeros(self.nb_age_groups, dtype=int)
-        age_counter[age_group] = n_persons
-        self._compartments[infection_status] += age_counter
+        self._counts[infection_status.value - 1, age_group] += n_persons
+        if self._parent is not None:
+            self._parent._counts[infection_status.value - 1, age_group] += \
+                n_persons
 
     def retrieve(self) -> typing.Dict[InfectionStatus, np.array]:
         """Get Compartment Counts.
         Returns dictionary of compartment counts, in which each entry is an
         array containing the number of people by age group. If age is not used
-        then there is only one age group and the array length is 1.
+        then there is only one age group and the array length is 1. Arrays
+        are views of the internal datastore, so are not copied.
 
         Returns
         -------
@@ -109,6 +142,6 @@ class _CompartmentCounter:
     def clear_counter(self):
         """ Method to clear and reset compartment counter to zero.
         """
-
-        self._compartments = {status: np.zeros(self.nb_age_groups, dtype=int)
-                              for status in InfectionStatus}
+        if self._parent is not None:
+            self._parent._counts -= self._counts
+        self._counts[:] = 0
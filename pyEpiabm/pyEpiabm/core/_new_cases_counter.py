@@ -0,0 +1,122 @@
+#
+# Maintains a count of people whose infection started in the last day
+#
+
+import math
+import numpy as np
+
+import pyEpiabm.core
+
+
+class _NewCasesCounter:
+    """Class Component which maintains a count of the people whose infection
+    started in the trailing day, according to their age group. Infection
+    start times are reported as they are set, and counted in a ring buffer
+    with a slot for each time step of the day, indexed by
+    [slot, age group], so that counts are read without scanning the people
+    of the cell.
+
+    An infection which started at time s is counted at time t if
+    t - 1 < s <= t, for t on the grid of time steps.
+
+    """
+    # Allows for rounding errors in times built from the time step
+    _TOLERANCE = 1e-9
+
+    def __init__(self):
+        """Constructor Method. The buffers are allocated when the first
+        infection is reported, so that they are sized by the parameters of
+        the simulation.
+
+        """
+        self._steps_per_day = None
+        # Counts of each slot, and the time step each slot holds
+        self._counts = None
+        self._steps = None
+
+    def _allocate(self, nb_age_groups: int):
+        """Allocates the buffers, or widens them to the given number of age
+        groups.
+
+        Parameters
+        ----------
+        nb_age_groups : int
+            Number of age groups of the counts
+
+        """
+        if self._counts is None:
+            self._steps_per_day = max(int(round(
+                pyEpiabm.core.Parameters.instance().time_steps_per_day)), 1)
+            self._counts = np.zeros((self._steps_per_day, nb_age_groups),
+                                    dtype=int)
+            # No slot holds a time step yet
+            self._steps = np.full(self._steps_per_day,
+                                  np.iinfo(np.int64).min, dtype=np.int64)
+        elif nb_age_groups > self._counts.shape[1]:
+            self._counts = np.pad(
+                self._counts,
+                ((0, 0), (0, nb_age_groups - self._counts.shape[1])))
+
+    def _step(self, time: float) -> int:
+        """Returns the first time step at or after the given time.
+
+        """
+        return math.ceil(time * self._steps_per_day - self._TOLERANCE)
+
+    def report(self, old_time, new_time, age_group=0) -> None:
+        """Report Person's infection start time has changed.
+        Update internal ring buffer state.
+
+        Parameters
+        ----------
+        old_time : float
+            Person's previous infection start time, or None
+        new_time : float
+            Person's new infection start time, or None
+        age_group : Age group index
+            Person's associated age group, defaults to 0 if age not implemented
+
+        """
+        if old_time is not None and self._counts is not None:
+            step = self._step(old_time)
+            slot = step % self._steps_per_day
+            # Starts older than the slot have already been discarded
+            if self._steps[slot] == step:
+                self._counts[slot, age_group] -= 1
+        if new_time is not None:
+            self._allocate(age_group + 1)
+            step = self._step(new_time)
+            slot = step % self._steps_per_day
+            if self._steps[slot] < step:
+                self._counts[slot] = 0
+                self._steps[slot] = step
+            if self._steps[slot] == step:
+                self._counts[slot, age_group] += 1
+
+    def retrieve(self, time: float, nb_age_groups: int = 1) -> np.ndarray:
+        """Get New Case Counts.
+        Returns the number of people of each age group whose infection
+        started in the day up to the given time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        nb_age_groups : int
+            Minimum length of the returned array
+
+        Returns
+        -------
+        np.ndarray
+            Array of counts indexed by age group
+
+        """
+        if self._counts is None:
+            return np.zeros(nb_age_groups, dtype=int)
+        step = round(time * self._steps_per_day)
+        in_window = ((self._steps > step - self._steps_per_day)
+                     & (self._steps <= step))
+        counts = self._counts[in_window].sum(axis=0)
+        if len(counts) < nb_age_groups:
+            counts = np.pad(counts, (0, nb_age_groups - len(counts)))
+        return counts
@@ -4,16 +4,18 @@
 
 import typing
 import numpy as np
-from queue import Queue
 from numbers import Number
 
 from pyEpiabm.core import Parameters
-from pyEpiabm.property import InfectionStatus
-from pyEpiabm.utility import DistanceFunctions
+from pyEpiabm.property import InfectionStatus, PlaceType
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex
 
 from .microcell import Microcell
 from .person import Person
+from .person_buffer import PersonBuffer, ThreadSafePersonBuffer
+from .population_store import PopulationStore
 from ._compartment_counter import _CompartmentCounter
+from ._new_cases_counter import _NewCasesCounter
 
 
 class Cell:
@@ -21,13 +23,17 @@ class Cell:
     Collection of :class:`Microcell` s and :class:`Person` s.
 
     """
-    def __init__(self, loc: typing.Tuple[float, float] = (0, 0)):
+    def __init__(self, loc: typing.Tuple[float, float] = (0, 0),
+                 thread_safe: bool = False):
         """Constructor Method.
 
         Parameters
         ----------
         loc : Tuple(float, float)
             Location of the cell, as an (x,y) tuple
+        thread_safe : bool
+            Whether the buffers of people to be processed may be used by
+            several threads at once
 
         """
         self.location = loc
@@ -36,11 +42,22 @@ class Cell:
         self.persons = []
         self.places = []
         self.households = []
-        self.person_queue = Queue()
-        self.PCR_queue = Queue()
-        self.LFT_queue = Queue()
+        self.population_store = PopulationStore()
+        buffer = ThreadSafePersonBuffer if thread_safe else PersonBuffer
+        self.person_queue = buffer()
+        self.PCR_queue = buffer()
+        self.LFT_queue = buffer()
         self.compartment_counter = _CompartmentCounter(f"Cell {id(self)}")
+        self.new_cases_counter = _NewCasesCounter()
         self.nearby_cells = dict()
+        # Registry of currently infectious people, keyed by store row
+        self.infectious_persons = dict()
+        self.population = None
+        # Age index: store rows of self.persons, positions in
+        # self.persons sorted by age and the sorted ages
+        self._age_rows = None
+        self._age_order = None
+        self._sorted_ages = None
 
         if not (len(loc) == 2 and isinstance(loc[0], Number) and
                 isinstance(loc[1], Number)):
@@ -140,6 +157,107 @@ class Cell:
         """
         self.compartment_counter.report(old_status, new_status, age_group)
 
+    def register_infectious(self, person: Person, infectious: bool):
+        """Adds a person to, or removes them from, the registries of
+        infectious people of the cell and of its population. Called when
+        the person's infection status changes.
+
+        Parameters
+        ----------
+        person : Person
+            Person of the cell whose status has changed
+        infectious : bool
+            Whether the person is now infectious
+
+        """
+        if infectious:
+            self.infectious_persons[person._row] = person
+        else:
+            self.infectious_persons.pop(person._row, None)
+        if self.population is not None:
+            self.population.register_infectious(person, infectious)
+
+    def infectors(self) -> typing.List[Person]:
+        """Returns the currently infectious people of the cell, in the
+        order they were added to the cell.
+
+        Returns
+        -------
+        typing.List[Person]
+            List of infectious people
+
+        """
+        return [self.infectious_persons[row]
+                for row in sorted(self.infectious_persons)]
+
+    def build_age_index(self):
+        """Builds an index of the people in the cell sorted by age, so
+        that the people in an age range can be found by bisection rather
+        than by checking every person. Must be called again if people
+        are added to the cell or their ages change.
+
+        """
+        rows = np.fromiter((person._row for person in self.persons),
+                           dtype=int, count=len(self.persons))
+        ages = self.population_store.age[rows]
+        self._age_order = np.argsort(ages, kind='stable')
+        self._sorted_ages = ages[self._age_order]
+        self._age_rows = rows
+
+    def person_rows(self) -> np.ndarray:
+        """Returns the rows of :attr:`population_store` holding the people
+        in :attr:`persons`, in the same order. The rows are kept with the
+        age index (see :meth:`build_age_index`), which is rebuilt if people
+        have been added since.
+
+        Returns
+        -------
+        np.ndarray
+            Array of store rows, indexed by position in :attr:`persons`
+
+        """
+        if self._age_rows is None or len(self._age_rows) != len(self.persons):
+            self.build_age_index()
+        return self._age_rows
+
+    def persons_in_age_range(self, min_age: float = None,
+                             max_age: float = None,
+                             exclude_place_type=None) -> np.ndarray:
+        """Returns the positions in :attr:`persons` of the people with
+        min_age <= age < max_age. Ages are stored as integers, but the
+        bounds need not be. The age index is built on first use (see
+        :meth:`build_age_index`).
+
+        Parameters
+        ----------
+        min_age : float
+            Minimum age, or None for no lower bound
+        max_age : float
+            Age above the maximum age, or None for no upper bound
+        exclude_place_type : PlaceType
+            If given, people who already have a place of this type are
+            left out
+
+        Returns
+        -------
+        np.ndarray
+            Sorted array of positions in :attr:`persons`
+
+        """
+        if self._age_order is None:
+            self.build_age_index()
+        low = (0 if min_age is None else
+               np.searchsorted(self._sorted_ages, min_age, side='left'))
+        high = (len(self._sorted_ages) if max_age is None else
+                np.searchsorted(self._sorted_ages, max_age, side='left'))
+        positions = self._age_order[low:high]
+        if exclude_place_type is not None:
+            masks = self.population_store.place_type_mask[
+                self._age_rows[positions]]
+            bit = 1 << PlaceType(exclude_place_type).value
+            positions = positions[(masks & bit) == 0]
+        return np.sort(positions)
+
     def number_infectious(self):
         """Returns the total number of infectious people in each
         cell, all ages combined.
@@ -150,13 +268,9 @@ class Cell:
             Total infectors in cell
 
         """
-        cell_data = self.compartment_counter.retrieve()
-        total_infectors = 0
-        for status in InfectionStatus:
-            if str(status).startswith('InfectionStatus.Infect'):
-                total_infectors += np.sum(cell_data[status])
-
-        return total_infectors
+        # Rows of the counts are indexed by status value - 1
+        counts = self.compartment_counter.counts
+        return np.sum(counts[InfectionStatus.is_infectious[1:]])
 
     def set_location(self, loc: typing.Tuple[float, float]):
         """Method to set or change the location of a cell.
@@ -169,7 +283,8 @@ class Cell:
         """
         self.location = loc
 
-    def find_nearby_cells(self, other_cells):
+    def find_nearby_cells(self, other_cells,
+                          spatial_index: SpatialIndex = None):
         '''
         Helper function which takes in a given cell and the list of all cells
         and generates a list of nearby cells which are
@@ -184,12 +299,24 @@ class Cell:
         Parameters
         ----------
         other_cells : typing.List[Cell]
-            List of all cells except cell
+            List of all cells except cell. This cell is skipped if included
+        spatial_index : SpatialIndex
+            Index of the locations of `other_cells`, built with buckets of
+            the size of the infection radius if not given. Only the cells
+            in nearby buckets have their distance computed
 
         '''
         cutoff = Parameters.instance().infection_radius
-
-        for cell2 in other_cells:
+        if cutoff <= 0:
+            return
+        if spatial_index is None:
+            spatial_index = SpatialIndex([cell2.location
+                                          for cell2 in other_cells], cutoff)
+
+        for index in spatial_index.candidates(self.location, cutoff):
+            cell2 = other_cells[index]
+            if cell2 is self:
+                continue
             distance = DistanceFunctions.dist(self.location, cell2.location)
             if distance < cutoff:
                 self.nearby_cells[cell2.id] = distance
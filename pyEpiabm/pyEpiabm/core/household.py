@@ -36,6 +36,8 @@ class Household:
         self.infectiousness = infectiousness
         self.cell = microcell.cell
         self.microcell = microcell
+        # Position of the household in its cell's household list
+        self.index = len(microcell.cell.households)
 
         if not (len(loc) == 2 and isinstance(loc[0], Number) and
                 isinstance(loc[1], Number)):
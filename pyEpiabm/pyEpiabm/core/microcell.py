@@ -23,6 +23,14 @@ class Microcell:
     cell : Cell
         An instance of :class:`Cell`
 
+    Attributes
+    ----------
+    closure_start_time : float
+        Time places in the microcell close, or None if not closed
+    distancing_start_time : float
+        Time social distancing starts in the microcell, or None if
+        there is no social distancing
+
     """
     def __init__(self, cell):
         """Constructor Method.
@@ -41,6 +49,8 @@ class Microcell:
         self.location = cell.location
         self.compartment_counter = _CompartmentCounter(
             f"Microcell {id(self)}")
+        self.closure_start_time = None
+        self.distancing_start_time = None
 
     def __repr__(self):
         """Returns a string representation of Microcell.
@@ -180,5 +190,40 @@ class Microcell:
                    InfectionStatus.InfectICU, self.persons))
 
     def count_infectious(self):
-        return sum(map(lambda person: person.is_infectious() is
-                   True, self.persons))
+        return sum(map(Person.is_infectious, self.persons))
+
+    def is_closed(self, time):
+        """Returns whether places in the microcell are closed at the given
+        time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether place closure has started by this time
+
+        """
+        return (self.closure_start_time is not None
+                and self.closure_start_time <= time)
+
+    def is_distancing(self, time):
+        """Returns whether social distancing applies in the microcell at
+        the given time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether social distancing has started by this time
+
+        """
+        return (self.distancing_start_time is not None
+                and self.distancing_start_time <= time)
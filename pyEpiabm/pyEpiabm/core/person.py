@@ -2,16 +2,70 @@
 # Person Class
 #
 
+import math
 import random
+import typing
 
-from pyEpiabm.property import InfectionStatus
+from pyEpiabm.property import InfectionStatus, PlaceType
 
+from .household import Household
 from .parameters import Parameters
+from .population_store import PopulationStore
+
+
+# Lookup from stored status value to InfectionStatus (0 is no status)
+_STATUSES = (None,) + tuple(InfectionStatus(i)
+                            for i in range(1, len(InfectionStatus) + 1))
+
+
+def _status_to_python(value):
+    return _STATUSES[value]
+
+
+def _status_to_store(status):
+    return 0 if status is None else status.value
+
+
+def _time_to_python(value):
+    return None if math.isnan(value) else value
+
+
+def _time_to_store(time):
+    return math.nan if time is None else time
+
+
+def _int_to_python(value):
+    return None if value == PopulationStore.NO_INT else value
+
+
+def _int_to_store(value):
+    return PopulationStore.NO_INT if value is None else value
+
+
+def _column_property(name, doc, to_python=None, to_store=None):
+    """Builds a property reading and writing the person's row of the
+    given :class:`PopulationStore` column.
+
+    """
+    def getter(self):
+        value = getattr(self._store, name).item(self._row)
+        return value if to_python is None else to_python(value)
+
+    def setter(self, value):
+        if to_store is not None:
+            value = to_store(value)
+        getattr(self._store, name)[self._row] = value
+
+    return property(getter, setter, doc=doc)
 
 
 class Person:
     """Class to represent each person in a population.
 
+    The attributes listed below are held in the
+    :class:`PopulationStore` of the person's cell, so that a Person
+    is a view onto one row of that store.
+
     Parameters
     ----------
     microcell : Microcell
@@ -28,6 +82,39 @@ class Person:
 
     """
 
+    next_infection_status = _column_property(
+        'next_infection_status', "Next infection status, or None",
+        _status_to_python, _status_to_store)
+    age = _column_property(
+        'age', "Age of the person, or None if ages are not used",
+        _int_to_python, _int_to_store)
+    infectiousness = _column_property(
+        'infectiousness', "Current infectiousness")
+    initial_infectiousness = _column_property(
+        'initial_infectiousness', "Infectiousness at start of infection")
+    care_home_resident = _column_property(
+        'care_home_resident', "Whether the person lives in a care home")
+    key_worker = _column_property(
+        'key_worker', "Whether the person is a key worker")
+    is_vaccinated = _column_property(
+        'is_vaccinated', "Whether the person has been vaccinated")
+    date_vaccinated = _column_property(
+        'date_vaccinated', "Time the person was vaccinated",
+        _time_to_python, _time_to_store)
+    date_positive = _column_property(
+        'date_positive', "Time of the person's last positive test",
+        _time_to_python, _time_to_store)
+    isolation_start_time = _column_property(
+        'isolation_start_time', "Time the person starts case isolation, "
+        "or None if not isolating", _time_to_python, _time_to_store)
+    quarantine_start_time = _column_property(
+        'quarantine_start_time', "Time the person starts household "
+        "quarantine, or None if not in quarantine",
+        _time_to_python, _time_to_store)
+    distancing_enhanced = _column_property(
+        'distancing_enhanced', "Whether the person takes enhanced social "
+        "distancing")
+
     def __init__(self, microcell, age_group=None):
         """Constructor Method.
 
@@ -40,23 +127,97 @@ class Person:
             be assigned
 
         """
-        self.initial_infectiousness = 0
-        self.infectiousness = 0
+        self._store = microcell.cell.population_store
+        self._row = self._store.add_row(self)
         self.microcell = microcell
-        self.infection_status = InfectionStatus.Susceptible
-        self.household = None
-        self.places = []
+        self._household = None
+        self.places = {}
         self.place_types = []
-        self.next_infection_status = None
-        self.time_of_status_change = None
-        self.infection_start_time = None
-        self.care_home_resident = False
-        self.key_worker = False
-        self.date_positive = None
-        self.is_vaccinated = False
 
         self.set_random_age(age_group)
 
+    @property
+    def infection_status(self):
+        """Current infection status.
+
+        """
+        return _STATUSES[self._store.infection_status.item(self._row)]
+
+    @infection_status.setter
+    def infection_status(self, status):
+        was_infectious = self.infection_status in InfectionStatus.infectious
+        self._store.infection_status[self._row] = _status_to_store(status)
+        if (status in InfectionStatus.infectious) != was_infectious:
+            self.microcell.cell.register_infectious(self, not was_infectious)
+
+    @property
+    def age_group(self):
+        """Index of the person's age group.
+
+        """
+        return self._store.age_group.item(self._row)
+
+    @age_group.setter
+    def age_group(self, age_group):
+        start_time = self.infection_start_time
+        if start_time is not None:
+            # Moves the person's infection to their new age group
+            counter = self.microcell.cell.new_cases_counter
+            counter.report(start_time, None, self.age_group)
+            counter.report(None, start_time, age_group)
+        self._store.age_group[self._row] = age_group
+
+    @property
+    def infection_start_time(self):
+        """Time the person became infectious, or None.
+
+        """
+        return _time_to_python(
+            self._store.infection_start_time.item(self._row))
+
+    @infection_start_time.setter
+    def infection_start_time(self, time):
+        old_time = self.infection_start_time
+        self._store.infection_start_time[self._row] = _time_to_store(time)
+        if time is not None or old_time is not None:
+            self.microcell.cell.new_cases_counter.report(
+                old_time, time, self.age_group)
+
+    @property
+    def time_of_status_change(self):
+        """Time of next infection status change, or None.
+
+        """
+        return _time_to_python(
+            self._store.time_of_status_change.item(self._row))
+
+    @time_of_status_change.setter
+    def time_of_status_change(self, time):
+        self._store.time_of_status_change[self._row] = _time_to_store(time)
+        self._store.schedule(self._row, time)
+
+    @property
+    def store_row(self) -> typing.Tuple[PopulationStore, int]:
+        """Get the :class:`PopulationStore` holding the person's data, and
+        the person's row in it, so that the data of many people may be
+        updated at once.
+
+        """
+        return self._store, self._row
+
+    @property
+    def household(self):
+        """Household the person lives in, or None.
+
+        """
+        return self._household
+
+    @household.setter
+    def household(self, household):
+        self._household = household
+        self._store.household[self._row] = household.index \
+            if isinstance(household, Household) else -1
+
     def set_random_age(self, age_group=None):
         """Set random age of person, and save index of their age group.
         Note that the max age in the 80+ group is 84 here, however the precise
@@ -87,8 +248,7 @@ class Person:
             Whether person is currently symptomatic
 
         """
-        return Person.is_infectious(self) and self.infection_status != \
-            InfectionStatus.InfectASympt
+        return self.infection_status in InfectionStatus.symptomatic
 
     def is_infectious(self):
         """Query if the person is currently infectious.
@@ -99,7 +259,7 @@ class Person:
             Whether person is currently infectious
 
         """
-        return str(self.infection_status).startswith('InfectionStatus.Infect')
+        return self.infection_status in InfectionStatus.infectious
 
     def is_susceptible(self):
         """Query if the person is currently susceptible.
@@ -147,9 +307,9 @@ class Person:
 
     def add_place(self, place, person_group: int = 0):
         """Method adds a place to the place list if the person visits
-        or is associated with this place. Places are saved as a tuple
-        with the place as the first entry and the group the person is
-        associated with as the second.
+        or is associated with this place. Places are saved as keys of a
+        dictionary, with the group the person is associated with as the
+        value.
 
         Parameters
         ----------
@@ -162,8 +322,10 @@ class Person:
         if place.cell != self.microcell.cell:
             raise AttributeError("Place and person are not in the same\
                                  cell")
-        self.places.append((place, person_group))
+        self.places[place] = person_group
         self.place_types.append(place.place_type)
+        self._store.place_type_mask[self._row] |= \
+            1 << PlaceType(place.place_type).value
 
     def remove_place(self, place):
         """Method to remove person for each associated place, to be
@@ -175,13 +337,13 @@ class Person:
             Place person should be removed from
 
         """
-        place_list = [i[0] for i in self.places]
-        if place not in place_list:
+        if place not in self.places:
             raise KeyError("Person not found in this place")
-        else:
-            ind = place_list.index(place)
-            self.places.pop(ind)
-            self.place_types.pop(ind)
+        del self.places[place]
+        self.place_types.remove(place.place_type)
+        if place.place_type not in self.place_types:
+            self._store.place_type_mask[self._row] &= \
+                ~(1 << PlaceType(place.place_type).value)
 
     def is_place_closed(self, closure_place_type):
         """Method to check if any of the place in the person's place list
@@ -194,13 +356,47 @@ class Person:
             PlaceType should be closed if in place closure intervention
 
         """
-        if (hasattr(self.microcell, 'closure_start_time')) and (
-                self.microcell.closure_start_time is not None):
+        if self.microcell.closure_start_time is not None:
             for place_type in self.place_types:
                 if place_type.value in closure_place_type:
                     return True
         return False
 
+    def is_isolating(self, time):
+        """Returns whether the person is in case isolation at the given
+        time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether the person's isolation has started by this time
+
+        """
+        # Unset times are NaN, which compare as False
+        return self._store.isolation_start_time.item(self._row) <= time
+
+    def is_quarantined(self, time):
+        """Returns whether the person is in household quarantine at the
+        given time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        bool
+            Whether the person's quarantine has started by this time
+
+        """
+        return self._store.quarantine_start_time.item(self._row) <= time
+
     def vaccinate(self, time):
         """Used to set a persons vaccination status to vaccinated
         if they are drawn from the vaccine queue.
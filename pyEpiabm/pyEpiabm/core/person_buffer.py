@@ -0,0 +1,139 @@
+#
+# Buffers of people waiting to be processed by a sweep
+#
+
+import threading
+import typing
+from collections import deque
+
+
+class PersonBuffer:
+    """Class holding the people of a cell who are waiting to be processed
+    (e.g. to be exposed or tested), in the order they were added. Each
+    person is held at most once, so a person added several times before
+    being processed (for example if exposed by several infectors in one
+    time step) is only processed once.
+
+    The methods :meth:`put`, :meth:`get`, :meth:`empty` and :meth:`qsize`
+    match those of :class:`queue.Queue`, but no locks are taken. See
+    :class:`ThreadSafePersonBuffer` for use by several threads.
+
+    """
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        self._items = deque()
+        self._members = set()
+
+    def __len__(self):
+        """Returns the number of people in the buffer.
+
+        Returns
+        -------
+        int
+            Number of people waiting
+
+        """
+        return len(self._items)
+
+    def put(self, person):
+        """Adds a person to the end of the buffer, unless they are already
+        in it.
+
+        Parameters
+        ----------
+        person : Person
+            Person to add
+
+        """
+        if person not in self._members:
+            self._members.add(person)
+            self._items.append(person)
+
+    def get(self):
+        """Removes and returns the person at the front of the buffer.
+
+        Returns
+        -------
+        Person
+            Person who has waited longest
+
+        """
+        if not self._items:
+            raise IndexError("Cannot get from an empty buffer")
+        person = self._items.popleft()
+        self._members.discard(person)
+        return person
+
+    def drain(self, max_items: int = None) -> typing.List:
+        """Removes and returns the people at the front of the buffer, in
+        the order they were added.
+
+        Parameters
+        ----------
+        max_items : int
+            Maximum number of people to remove. All are removed if not
+            given
+
+        Returns
+        -------
+        typing.List[Person]
+            List of people removed from the buffer
+
+        """
+        if max_items is None or max_items >= len(self._items):
+            people = list(self._items)
+            self._items.clear()
+            self._members.clear()
+            return people
+        people = [self._items.popleft() for _ in range(max(max_items, 0))]
+        self._members.difference_update(people)
+        return people
+
+    def empty(self) -> bool:
+        """Returns whether the buffer is empty.
+
+        Returns
+        -------
+        bool
+            True if no people are waiting
+
+        """
+        return not self._items
+
+    def qsize(self) -> int:
+        """Returns the number of people in the buffer.
+
+        Returns
+        -------
+        int
+            Number of people waiting
+
+        """
+        return len(self._items)
+
+
+class ThreadSafePersonBuffer(PersonBuffer):
+    """Class of :class:`PersonBuffer` which may be used by several threads
+    at once, by holding a lock while the buffer is changed.
+
+    """
+    def __init__(self):
+        """Constructor Method.
+
+        """
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def put(self, person):
+        with self._lock:
+            super().put(person)
+
+    def get(self):
+        with self._lock:
+            return super().get()
+
+    def drain(self, max_items: int = None) -> typing.List:
+        with self._lock:
+            return super().drain(max_items)
@@ -35,8 +35,10 @@ class Place:
 
         """
         self._location = loc
-        self.persons = []
-        self.person_groups = {0: []}
+        # Person: group index, and group index: {person: None}, so that
+        # membership can be looked up and removed in constant time
+        self.persons = {}
+        self.person_groups = {0: {}}
         self.num_person_groups = 1
         self.place_type = place_type
         self.susceptibility = 0
@@ -98,11 +100,11 @@ class Place:
             Key for the person group dictionary
 
         """
-        self.persons.append(person)
-        if person_group in self.person_groups.keys():
-            self.person_groups[person_group].append(person)
+        self.persons[person] = person_group
+        if person_group in self.person_groups:
+            self.person_groups[person_group][person] = None
         else:
-            self.person_groups[person_group] = [person]
+            self.person_groups[person_group] = {person: None}
             self.num_person_groups += 1
         person.add_place(self, person_group)
 
@@ -115,13 +117,10 @@ class Place:
             Person to remove from place
 
         """
-        if person not in self.persons:
-            raise KeyError("Person not found in this place")
-        else:
-            group_index = self.get_group_index(person)
-            self.person_groups[group_index].remove(person)
-            person.remove_place(self)
-            self.persons.remove(person)
+        group_index = self.get_group_index(person)
+        del self.person_groups[group_index][person]
+        del self.persons[person]
+        person.remove_place(self)
 
     def get_group_index(self, person):
         """Get the group of a person in the place.
@@ -129,19 +128,18 @@ class Place:
         :param person: Person associated with group
         :type person: Person
         """
-        if person not in self.persons:
-            raise KeyError("Person not found in this place")
-        else:
-            place_list = [i[0] for i in person.places]
-            ind = place_list.index(self)
-        return person.places[ind][1]
+        try:
+            return self.persons[person]
+        except KeyError:
+            raise KeyError("Person not found in this place") from None
 
     def empty_place(self, groups_to_empty: list = []):
         """Remove all people from place who are in a specific
         person group. For example a restaurant or park might
         regularly change all occupants each timestep, but
         workers at the restaurant will be present each timestep.
-        Defaults to emptying the whole place.
+        Defaults to emptying the whole place. Each group is cleared
+        in bulk, rather than by removing its members one at a time.
 
         :param person_groups: List of person_group
             indicies to be removed
@@ -149,9 +147,11 @@ class Place:
 
         """
         if len(groups_to_empty) == 0:
-            groups_to_empty = [key for key in self.person_groups.keys()]
+            groups_to_empty = list(self.person_groups.keys())
         for group in groups_to_empty:
-            if group not in self.person_groups.keys():
+            if group not in self.person_groups:
                 continue
             for person in self.person_groups[group]:
-                self.remove_person(person)
+                del self.persons[person]
+                person.remove_place(self)
+            self.person_groups[group] = {}
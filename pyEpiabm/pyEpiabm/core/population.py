@@ -1,9 +1,11 @@
 #
 # Population Class
 #
+import typing
 from queue import PriorityQueue
 
 from .cell import Cell
+from ._compartment_counter import _CompartmentCounter
 from .person import Person
 
 
@@ -16,8 +18,13 @@ class Population:
         """Constructor Method.
 
         """
-        self.cells = []
+        self._cells = []
+        # Read only view of the cells, built when first required
+        self._cells_view = None
         self.vaccine_queue = PriorityQueue()
+        self._compartment_counter = None
+        # Registry of currently infectious people, in all cells
+        self.infectious_persons = dict()
 
     def __repr__(self):
         """Returns a string representation of a Population.
@@ -30,6 +37,46 @@ class Population:
         """
         return "Population with {} cells.".format(len(self.cells))
 
+    @property
+    def cells(self) -> typing.Tuple[Cell, ...]:
+        """Get the cells of the population. The cells are read only, so
+        that each cell is added through :meth:`add_cell` and aggregated in
+        the population's compartment counter.
+
+        """
+        if self._cells_view is None:
+            self._cells_view = tuple(self._cells)
+        return self._cells_view
+
+    @cells.setter
+    def cells(self, cells: typing.Iterable[Cell]):
+        """Replaces the cells of the population, adding each of the given
+        cells through :meth:`add_cell`.
+
+        Parameters
+        ----------
+        cells : typing.Iterable[Cell]
+            Cells of the population
+
+        """
+        self._cells = []
+        self._cells_view = None
+        self._compartment_counter = None
+        self.infectious_persons = dict()
+        for cell in cells:
+            self.add_cell(cell)
+
+    @property
+    def compartment_counter(self) -> _CompartmentCounter:
+        """Get the counter aggregating the compartment counts of all cells
+        in the population. It is created when first required, so that a
+        population may be created before the parameters are configured.
+
+        """
+        if self._compartment_counter is None:
+            self._compartment_counter = _CompartmentCounter("Population")
+        return self._compartment_counter
+
     def add_cells(self, n):
         """Adds n default :class:`Cell` s to the population.
 
@@ -39,9 +86,56 @@ class Population:
             Number of empty :class:`Cell` s to add
 
         """
-        for i in range(n):
-            self.cells.append(Cell())
-            self.cells[i].set_id(i)
+        for _ in range(n):
+            cell = Cell()
+            # Cells are numbered by their position in the population
+            cell.set_id(len(self._cells))
+            self.add_cell(cell)
+
+    def add_cell(self, cell: Cell):
+        """Adds the given :class:`Cell` to the population, and aggregates
+        its compartment counts in the population's compartment counter.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell to add
+
+        """
+        self._cells.append(cell)
+        self._cells_view = None
+        cell.compartment_counter.set_parent(self.compartment_counter)
+        cell.population = self
+        for person in cell.infectors():
+            self.register_infectious(person, True)
+
+    def register_infectious(self, person: Person, infectious: bool):
+        """Adds a person to, or removes them from, the registry of
+        infectious people of the population.
+
+        Parameters
+        ----------
+        person : Person
+            Person whose status has changed
+        infectious : bool
+            Whether the person is now infectious
+
+        """
+        if infectious:
+            self.infectious_persons[person] = None
+        else:
+            self.infectious_persons.pop(person, None)
+
+    def infectors(self) -> typing.List[Person]:
+        """Returns the currently infectious people of the population.
+
+        Returns
+        -------
+        typing.List[Person]
+            List of infectious people
+
+        """
+        return list(self.infectious_persons)
 
     def total_people(self):
         """Returns the total number of people in the population.
@@ -0,0 +1,240 @@
+#
+# Struct-of-arrays storage for person attributes
+#
+
+import heapq
+import math
+import numpy as np
+
+from pyEpiabm.property import InfectionStatus
+
+
+class PopulationStore:
+    """Class storing the per-person attributes of a collection of
+    :class:`Person` s in contiguous numpy arrays (one array per attribute),
+    so that sweeps may act on whole columns at once. Each :class:`Person`
+    is a view onto one row of a store, identified by its row index.
+
+    Missing values are recorded with sentinel values: a status of
+    0 stands for no status (i.e. None), NaN for an unset time and
+    :attr:`NO_INT` for an unset integer attribute. Arrays are
+    allocated with spare capacity, so only the first `len(store)`
+    rows are in use.
+
+    Once :meth:`enable_schedule` has been called, the store also keeps
+    a time-ordered queue of pending infection status changes, so that
+    the people due to change status can be found without scanning
+    every row.
+
+    """
+    NO_INT = np.iinfo(np.int32).min
+
+    # Column name: (dtype, fill value for unused rows)
+    _columns = {
+        'infection_status': (np.int8, InfectionStatus.Susceptible.value),
+        'next_infection_status': (np.int8, 0),
+        'age_group': (np.int32, 0),
+        'age': (np.int32, NO_INT),
+        'infectiousness': (np.float64, 0.0),
+        'initial_infectiousness': (np.float64, 0.0),
+        'infection_start_time': (np.float64, np.nan),
+        'time_of_status_change': (np.float64, np.nan),
+        'household': (np.int32, -1),
+        'care_home_resident': (np.bool_, False),
+        'key_worker': (np.bool_, False),
+        'is_vaccinated': (np.bool_, False),
+        'date_vaccinated': (np.float64, np.nan),
+        'date_positive': (np.float64, np.nan),
+        'isolation_start_time': (np.float64, np.nan),
+        'quarantine_start_time': (np.float64, np.nan),
+        'distancing_enhanced': (np.bool_, False),
+        # Bit n is set if the person has a place with PlaceType value n
+        'place_type_mask': (np.int32, 0),
+    }
+
+    def __init__(self, capacity: int = 16):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        capacity : int
+            Number of rows to allocate initially. The store grows as
+            required when rows are added
+
+        """
+        self._size = 0
+        self._capacity = max(int(capacity), 1)
+        self.persons = []
+        self._schedule = None
+        for name, (dtype, fill) in PopulationStore._columns.items():
+            setattr(self, name, np.full(self._capacity, fill, dtype=dtype))
+
+    def __len__(self):
+        """Returns the number of rows in use.
+
+        Returns
+        -------
+        int
+            Number of people stored
+
+        """
+        return self._size
+
+    def __repr__(self):
+        """Returns a string representation of the PopulationStore.
+
+        Returns
+        -------
+        str
+            String representation of the PopulationStore
+
+        """
+        return f"PopulationStore with {self._size} people."
+
+    @classmethod
+    def column_names(cls):
+        """Returns the names of the stored attributes.
+
+        Returns
+        -------
+        list
+            List of column names
+
+        """
+        return list(cls._columns.keys())
+
+    def add_row(self, person=None) -> int:
+        """Reserves a new row with default values, growing the
+        underlying arrays if required.
+
+        Parameters
+        ----------
+        person : Person
+            Person viewing this row, recorded so that rows can be mapped
+            back to their :class:`Person`
+
+        Returns
+        -------
+        int
+            Index of the new row
+
+        """
+        if self._size == self._capacity:
+            self.reserve(2 * self._capacity)
+        index = self._size
+        self._size += 1
+        self.persons.append(person)
+        return index
+
+    def reserve(self, capacity: int):
+        """Grows the underlying arrays so that at least `capacity` rows
+        may be stored without reallocation. Existing values are kept.
+
+        Parameters
+        ----------
+        capacity : int
+            Minimum number of rows to allocate
+
+        """
+        if capacity <= self._capacity:
+            return
+        for name, (dtype, fill) in PopulationStore._columns.items():
+            new_column = np.full(capacity, fill, dtype=dtype)
+            new_column[:self._size] = getattr(self, name)[:self._size]
+            setattr(self, name, new_column)
+        self._capacity = capacity
+
+    def view(self, name: str) -> np.ndarray:
+        """Returns the rows in use of the given column. This is a view,
+        so modifying it modifies the store.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column
+
+        Returns
+        -------
+        np.ndarray
+            Array of values for each stored person
+
+        """
+        if name not in PopulationStore._columns:
+            raise KeyError(f"Unknown column '{name}'")
+        return getattr(self, name)[:self._size]
+
+    def status_mask(self, *statuses: InfectionStatus) -> np.ndarray:
+        """Returns a boolean mask of the people whose infection status is
+        any of the given statuses.
+
+        Parameters
+        ----------
+        *statuses : InfectionStatus
+            Statuses to select
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array over the stored people
+
+        """
+        values = [status.value for status in statuses]
+        return np.isin(self.view('infection_status'), values)
+
+    def enable_schedule(self):
+        """Starts keeping a time-ordered queue of pending status changes,
+        seeded with the finite times of status change already stored.
+        Subsequent changes must be reported through :meth:`schedule`,
+        which is done automatically when setting
+        :attr:`Person.time_of_status_change`.
+
+        """
+        if self._schedule is not None:
+            return
+        times = self.view('time_of_status_change')
+        rows = np.flatnonzero(np.isfinite(times))
+        self._schedule = list(zip(times[rows].tolist(), rows.tolist()))
+        heapq.heapify(self._schedule)
+
+    def schedule(self, row: int, time: float):
+        """Records that the person in the given row will next change
+        status at the given time. Has no effect until
+        :meth:`enable_schedule` is called, or if the time is not finite.
+
+        Parameters
+        ----------
+        row : int
+            Row of the person
+        time : float
+            Time of the person's next status change
+
+        """
+        if (self._schedule is not None and time is not None
+                and math.isfinite(time)):
+            heapq.heappush(self._schedule, (time, row))
+
+    def pop_due(self, time: float) -> list:
+        """Removes and returns the rows of all people whose status change
+        is due at or before the given time. Queue entries which are out of
+        date (as the time of status change has since been changed) are
+        discarded.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        list
+            Sorted list of rows which are due to change status
+
+        """
+        if self._schedule is None:
+            raise RuntimeError("Schedule has not been enabled")
+        due = set()
+        while self._schedule and self._schedule[0][0] <= time:
+            scheduled_time, row = heapq.heappop(self._schedule)
+            if self.time_of_status_change[row] == scheduled_time:
+                due.add(row)
+        return sorted(due)
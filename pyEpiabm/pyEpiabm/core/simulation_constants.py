@@ -0,0 +1,133 @@
+#
+# Immutable snapshot of the parameters used in the innermost loops
+#
+
+import numpy as np
+
+from pyEpiabm.property import PlaceType
+
+from .parameters import Parameters
+
+
+def _array(values) -> np.ndarray:
+    """Returns a read-only float array of the given values.
+
+    """
+    array = np.array(values, dtype=float).reshape(-1)
+    array.flags.writeable = False
+    return array
+
+
+class SimulationConstants:
+    """Class holding the parameters read by the force of infection
+    calculations and the disease testing queues, compiled once from
+    :class:`Parameters` so that no nested dictionary lookups are made for
+    each infector or infectee. Values which depend on the place type are
+    held in arrays indexed by the place type value minus one, and values
+    which depend on the person's group for disease testing in arrays
+    indexed by 0 for care home residents, 1 for key workers and 2 for
+    everyone else.
+
+    Parameters of interventions which are not configured take values which
+    leave the force of infection unchanged. Instances are immutable, so a
+    new instance must be built if the parameters change.
+
+    """
+    def __init__(self, parameters=None):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        parameters
+            Parameters object to compile. Defaults to the current instance
+            of :class:`Parameters`
+
+        """
+        if parameters is None:
+            parameters = Parameters.instance()
+        self.basic_reproduction_num = float(getattr(
+            parameters, 'basic_reproduction_num', 0.0))
+        self.household_transmission = float(getattr(
+            parameters, 'household_transmission', 0.0))
+        # Kept as given, as it is compared with True in the spatial
+        # infectiousness
+        self.use_ages = getattr(parameters, 'use_ages', False)
+        self.age_contact = _array(getattr(parameters, 'age_contact', []))
+
+        place_params = getattr(parameters, 'place_params', {})
+        self.place_transmission = float(place_params.get(
+            'place_transmission', 0.0))
+        # Place types without a mean group size have one group
+        group_size = np.ones(len(PlaceType))
+        mean_group_size = _array(place_params.get('mean_group_size', []))
+        count = min(len(mean_group_size), len(PlaceType))
+        group_size[:count] = mean_group_size[:count]
+        self.place_group_size = _array(group_size)
+
+        carehome_params = getattr(parameters, 'carehome_params', {})
+        self.carehome_resident_household_scaling = float(carehome_params.get(
+            'carehome_resident_household_scaling', 1.0))
+        self.carehome_resident_spatial_scaling = float(carehome_params.get(
+            'carehome_resident_spatial_scaling', 1.0))
+        self.carehome_worker_group_scaling = float(carehome_params.get(
+            'carehome_worker_group_scaling', 1.0))
+
+        intervention_params = getattr(parameters, 'intervention_params', {})
+        isolation = intervention_params.get('case_isolation', {})
+        self.isolation_effectiveness = float(isolation.get(
+            'isolation_effectiveness', 1.0))
+        self.isolation_house_effectiveness = float(isolation.get(
+            'isolation_house_effectiveness', 1.0))
+
+        quarantine = intervention_params.get('household_quarantine', {})
+        self.quarantine_house_effectiveness = float(quarantine.get(
+            'quarantine_house_effectiveness', 1.0))
+        self.quarantine_spatial_effectiveness = float(quarantine.get(
+            'quarantine_spatial_effectiveness', 1.0))
+        self.quarantine_place_effectiveness = _array(quarantine.get(
+            'quarantine_place_effectiveness', np.ones(len(PlaceType))))
+
+        closure = intervention_params.get('place_closure', {})
+        self.closure_place_type = frozenset(
+            _array(closure.get('closure_place_type', [])).astype(int)
+            .tolist())
+        self.closure_household_infectiousness = float(closure.get(
+            'closure_household_infectiousness', 1.0))
+        self.closure_spatial_params = float(closure.get(
+            'closure_spatial_params', 1.0))
+
+        distancing = intervention_params.get('social_distancing', {})
+        self.distancing_house_susc = float(distancing.get(
+            'distancing_house_susc', 1.0))
+        self.distancing_house_enhanced_susc = float(distancing.get(
+            'distancing_house_enhanced_susc', 1.0))
+        self.distancing_spatial_susc = float(distancing.get(
+            'distancing_spatial_susc', 1.0))
+        self.distancing_spatial_enhanced_susc = float(distancing.get(
+            'distancing_spatial_enhanced_susc', 1.0))
+        self.distancing_place_susc = _array(distancing.get(
+            'distancing_place_susc', np.ones(len(PlaceType))))
+        self.distancing_place_enhanced_susc = _array(distancing.get(
+            'distancing_place_enhanced_susc', np.ones(len(PlaceType))))
+
+        vaccine = intervention_params.get('vaccine_params', {})
+        self.time_to_efficacy = float(vaccine.get('time_to_efficacy', 0.0))
+        self.vacc_inf_drop = float(vaccine.get('vacc_inf_drop', 0.0))
+
+        self.testing = 'disease_testing' in intervention_params
+        testing = intervention_params.get('disease_testing', {})
+        self.testing_sympt = _array(testing.get('testing_sympt', []))
+        self.sympt_pcr = _array(testing.get('sympt_pcr', []))
+        self.testing_asympt_uninf = _array(testing.get(
+            'testing_asympt_uninf', []))
+        self.asympt_uninf_pcr = _array(testing.get('asympt_uninf_pcr', []))
+
+        self._frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError("SimulationConstants cannot be modified")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError("SimulationConstants cannot be modified")
@@ -1,4 +1,5 @@
 from .abstract_intervention import AbstractIntervention
+from .intervention_timer import InterventionTimer
 from .case_isolation import CaseIsolation
 from .disease_testing import DiseaseTesting
 from .place_closure import PlaceClosure
@@ -7,7 +7,16 @@ class AbstractIntervention:
     """Abstract class for Interventions.
     Detailed description of interventions can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
+
+    Interventions which act independently on each cell, microcell or
+    person set :attr:`kernel_level` to 'cell', 'microcell' or 'person'
+    and implement the matching kernel method, so that the
+    :class:`InterventionSweep` can apply several interventions in a single
+    pass over the population. Interventions with no kernel (for which
+    :attr:`kernel_level` is None) are only run through :meth:`__call__`.
     """
+    kernel_level = None
+
     def __init__(self, start_time, policy_duration, population,
                  case_threshold=0, **kwargs):
         """Set the parameters of the interventions.
@@ -63,6 +72,59 @@ class AbstractIntervention:
         """
         raise NotImplementedError
 
+    def expire(self, time: float):
+        """End the windows (e.g. of isolation or place closure) of the
+        intervention which have ended by the given time. This is called
+        before the kernels are applied in each time step, and does nothing
+        for interventions without such windows.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        """
+        return
+
+    def cell_kernel(self, time: float, cell):
+        """Run intervention on a single cell.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        cell : Cell
+            Cell to apply the intervention to
+
+        """
+        raise NotImplementedError
+
+    def microcell_kernel(self, time: float, microcell):
+        """Run intervention on a single microcell.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        microcell : Microcell
+            Microcell to apply the intervention to
+
+        """
+        raise NotImplementedError
+
+    def person_kernel(self, time: float, person):
+        """Run intervention on a single person.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+        person : Person
+            Person to apply the intervention to
+
+        """
+        raise NotImplementedError
+
     def turn_off(self):
         """Turn off intervention after intervention stops being active.
         """
@@ -4,7 +4,7 @@
 
 import random
 
-from pyEpiabm.intervention import AbstractIntervention
+from pyEpiabm.intervention import AbstractIntervention, InterventionTimer
 
 
 class CaseIsolation(AbstractIntervention):
@@ -16,6 +16,7 @@ class CaseIsolation(AbstractIntervention):
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
 
     """
+    kernel_level = 'person'
 
     def __init__(
         self,
@@ -30,32 +31,38 @@ class CaseIsolation(AbstractIntervention):
         self.isolation_delay = isolation_delay
         self.isolation_probability = isolation_probability
         self.use_testing = use_testing
+        self.timer = InterventionTimer('isolation_start_time',
+                                       isolation_duration)
+        self._expired = set()
 
         super(CaseIsolation, self).__init__(population=population, **kwargs)
 
     def __call__(self, time):
+        self.expire(time)
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
-                    if time > person.isolation_start_time + self.\
-                              isolation_duration:
-                        # Stop isolating people after their isolation period
-                        person.isolation_start_time = None
-                else:
-                    if self.person_selection_method(person):
-                        r = random.random()
-                        # Require symptomatic individuals to self-isolate
-                        # with given probability
-                        if r < self.isolation_probability:
-                            person.isolation_start_time = time + self.\
-                                                          isolation_delay
-                            if person.date_positive is not None:
-                                self._population.test_isolate_count = [0, 0]
-                                if person.is_symptomatic():
-                                    self._population.test_isolate_count[0] += 1
-                                else:
-                                    self._population.test_isolate_count[1] += 1
+                self.person_kernel(time, person)
+
+    def expire(self, time):
+        # Stop isolating people after their isolation period
+        self._expired = self.timer.expire(time)
+
+    def person_kernel(self, time, person):
+        if person.isolation_start_time is not None:
+            self.timer.track(person)
+        elif person not in self._expired:
+            if self.person_selection_method(person):
+                r = random.random()
+                # Require symptomatic individuals to self-isolate
+                # with given probability
+                if r < self.isolation_probability:
+                    self.timer.start(person, time + self.isolation_delay)
+                    if person.date_positive is not None:
+                        self._population.test_isolate_count = [0, 0]
+                        if person.is_symptomatic():
+                            self._population.test_isolate_count[0] += 1
+                        else:
+                            self._population.test_isolate_count[1] += 1
 
     def person_selection_method(self, person):
         """ Method to determine whether a person is eligible for isolation
@@ -80,8 +87,4 @@ class CaseIsolation(AbstractIntervention):
                 return True
 
     def turn_off(self):
-        for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time is not None):
-                    person.isolation_start_time = None
+        self.timer.clear()
@@ -14,6 +14,7 @@ class DiseaseTesting(AbstractIntervention):
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions#testing
 
     """
+    kernel_level = 'cell'
 
     def __init__(self,
                  testing_capacity,
@@ -32,18 +33,14 @@ class DiseaseTesting(AbstractIntervention):
 
     def __call__(self, time):
         for cell in self._population.cells:
-            num_pcr = 0
-            num_lft = 0
-            while (num_pcr < self.testing_capacity[0] and not
-                   cell.PCR_queue.empty()):
-                person = cell.PCR_queue.get()
-                num_pcr += 1
-                self.do_testing(time, person, 0)
-            while (num_lft < self.testing_capacity[1] and not
-                   cell.LFT_queue.empty()):
-                person = cell.LFT_queue.get()
-                num_lft += 1
-                self.do_testing(time, person, 1)
+            self.cell_kernel(time, cell)
+
+    def cell_kernel(self, time, cell):
+        # People beyond the testing capacity wait until the next day
+        for person in cell.PCR_queue.drain(self.testing_capacity[0]):
+            self.do_testing(time, person, 0)
+        for person in cell.LFT_queue.drain(self.testing_capacity[1]):
+            self.do_testing(time, person, 1)
 
     def do_testing(self, time, person, index):
         """ Method to detemine whether an individual tests positive
@@ -4,7 +4,7 @@
 
 import random
 
-from pyEpiabm.intervention import AbstractIntervention
+from pyEpiabm.intervention import AbstractIntervention, InterventionTimer
 
 
 class HouseholdQuarantine(AbstractIntervention):
@@ -16,6 +16,7 @@ class HouseholdQuarantine(AbstractIntervention):
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
+    kernel_level = 'person'
 
     def __init__(
         self,
@@ -30,50 +31,45 @@ class HouseholdQuarantine(AbstractIntervention):
         self.quarantine_delay = quarantine_delay
         self.quarantine_house_compliant = quarantine_house_compliant
         self.quarantine_individual_compliant = quarantine_individual_compliant
+        self.timer = InterventionTimer('quarantine_start_time',
+                                       quarantine_duration)
 
         # start_time, policy_duration, threshold, population
         super(HouseholdQuarantine, self).__init__(population=population,
                                                   **kwargs)
 
     def __call__(self, time):
+        self.expire(time)
         for cell in self._population.cells:
             for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
-                    if time > person.quarantine_start_time + self.\
-                              quarantine_duration:
-                        # Stop quarantine after quarantine period
-                        person.quarantine_start_time = None
-                    if (hasattr(person, 'isolation_start_time')) and (
-                            person.isolation_start_time is not None):
-                        # Isolated individual should not quarantine
-                        person.quarantine_start_time = None
+                self.person_kernel(time, person)
 
-                if (hasattr(person, 'isolation_start_time')) and (
-                        person.isolation_start_time == time):
-                    # Require household of symptomatic/isolating individuals to
-                    # quarantine with given household compliance and individual
-                    # compliance. Only check when infector starts its isolation
-                    # in order to prevent resetting. Start time is reset when
-                    # new person in household becomes an infector.
-                    r_house = random.random()
-                    if r_house < self.quarantine_house_compliant:
-                        for household_person in person.household.persons:
-                            if (not hasattr(household_person,
-                                'isolation_start_time')) or (
-                                    household_person.isolation_start_time
-                                    is None):
-                                # isolated individuals don't quarantine
-                                r_indiv = random.random()
-                                if r_indiv < \
-                                   self.quarantine_individual_compliant:
-                                    household_person.\
-                                        quarantine_start_time = \
-                                        time + self.quarantine_delay
+    def expire(self, time):
+        # Stop quarantine after quarantine period
+        self.timer.expire(time)
+
+    def person_kernel(self, time, person):
+        if person.quarantine_start_time is not None:
+            self.timer.track(person)
+            if person.isolation_start_time is not None:
+                # Isolated individual should not quarantine
+                self.timer.stop(person)
+
+        if person.isolation_start_time == time:
+            # Require household of symptomatic/isolating individuals to
+            # quarantine with given household compliance and individual
+            # compliance. Only check when infector starts its isolation
+            # in order to prevent resetting. Start time is reset when
+            # new person in household becomes an infector.
+            r_house = random.random()
+            if r_house < self.quarantine_house_compliant:
+                for household_person in person.household.persons:
+                    if household_person.isolation_start_time is None:
+                        # isolated individuals don't quarantine
+                        r_indiv = random.random()
+                        if r_indiv < self.quarantine_individual_compliant:
+                            self.timer.start(household_person,
+                                             time + self.quarantine_delay)
 
     def turn_off(self):
-        for cell in self._population.cells:
-            for person in cell.persons:
-                if (hasattr(person, 'quarantine_start_time')) and (
-                        person.quarantine_start_time is not None):
-                    person.quarantine_start_time = None
+        self.timer.clear()
@@ -0,0 +1,151 @@
+#
+# Timer for the windows during which interventions apply
+#
+
+import heapq
+import itertools
+
+
+class InterventionTimer:
+    """Class keeping track of the people or microcells to which an
+    intervention currently applies (e.g. isolating people or closed
+    microcells). Each window starts at the time stored in the given
+    attribute of the person or microcell, and ends once the current time is
+    strictly greater than the start time plus the duration. Windows are
+    held in a min-heap ordered by end time, so that ending windows only
+    requires looking at those which have ended, and clearing all windows
+    only requires looking at those which are active.
+
+    The start time attribute may be changed or cleared outside the timer
+    (for example when a window is restarted), in which case the window is
+    updated to match when it is next reached in the heap.
+
+    """
+    def __init__(self, attribute: str, duration: float):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        attribute : str
+            Name of the attribute holding the start time of the window,
+            which is None when no window is active
+        duration : float
+            Duration of each window
+
+        """
+        self.attribute = attribute
+        self.duration = duration
+        self._heap = []
+        self._windows = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        """Returns the number of active windows.
+
+        Returns
+        -------
+        int
+            Number of people or microcells with an active window
+
+        """
+        return len(self._windows)
+
+    def __contains__(self, item):
+        """Returns whether the given person or microcell is tracked by
+        the timer.
+
+        """
+        return item in self._windows
+
+    def _push(self, item, start_time: float):
+        """Records a window of the given person or microcell starting at
+        the given time.
+
+        """
+        self._windows[item] = start_time
+        heapq.heappush(self._heap, (start_time + self.duration,
+                                    next(self._counter), start_time, item))
+
+    def start(self, item, start_time: float):
+        """Starts a window for the given person or microcell, replacing
+        any window already active.
+
+        Parameters
+        ----------
+        item : Person or Microcell
+            Person or microcell to which the window applies
+        start_time : float
+            Time at which the window starts
+
+        """
+        setattr(item, self.attribute, start_time)
+        self._push(item, start_time)
+
+    def track(self, item):
+        """Starts tracking a window which was started outside the timer,
+        by setting the start time attribute directly. Does nothing if the
+        item is already tracked or has no active window.
+
+        Parameters
+        ----------
+        item : Person or Microcell
+            Person or microcell to track
+
+        """
+        if item not in self._windows:
+            start_time = getattr(item, self.attribute)
+            if start_time is not None:
+                self._push(item, start_time)
+
+    def stop(self, item):
+        """Ends the window of the given person or microcell, if it has
+        one.
+
+        Parameters
+        ----------
+        item : Person or Microcell
+            Person or microcell whose window ends
+
+        """
+        setattr(item, self.attribute, None)
+        self._windows.pop(item, None)
+
+    def expire(self, time: float) -> set:
+        """Ends all windows which have ended by the given time.
+
+        Parameters
+        ----------
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        set
+            Set of people or microcells whose windows ended
+
+        """
+        expired = set()
+        while self._heap and self._heap[0][0] < time:
+            _, _, start_time, item = heapq.heappop(self._heap)
+            if self._windows.get(item) != start_time:
+                # Window was restarted or stopped since this entry was added
+                continue
+            current_start = getattr(item, self.attribute)
+            if current_start is None:
+                del self._windows[item]
+            elif current_start != start_time:
+                self._push(item, current_start)
+            else:
+                setattr(item, self.attribute, None)
+                del self._windows[item]
+                expired.add(item)
+        return expired
+
+    def clear(self):
+        """Ends all active windows.
+
+        """
+        for item in self._windows:
+            setattr(item, self.attribute, None)
+        self._windows.clear()
+        self._heap.clear()
@@ -2,7 +2,7 @@
 # Place closure Class
 #
 
-from pyEpiabm.intervention import AbstractIntervention
+from pyEpiabm.intervention import AbstractIntervention, InterventionTimer
 
 
 class PlaceClosure(AbstractIntervention):
@@ -13,6 +13,7 @@ class PlaceClosure(AbstractIntervention):
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
+    kernel_level = 'microcell'
 
     def __init__(
         self,
@@ -25,27 +26,28 @@ class PlaceClosure(AbstractIntervention):
         self.closure_duration = closure_duration
         self.closure_delay = closure_delay
         self.case_microcell_threshold = case_microcell_threshold
+        self.timer = InterventionTimer('closure_start_time', closure_duration)
+        self._expired = set()
         super(PlaceClosure, self).__init__(population=population,
                                            **kwargs)
 
     def __call__(self, time):
+        self.expire(time)
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
-                    if time > microcell.closure_start_time + self.\
-                              closure_duration:
-                        # Reopen places after their closure period
-                        microcell.closure_start_time = None
-                else:
-                    if (microcell.count_infectious() >= self.
-                            case_microcell_threshold):
-                        microcell.closure_start_time = time + self.\
-                                                        closure_delay
+                self.microcell_kernel(time, microcell)
+
+    def expire(self, time):
+        # Reopen places after their closure period
+        self._expired = self.timer.expire(time)
+
+    def microcell_kernel(self, time, microcell):
+        if microcell.closure_start_time is not None:
+            self.timer.track(microcell)
+        elif microcell not in self._expired:
+            if (microcell.count_infectious() >= self.
+                    case_microcell_threshold):
+                self.timer.start(microcell, time + self.closure_delay)
 
     def turn_off(self):
-        for cell in self._population.cells:
-            for microcell in cell.microcells:
-                if (hasattr(microcell, 'closure_start_time')) and (
-                        microcell.closure_start_time is not None):
-                    microcell.closure_start_time = None
+        self.timer.clear()
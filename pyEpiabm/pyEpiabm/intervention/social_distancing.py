@@ -7,6 +7,7 @@ import random
 from pyEpiabm.core import Parameters
 
 from .abstract_intervention import AbstractIntervention
+from .intervention_timer import InterventionTimer
 
 
 class SocialDistancing(AbstractIntervention):
@@ -19,6 +20,7 @@ class SocialDistancing(AbstractIntervention):
     Detailed description of the implementation can be found in github wiki:
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Interventions.
     """
+    kernel_level = 'microcell'
 
     def __init__(
         self,
@@ -33,37 +35,38 @@ class SocialDistancing(AbstractIntervention):
         self.distancing_delay = distancing_delay
         self.case_microcell_threshold = case_microcell_threshold
         self.distancing_enhanced_prob = distancing_enhanced_prob
+        self.timer = InterventionTimer('distancing_start_time',
+                                       distancing_duration)
+        self._expired = set()
         super(SocialDistancing, self).__init__(population=population,
                                                **kwargs)
 
     def __call__(self, time):
+        self.expire(time)
         for cell in self._population.cells:
             for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
-                    if time > microcell.distancing_start_time + self.\
-                              distancing_duration:
-                        # Stop social distancing after their distancing period
-                        microcell.distancing_start_time = None
-                else:
-                    if microcell.count_infectious() >= self.\
-                                case_microcell_threshold:
-                        microcell.distancing_start_time = time + self.\
-                                                        distancing_delay
-                        for person in microcell.persons:
-                            if Parameters.instance().use_ages:
-                                r_age = random.random()
-                                if r_age < self.distancing_enhanced_prob[
-                                            person.age_group]:
-                                    person.distancing_enhanced = True
-                                else:
-                                    person.distancing_enhanced = False
-                            else:
-                                person.distancing_enhanced = False
+                self.microcell_kernel(time, microcell)
+
+    def expire(self, time):
+        # Stop social distancing after their distancing period
+        self._expired = self.timer.expire(time)
+
+    def microcell_kernel(self, time, microcell):
+        if microcell.distancing_start_time is not None:
+            self.timer.track(microcell)
+        elif microcell not in self._expired:
+            if microcell.count_infectious() >= self.case_microcell_threshold:
+                self.timer.start(microcell, time + self.distancing_delay)
+                for person in microcell.persons:
+                    if Parameters.instance().use_ages:
+                        r_age = random.random()
+                        if r_age < self.distancing_enhanced_prob[
+                                    person.age_group]:
+                            person.distancing_enhanced = True
+                        else:
+                            person.distancing_enhanced = False
+                    else:
+                        person.distancing_enhanced = False
 
     def turn_off(self):
-        for cell in self._population.cells:
-            for microcell in cell.microcells:
-                if (hasattr(microcell, 'distancing_start_time')) and (
-                        microcell.distancing_start_time is not None):
-                    microcell.distancing_start_time = None
+        self.timer.clear()
@@ -8,7 +8,11 @@ simulation.
 """
 
 from .abstract_reporter import AbstractReporter
+from .reporting_thread import ReportingThread
 from ._csv_dict_writer import _CsvDictWriter
 from ._csv_writer import _CsvWriter
+from ._binary_writer import _BinaryWriter
 from .new_cases_writer import NewCasesWriter
 from .age_stratified_new_cases_writer import AgeStratifiedNewCasesWriter
+from .results_recorder import ResultsRecorder
+from .binary_reader import BinaryReader
@@ -0,0 +1,164 @@
+#
+# Write time series of counts to a binary file
+#
+
+import os
+import json
+import struct
+import typing
+import numpy as np
+
+from pyEpiabm.output.abstract_reporter import AbstractReporter
+
+
+class _BinaryWriter(AbstractReporter):
+    """Class to write a time series of counts, by cell, column and age
+    group, to a binary file. The file begins with a fixed preamble (the
+    magic string, the format version and the length of the header) and a
+    JSON header describing the columns, age groups, cells and locations.
+    It is followed by one record per time point, holding the time as a
+    float and the counts as integers indexed by [cell, column, age group],
+    so that the records can be memory-mapped by :class:`BinaryReader`.
+
+    """
+    MAGIC = b'\x93EPIABM'
+    VERSION = 1
+    # Records start at a multiple of this number of bytes
+    ALIGNMENT = 64
+
+    def __init__(self, folder: str, filename: str,
+                 columns: typing.List[str], nb_age_groups: int = 1,
+                 cells: typing.Optional[typing.List] = None,
+                 clear_folder: bool = False):
+        """Initialises a file to store output in, and writes the header.
+
+        Parameters
+        ----------
+        folder : str
+            Output folder path
+        filename : str
+            Output file name
+        columns : typing.List[str]
+            Names of the quantities counted, such as the infection statuses
+        nb_age_groups : int
+            Number of age groups of the counts
+        cells : typing.List[Cell]
+            Cells whose counts are recorded. If None, the counts are for
+            the whole population, recorded as a single cell
+        clear_folder : bool
+            Whether to empty the folder before saving results
+
+        """
+        self.f = None
+        super().__init__(folder, clear_folder)
+        header = {"version": self.VERSION,
+                  "dtype": np.dtype(np.int64).str,
+                  "columns": [str(column) for column in columns],
+                  "age_groups": int(nb_age_groups),
+                  "cells": None, "locations": None}
+        if cells is not None:
+            header["cells"] = np.asarray([cell.id for cell in cells]).tolist()
+            header["locations"] = np.asarray(
+                [cell.location for cell in cells], dtype=float).tolist()
+        nb_cells = len(cells) if cells is not None else 1
+        self.dtype = _BinaryWriter.record_dtype(
+            header["dtype"], (nb_cells, len(columns), nb_age_groups))
+
+        self.f = open(os.path.join(folder, filename), 'wb')
+        self.f.write(_BinaryWriter.encode_header(header))
+
+    def __del__(self):
+        """Closes the file when the simulation is finished.
+        Required for file data to be further used.
+
+        """
+        self.close()
+
+    @staticmethod
+    def record_dtype(dtype: str, shape: typing.Tuple[int, int, int]):
+        """Returns the numpy data type of the record of one time point.
+
+        Parameters
+        ----------
+        dtype : str
+            Data type of the counts
+        shape : tuple
+            Number of cells, columns and age groups of the counts
+
+        Returns
+        -------
+        np.dtype
+            Structured data type with fields 'time' and 'counts'
+
+        """
+        return np.dtype([("time", "<f8"), ("counts", dtype, tuple(shape))])
+
+    @staticmethod
+    def encode_header(header: typing.Dict) -> bytes:
+        """Returns the preamble and the JSON header, padded with spaces so
+        that the records which follow are aligned.
+
+        Parameters
+        ----------
+        header : dict
+            Description of the counts
+
+        Returns
+        -------
+        bytes
+            Encoded header
+
+        """
+        text = json.dumps(header).encode('utf-8')
+        fixed = len(_BinaryWriter.MAGIC) + 1 + 4
+        padding = -(fixed + len(text) + 1) % _BinaryWriter.ALIGNMENT
+        text += b' ' * padding + b'\n'
+        return (_BinaryWriter.MAGIC + bytes([_BinaryWriter.VERSION])
+                + struct.pack('<I', len(text)) + text)
+
+    def write(self, time: float, counts: np.ndarray):
+        """Writes the counts of one time point to file.
+
+        Parameters
+        ----------
+        time : float
+            Time of the counts
+        counts : np.ndarray
+            Counts indexed by [cell, column, age group]
+
+        """
+        self.write_chunk([time], [counts])
+
+    def write_chunk(self, times: typing.Sequence[float],
+                    counts: np.ndarray):
+        """Writes the counts of several time points to file.
+
+        Parameters
+        ----------
+        times : typing.Sequence[float]
+            Times of the counts
+        counts : np.ndarray
+            Counts indexed by [time, cell, column, age group]
+
+        """
+        # The records are copied here, so the counts may be changed once
+        # this returns even if the file is written on a thread
+        records = np.empty(len(times), dtype=self.dtype)
+        records["time"] = times
+        records["counts"] = counts
+        self._submit(self.f.write, records.tobytes())
+
+    def flush(self):
+        """Flushes the written records to disk.
+
+        """
+        self._submit(self.f.flush)
+
+    def close(self):
+        """Waits for pending writes and closes the file.
+
+        """
+        super().close()
+        if self.f:
+            self.f.close()
+            self.f = None
@@ -5,6 +5,7 @@
 import csv
 import typing
 import os
+import pandas as pd
 
 from pyEpiabm.output.abstract_reporter import AbstractReporter
 
@@ -27,6 +28,7 @@ class _CsvDictWriter(AbstractReporter):
             Whether to empty the folder before saving results
 
         """
+        self.f = None
         super().__init__(folder, clear_folder)
 
         self.f = open(os.path.join(folder, filename), 'w')
@@ -39,8 +41,7 @@ class _CsvDictWriter(AbstractReporter):
         Required for file data to be further used.
 
         """
-        if self.f:
-            self.f.close()
+        self.close()
 
     def write(self, row: typing.Dict):
         """Writes data to file.
@@ -51,4 +52,42 @@ class _CsvDictWriter(AbstractReporter):
             Dictionary of data to be saved
 
         """
-        self.writer.writerow(row)
+        self._submit(self.writer.writerow, row)
+
+    def write_frame(self, frame: pd.DataFrame):
+        """Writes the rows of a dataframe to file, as a single chunk, and
+        flushes the file so that the rows are saved even if the simulation
+        later fails.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Dataframe with a column for each category to be saved
+
+        """
+        self._submit(self._write_frame, frame)
+
+    def _write_frame(self, frame: pd.DataFrame):
+        """Formats a dataframe with the same line endings as the header,
+        and writes it to file.
+
+        Parameters
+        ----------
+        frame : pd.DataFrame
+            Dataframe with a column for each category to be saved
+
+        """
+        self.f.write(frame.to_csv(header=False, index=False,
+                                  columns=self.writer.fieldnames,
+                                  lineterminator='\r\n'))
+        self.f.flush()
+
+    def close(self):
+        """Waits for pending writes and closes the file. Closing a writer
+        which has already been closed has no effect.
+
+        """
+        super().close()
+        if self.f:
+            self.f.close()
+            self.f = None
@@ -27,6 +27,7 @@ class _CsvWriter(AbstractReporter):
             Whether to empty the folder before saving results
 
         """
+        self.f = None
         super().__init__(folder, clear_folder)
 
         self.f = open(os.path.join(folder, filename), 'w')
@@ -39,8 +40,7 @@ class _CsvWriter(AbstractReporter):
         Required for file data to be further used.
 
         """
-        if self.f:
-            self.f.close()
+        self.close()
 
     def write(self, row: typing.List):
         """Writes data to file.
@@ -51,4 +51,26 @@ class _CsvWriter(AbstractReporter):
             List of data to be saved
 
         """
-        self.writer.writerow(row)
+        self._submit(self.writer.writerow, row)
+
+    def write_rows(self, rows: typing.List[typing.List]):
+        """Writes several rows of data to file.
+
+        Parameters
+        ----------
+        rows : typing.List[typing.List]
+            List of rows of data to be saved
+
+        """
+        if rows:
+            self._submit(self.writer.writerows, rows)
+
+    def close(self):
+        """Waits for pending writes and closes the file. Closing a writer
+        which has already been closed has no effect.
+
+        """
+        super().close()
+        if self.f:
+            self.f.close()
+            self.f = None
@@ -3,12 +3,15 @@
 #
 
 import os
+import typing
 import logging
 
 
 class AbstractReporter:
-    """Abstract class for Data Reporters.
+    """Abstract class for Data Reporters. Writes to file may be run on a
+    :class:`ReportingThread`, set with :meth:`set_thread`.
     """
+    thread = None
 
     def __init__(self, folder: str, clear_folder: bool = False):
         """Constructor method for reporter. Makes a new folder
@@ -43,3 +46,39 @@ class AbstractReporter:
 
         """
         raise NotImplementedError
+
+    def set_thread(self, thread):
+        """Sets the thread on which the reporter writes to file. If None,
+        the reporter writes to file directly.
+
+        Parameters
+        ----------
+        thread : ReportingThread
+            Thread to write on
+
+        """
+        self.thread = thread
+
+    def _submit(self, function: typing.Callable, *args):
+        """Calls a function on the reporter's thread if it has one, and
+        directly otherwise.
+
+        Parameters
+        ----------
+        function : typing.Callable
+            Function to call
+        *args
+            Arguments of the function
+
+        """
+        if self.thread is not None:
+            self.thread.submit(function, *args)
+        else:
+            function(*args)
+
+    def close(self):
+        """Waits for the reporter's writes to finish and closes its files.
+
+        """
+        if self.thread is not None:
+            self.thread.flush()
@@ -1,5 +1,9 @@
+import numpy as np
+
+from pyEpiabm.output._binary_writer import _BinaryWriter
 from pyEpiabm.output._csv_writer import _CsvWriter
-from pyEpiabm.core import Population
+from pyEpiabm.output.abstract_reporter import AbstractReporter
+from pyEpiabm.core import Parameters, Population
 
 
 class AgeStratifiedNewCasesWriter(_CsvWriter):
@@ -8,17 +12,51 @@ class AgeStratifiedNewCasesWriter(_CsvWriter):
 
     """
 
-    def __init__(self, folder: str):
+    def __init__(self, folder: str, binary: bool = False):
         """ Constructor method.
 
         Parameters
         ----------
         folder : str
             Absolute path to folder to store results
+        binary : bool
+            Whether to write to the binary file
+            'age_stratified_new_cases.bin', which can be read with
+            :class:`BinaryReader`, rather than to
+            'age_stratified_new_cases.csv'
+        """
+        self.binary = binary
+        self.binary_writer = None
+        if binary:
+            # The binary file is created on the first write, once the cells
+            # are known
+            AbstractReporter.__init__(self, folder)
+            self.f = None
+        else:
+            super().__init__(
+                folder, 'age_stratified_new_cases.csv',
+                ['t', 'cell', 'age_group', 'new_cases'], False)
+
+    def set_thread(self, thread):
+        """Sets the thread on which the writer writes to file.
+
+        Parameters
+        ----------
+        thread : ReportingThread
+            Thread to write on
+
+        """
+        super().set_thread(thread)
+        if self.binary_writer is not None:
+            self.binary_writer.set_thread(thread)
+
+    def close(self):
+        """Waits for pending writes and closes the file.
+
         """
-        super().__init__(
-            folder, 'age_stratified_new_cases.csv',
-            ['t', 'cell', 'age_group', 'new_cases'], False)
+        if self.binary_writer is not None:
+            self.binary_writer.close()
+        super().close()
 
     def write(self, t: float, population: Population):
         """ Write method - write daily new cases split
@@ -31,14 +69,21 @@ class AgeStratifiedNewCasesWriter(_CsvWriter):
         population : Population
             Population to record
         """
-        for cell in population.cells:
-            new_cases = {}
-            for person in cell.persons:
-                if (person.infection_start_time is not None
-                   and person.infection_start_time > (t-1)):
-                    if person.age_group in new_cases:
-                        new_cases[person.age_group] += 1
-                    else:
-                        new_cases[person.age_group] = 1
-            for age_group, cases in new_cases.items():
-                super().write([t, cell.id, age_group, cases])
+        nb_age_groups = len(Parameters.instance().age_proportions)
+        if self.binary and self.binary_writer is None:
+            self.binary_writer = _BinaryWriter(
+                self.folder, 'age_stratified_new_cases.bin', ['new_cases'],
+                nb_age_groups, population.cells)
+            self.binary_writer.set_thread(self.thread)
+        # Infections are counted by each cell as they start
+        cell_cases = [cell.new_cases_counter.retrieve(t, nb_age_groups)
+                      for cell in population.cells]
+        if self.binary:
+            self.binary_writer.write(
+                t, [counts.reshape(1, -1) for counts in cell_cases])
+        else:
+            # Only age groups with new cases are written
+            self.write_rows([[t, cell.id, age_group, counts[age_group]]
+                             for cell, counts in zip(population.cells,
+                                                     cell_cases)
+                             for age_group in np.flatnonzero(counts)])
@@ -0,0 +1,145 @@
+#
+# Read time series of counts from a binary file
+#
+
+import os
+import json
+import struct
+import typing
+import numpy as np
+import pandas as pd
+
+from ._binary_writer import _BinaryWriter
+from .results_recorder import ResultsRecorder
+
+
+class BinaryReader:
+    """Class to read a time series of counts written to a binary file by
+    :class:`ResultsRecorder`, :class:`NewCasesWriter` or
+    :class:`AgeStratifiedNewCasesWriter`. The records are memory-mapped,
+    so the arrays returned are views of the file which are only read from
+    disk when they are used.
+
+    """
+    def __init__(self, filepath: str):
+        """Constructor Method. Reads the header of the file and maps the
+        records which follow it.
+
+        Parameters
+        ----------
+        filepath : str
+            Path to the binary file
+
+        """
+        self.filepath = filepath
+        with open(filepath, 'rb') as f:
+            magic = f.read(len(_BinaryWriter.MAGIC))
+            if magic != _BinaryWriter.MAGIC:
+                raise ValueError(f"{filepath} is not a binary output file")
+            version = f.read(1)[0]
+            if version != _BinaryWriter.VERSION:
+                raise ValueError("Unsupported binary output version "
+                                 + f"{version}")
+            header_length = struct.unpack('<I', f.read(4))[0]
+            self.header = json.loads(f.read(header_length).decode('utf-8'))
+            offset = f.tell()
+
+        self.columns = self.header["columns"]
+        self.nb_age_groups = self.header["age_groups"]
+        self.cells = self.header["cells"]
+        self.locations = np.array(self.header["locations"], dtype=float) \
+            if self.cells is not None else None
+        nb_cells = len(self.cells) if self.cells is not None else 1
+        dtype = _BinaryWriter.record_dtype(
+            self.header["dtype"],
+            (nb_cells, len(self.columns), self.nb_age_groups))
+
+        # Incomplete records at the end of the file are ignored
+        nb_records = (os.path.getsize(filepath) - offset) // dtype.itemsize
+        if nb_records > 0:
+            self._records = np.memmap(filepath, dtype=dtype, mode='r',
+                                      offset=offset, shape=(nb_records,))
+        else:
+            self._records = np.zeros(0, dtype=dtype)
+
+    def __len__(self):
+        return len(self._records)
+
+    @property
+    def spatial(self) -> bool:
+        """Get whether the counts are recorded for each cell, rather than
+        for the whole population.
+
+        """
+        return self.cells is not None
+
+    @property
+    def times(self) -> np.ndarray:
+        """Get the array of time points.
+
+        """
+        return self._records["time"]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Get the array of counts, indexed by
+        [time, cell, column, age group].
+
+        """
+        return self._records["counts"]
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the counts of one quantity, indexed by
+        [time, cell, age group].
+
+        Parameters
+        ----------
+        name : str
+            Name of the column, such as 'InfectionStatus.Susceptible'
+
+        Returns
+        -------
+        np.ndarray
+            Counts of the quantity
+
+        """
+        return self.counts[:, :, self.columns.index(name), :]
+
+    def cell(self, cell_id: typing.Any) -> np.ndarray:
+        """Returns the counts of one cell, indexed by
+        [time, column, age group].
+
+        Parameters
+        ----------
+        cell_id
+            Identifier of the cell
+
+        Returns
+        -------
+        np.ndarray
+            Counts of the cell
+
+        """
+        if not self.spatial:
+            raise ValueError("Counts are not recorded for each cell")
+        return self.counts[:, self.cells.index(cell_id)]
+
+    def to_dataframe(self, age_stratified: bool = True) -> pd.DataFrame:
+        """Returns the counts as a dataframe, with the same columns as
+        the .csv output. This reads the whole file into memory.
+
+        Parameters
+        ----------
+        age_stratified : bool
+            Whether to give separate rows for each age group, rather than
+            summing the counts across age groups
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe of the counts
+
+        """
+        return ResultsRecorder.counts_to_dataframe(
+            np.asarray(self.times), np.asarray(self.counts), self.columns,
+            self.cells, self.locations, age_stratified)
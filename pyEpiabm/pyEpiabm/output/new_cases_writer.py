@@ -1,4 +1,8 @@
+import numpy as np
+
+from pyEpiabm.output._binary_writer import _BinaryWriter
 from pyEpiabm.output._csv_writer import _CsvWriter
+from pyEpiabm.output.abstract_reporter import AbstractReporter
 from pyEpiabm.core import Population
 
 
@@ -6,17 +10,49 @@ class NewCasesWriter(_CsvWriter):
     """ Writer for collecting number of daily new cases
     """
 
-    def __init__(self, folder: str):
+    def __init__(self, folder: str, binary: bool = False):
         """ Constructor method
 
         Parameters
         ----------
         folder : str
             Absolute path to folder to store results
+        binary : bool
+            Whether to write to the binary file 'new_cases.bin', which can be
+            read with :class:`BinaryReader`, rather than to 'new_cases.csv'
+        """
+        self.binary = binary
+        self.binary_writer = None
+        if binary:
+            # The binary file is created on the first write, once the cells
+            # are known
+            AbstractReporter.__init__(self, folder)
+            self.f = None
+        else:
+            super().__init__(
+                folder, 'new_cases.csv',
+                ['t', 'cell', 'new_cases'], False)
+
+    def set_thread(self, thread):
+        """Sets the thread on which the writer writes to file.
+
+        Parameters
+        ----------
+        thread : ReportingThread
+            Thread to write on
+
+        """
+        super().set_thread(thread)
+        if self.binary_writer is not None:
+            self.binary_writer.set_thread(thread)
+
+    def close(self):
+        """Waits for pending writes and closes the file.
+
         """
-        super().__init__(
-            folder, 'new_cases.csv',
-            ['t', 'cell', 'new_cases'], False)
+        if self.binary_writer is not None:
+            self.binary_writer.close()
+        super().close()
 
     def write(self, t: float, population: Population):
         """ Write method
@@ -29,10 +65,17 @@ class NewCasesWriter(_CsvWriter):
         population : Population
             Population to record
         """
-        for cell in population.cells:
-            new_cases = 0
-            for person in cell.persons:
-                if person.infection_start_time is not None and \
-                   person.infection_start_time > (t-1):
-                    new_cases += 1
-            super().write([t, cell.id, new_cases])
+        # Infections are counted by each cell as they start
+        cell_cases = [int(cell.new_cases_counter.retrieve(t).sum())
+                      for cell in population.cells]
+        if self.binary:
+            if self.binary_writer is None:
+                self.binary_writer = _BinaryWriter(
+                    self.folder, 'new_cases.bin', ['new_cases'], 1,
+                    population.cells)
+                self.binary_writer.set_thread(self.thread)
+            self.binary_writer.write(
+                t, np.array(cell_cases).reshape(-1, 1, 1))
+        else:
+            self.write_rows([[t, cell.id, new_cases] for cell, new_cases
+                             in zip(population.cells, cell_cases)])
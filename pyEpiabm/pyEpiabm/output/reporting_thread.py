@@ -0,0 +1,133 @@
+#
+# Write output on a background thread
+#
+
+import queue
+import threading
+import typing
+
+
+class ReportingThread:
+    """Class to run the formatting and writing of output on a background
+    thread, so that the simulation does not wait for disk access. Tasks
+    are held in a bounded queue, so that the simulation waits for the
+    thread if it falls too far behind, and are run in the order they are
+    submitted. Exceptions raised by a task are raised again by the next
+    call to :meth:`submit`, :meth:`flush` or :meth:`close`. Once a task
+    has failed, no further tasks are run.
+
+    Data passed to a task must not be changed by the simulation after it
+    is submitted, so reporters should submit copies of any counts which
+    are updated in place.
+
+    """
+    # Marks the end of the queue
+    _STOP = object()
+
+    def __init__(self, max_queue_size: int = 64):
+        """Constructor Method. Starts the thread.
+
+        Parameters
+        ----------
+        max_queue_size : int
+            Number of tasks which may wait in the queue before
+            :meth:`submit` blocks
+
+        """
+        if max_queue_size < 1:
+            raise ValueError("Queue size must be at least 1")
+        self._queue = queue.Queue(max_queue_size)
+        # The error of a failed task not yet raised in the calling thread,
+        # and whether any task has failed, both guarded by the lock
+        self._lock = threading.Lock()
+        self._error = None
+        self._failed = False
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name="ReportingThread")
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def running(self) -> bool:
+        """Get whether the thread is still accepting tasks.
+
+        """
+        return self._thread.is_alive()
+
+    def _run(self):
+        """Runs the tasks in the queue until the end of the queue is
+        reached. Once a task has failed, the remaining tasks are discarded.
+
+        """
+        while True:
+            task = self._queue.get()
+            try:
+                if task is ReportingThread._STOP:
+                    return
+                if not self._failed:
+                    function, args = task
+                    function(*args)
+            except BaseException as e:
+                with self._lock:
+                    self._failed = True
+                    self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self):
+        """Raises the exception of a failed task in the calling thread.
+
+        """
+        with self._lock:
+            error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def submit(self, function: typing.Callable, *args):
+        """Adds a task to the queue, waiting for space in the queue if it
+        is full. Tasks submitted by a task are run immediately, as the
+        thread cannot wait for space in its own queue.
+
+        Parameters
+        ----------
+        function : typing.Callable
+            Function to call on the thread
+        *args
+            Arguments of the function
+
+        """
+        if threading.current_thread() is self._thread:
+            function(*args)
+            return
+        self._raise_error()
+        if self._failed:
+            raise RuntimeError("Reporting thread has failed")
+        if not self.running:
+            raise RuntimeError("Reporting thread is closed")
+        self._queue.put((function, args))
+
+    def flush(self):
+        """Waits for all submitted tasks to be run. Has no effect when
+        called by a task, as the task would wait for itself.
+
+        """
+        if threading.current_thread() is self._thread:
+            return
+        if self.running:
+            self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        """Runs the remaining tasks and stops the thread. Closing a thread
+        which has already been closed has no effect.
+
+        """
+        if self.running:
+            self._queue.put(ReportingThread._STOP)
+            self._thread.join()
+        self._raise_error()
@@ -0,0 +1,281 @@
+#
+# Record compartment counts of a simulation in an array
+#
+
+import os
+import typing
+import numpy as np
+import pandas as pd
+
+from pyEpiabm.property import InfectionStatus
+
+from ._binary_writer import _BinaryWriter
+from .abstract_reporter import AbstractReporter
+
+
+class ResultsRecorder(AbstractReporter):
+    """Class to record the number of people in each infection status
+    compartment, by cell and age group, at each time point of a simulation.
+    Counts are held in a preallocated array indexed by
+    [time, cell, status value - 1, age group]. They may instead be streamed
+    to a binary file, readable with :class:`BinaryReader`, in chunks of time
+    points as the simulation runs. In that case only the chunk being
+    recorded is held in memory, and recorded counts are read back from the
+    file.
+
+    """
+    def __init__(self, nb_times: int, nb_age_groups: int,
+                 cells: typing.Optional[typing.List] = None,
+                 folder: typing.Optional[str] = None,
+                 filename: typing.Optional[str] = None,
+                 chunk_size: int = 64, clear_folder: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        nb_times : int
+            Number of time points to record
+        nb_age_groups : int
+            Number of age groups of the counts
+        cells : typing.List[Cell]
+            Cells whose counts are recorded. If None, a single set of counts
+            is recorded for the whole population
+        folder : str
+            Absolute path to the folder to stream the counts to. If None, the
+            counts are only kept in memory
+        filename : str
+            Name of the binary file to stream the counts to
+        chunk_size : int
+            Number of time points recorded between writes to file, and held
+            in memory if the counts are streamed
+        clear_folder : bool
+            Whether to empty the folder before saving results
+
+        """
+        self.writer = None
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+        self.chunk_size = chunk_size
+        self.spatial = cells is not None
+        nb_cells = len(cells) if self.spatial else 1
+        self.cell_ids = [cell.id for cell in cells] if self.spatial else []
+        self.locations = np.array([cell.location for cell in cells],
+                                  dtype=float).reshape(-1, 2) \
+            if self.spatial else np.zeros((0, 2))
+
+        self._capacity = nb_times
+        # Counts which are streamed are only kept until they are written
+        nb_buffered = nb_times if folder is None else min(nb_times,
+                                                          chunk_size)
+        self._data = np.zeros((nb_buffered, nb_cells, len(InfectionStatus),
+                               nb_age_groups), dtype=np.int64)
+        self._times = np.zeros(nb_buffered)
+        self._length = 0
+        self._flushed = 0
+
+        self.folder = folder
+        self.filepath = None
+        if folder is not None:
+            self.writer = _BinaryWriter(folder, filename,
+                                        list(InfectionStatus), nb_age_groups,
+                                        cells, clear_folder)
+            self.filepath = os.path.join(folder, filename)
+
+    def __del__(self):
+        """Closes the file when the recorder is deleted.
+
+        """
+        self.close()
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def capacity(self) -> int:
+        """Get the number of time points the recorder can hold.
+
+        """
+        return self._capacity
+
+    @property
+    def streaming(self) -> bool:
+        """Get whether the counts are streamed to a binary file.
+
+        """
+        return self.filepath is not None
+
+    @property
+    def times(self) -> np.ndarray:
+        """Get the array of recorded time points.
+
+        """
+        if self.streaming:
+            return self._read().times
+        return self._times[:self._length]
+
+    @property
+    def counts(self) -> np.ndarray:
+        """Get the array of recorded counts, indexed by
+        [time, cell, status value - 1, age group]. The array is a view of
+        the recorder's datastore, or a memory map of the binary file if the
+        counts are streamed, so is not copied.
+
+        """
+        if self.streaming:
+            return self._read().counts
+        return self._data[:self._length]
+
+    def _read(self):
+        """Writes the counts recorded so far, and returns a reader of the
+        binary file they are streamed to.
+
+        Returns
+        -------
+        BinaryReader
+            Reader of the binary file
+
+        """
+        # Imported here as the reader uses this class to build dataframes
+        from .binary_reader import BinaryReader
+        self.flush()
+        if self.thread is not None:
+            self.thread.flush()
+        return BinaryReader(self.filepath)
+
+    def write(self, time: float, counts: typing.Sequence[np.ndarray]):
+        """Records the counts of the next time point, and writes the
+        recorded counts to file once a chunk is complete.
+
+        Parameters
+        ----------
+        time : float
+            Time of the counts
+        counts : typing.Sequence[np.ndarray]
+            Counts of each cell (or of the population), each indexed by
+            [status value - 1, age group]
+
+        """
+        if self._length == self.capacity:
+            raise ValueError("Results recorder is full")
+        # Streamed counts are held from the start of the buffer until they
+        # are written
+        index = self._length - self._flushed if self.streaming \
+            else self._length
+        self._data[index] = counts
+        self._times[index] = time
+        self._length += 1
+        if self._length - self._flushed >= self.chunk_size:
+            self.flush()
+
+    def set_thread(self, thread):
+        """Sets the thread on which the recorder writes to file.
+
+        Parameters
+        ----------
+        thread : ReportingThread
+            Thread to write on
+
+        """
+        super().set_thread(thread)
+        if self.writer is not None:
+            self.writer.set_thread(thread)
+
+    def flush(self):
+        """Writes the counts recorded since the last write to file.
+
+        """
+        if self.writer is not None and self._length > self._flushed:
+            # The writer copies the counts, so the buffer may be reused
+            nb_pending = self._length - self._flushed
+            self.writer.write_chunk(self._times[:nb_pending],
+                                    self._data[:nb_pending])
+            self.writer.flush()
+        self._flushed = self._length
+
+    def close(self):
+        """Writes the remaining counts and closes the file.
+
+        """
+        if self.writer is None:
+            return
+        self.flush()
+        self.writer.close()
+        self.writer = None
+
+    def to_dataframe(self, age_stratified: bool = True) -> pd.DataFrame:
+        """Returns the recorded counts as a dataframe, with a row for each
+        time point, cell (if recorded by cell) and age group (if age
+        stratified), and a column for each infection status.
+
+        Parameters
+        ----------
+        age_stratified : bool
+            Whether to give separate rows for each age group, rather than
+            summing the counts across age groups
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe of the recorded counts
+
+        """
+        return ResultsRecorder.counts_to_dataframe(
+            self.times, self.counts, list(InfectionStatus),
+            self.cell_ids if self.spatial else None, self.locations,
+            age_stratified)
+
+    @staticmethod
+    def counts_to_dataframe(times: np.ndarray, counts: np.ndarray,
+                            columns: typing.List,
+                            cell_ids: typing.Optional[typing.List] = None,
+                            locations: typing.Optional[np.ndarray] = None,
+                            age_stratified: bool = True) -> pd.DataFrame:
+        """Returns counts as a dataframe, with a row for each time point,
+        cell (if given) and age group (if age stratified), and a column for
+        each counted quantity.
+
+        Parameters
+        ----------
+        times : np.ndarray
+            Time of each time point
+        counts : np.ndarray
+            Counts indexed by [time, cell, column, age group]
+        columns : typing.List
+            Names of the counted quantities
+        cell_ids : typing.List
+            Identifier of each cell. If None, the counts are for the whole
+            population and no cell columns are given
+        locations : np.ndarray
+            Location of each cell
+        age_stratified : bool
+            Whether to give separate rows for each age group, rather than
+            summing the counts across age groups
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe of the counts
+
+        """
+        if not age_stratified:
+            counts = counts.sum(axis=3, keepdims=True)
+        nb_times, nb_cells, nb_columns, nb_ages = counts.shape
+        # Rows are ordered by time, then cell, then age group
+        frame = pd.DataFrame(
+            counts.transpose(0, 1, 3, 2).reshape(-1, nb_columns),
+            columns=list(columns))
+        values = {"time": np.repeat(times, nb_cells * nb_ages)}
+        if age_stratified:
+            # Age groups are numbered from 1
+            values["age_group"] = np.tile(np.arange(1, nb_ages + 1),
+                                          nb_times * nb_cells)
+        if cell_ids is not None:
+            locations = np.asarray(locations, dtype=float).reshape(-1, 2)
+            values["cell"] = np.tile(np.repeat(cell_ids, nb_ages), nb_times)
+            values["location_x"] = np.tile(
+                np.repeat(locations[:, 0], nb_ages), nb_times)
+            values["location_y"] = np.tile(
+                np.repeat(locations[:, 1], nb_ages), nb_times)
+        for i, (name, column) in enumerate(values.items()):
+            frame.insert(i, name, column)
+        return frame
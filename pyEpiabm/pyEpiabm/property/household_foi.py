@@ -1,8 +1,7 @@
 #
 # Calculate household force of infection based on Covidsim code
 #
-import pyEpiabm.core
-from pyEpiabm.core import Parameters
+import numpy as np
 
 from .personal_foi import PersonalInfection
 
@@ -11,9 +10,13 @@ class HouseholdInfection:
     """Class to calculate the infectiousness and susceptibility
     parameters for the force of infection parameter, within households.
 
+    Each method takes an optional :class:`SimulationConstants` holding the
+    parameters it reads, which is built from the current parameters if
+    not given.
+
     """
     @staticmethod
-    def household_inf(infector, time: float):
+    def household_inf(infector, time: float, constants):
         """Calculate the infectiousness of a person in a given
         household. Does not include interventions such as isolation,
         or whether individual is a carehome resident.
@@ -24,6 +27,8 @@ class HouseholdInfection:
             Infector
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -31,20 +36,15 @@ class HouseholdInfection:
             Infectiousness parameter of household
 
         """
-        closure_inf = Parameters.instance().\
-            intervention_params['place_closure'][
-                'closure_household_infectiousness'] \
-            if (hasattr(infector.microcell, 'closure_start_time')) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                            infector.microcell.closure_start_time <= time
-                        ) else 1
+        closure_inf = constants.closure_household_infectiousness \
+            if infector.microcell.is_closed(time) and (
+                infector.is_place_closed(constants.closure_place_type)) \
+            else 1
         household_infectiousness = infector.infectiousness * closure_inf
         return household_infectiousness
 
     @staticmethod
-    def household_susc(infector, infectee, time: float):
+    def household_susc(infector, infectee, time: float, constants):
         """Calculate the susceptibility of one person to another in a given
         household. Does not include interventions such as isolation,
         or whether individual is a carehome resident.
@@ -57,6 +57,8 @@ class HouseholdInfection:
             Infectee
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -64,23 +66,39 @@ class HouseholdInfection:
             Susceptibility parameter of household
 
         """
-        household_susceptibility = PersonalInfection.person_susc(
-            infector, infectee, time)
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
-            if infector.distancing_enhanced is True:
-                household_susceptibility *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_house_enhanced_susc']
-            else:
-                household_susceptibility *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_house_susc']
-        return household_susceptibility
+        return (PersonalInfection.person_susc(infector, infectee, time)
+                * HouseholdInfection.household_distancing_susc(
+                    infector, time, constants))
 
     @staticmethod
-    def household_foi(infector, infectee, time: float):
+    def household_distancing_susc(infector, time: float, constants):
+        """Calculate the factor by which social distancing in the
+        infector's microcell scales the susceptibility of their household
+        members.
+
+        Parameters
+        ----------
+        infector : Person
+            Infector
+        time : float
+            Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
+
+        Returns
+        -------
+        float
+            Distancing factor of the susceptibility
+
+        """
+        if not infector.microcell.is_distancing(time):
+            return 1.0
+        if infector.distancing_enhanced:
+            return constants.distancing_house_enhanced_susc
+        return constants.distancing_house_susc
+
+    @staticmethod
+    def household_foi(infector, infectee, time: float, constants):
         """Calculate the force of infection parameter of a household,
         for a particular infector and infectee.
 
@@ -92,50 +110,143 @@ class HouseholdInfection:
             Infectee
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
         float
             Force of infection parameter of household
 
+        """
+        return (HouseholdInfection.household_foi_inf(infector, time,
+                                                     constants)
+                * HouseholdInfection.household_foi_susc(infector, infectee,
+                                                        time, constants))
+
+    @staticmethod
+    def household_foi_inf(infector, time: float, constants):
+        """Calculate the infector's part of the household force of
+        infection, which is the same for all their household members.
+
+        Parameters
+        ----------
+        infector : Person
+            Infector
+        time : float
+            Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
+
+        Returns
+        -------
+        float
+            Infectiousness factor of the force of infection
+
         """
         carehome_scale_inf = 1
         if infector.care_home_resident:
-            carehome_scale_inf = Parameters.instance()\
-                .carehome_params["carehome_resident_household_scaling"]
-        carehome_scale_susc = 1
-        if infectee.care_home_resident:
-            carehome_scale_susc = Parameters.instance()\
-                .carehome_params["carehome_resident_household_scaling"]
+            carehome_scale_inf = constants.carehome_resident_household_scaling
         seasonality = 1.0  # Not yet implemented
-        isolating = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_house'
-                                                  '_effectiveness'] \
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        quarantine = Parameters.instance().\
-            intervention_params['household_quarantine']['quarantine_house'
-                                                        '_effectiveness'] \
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
+        isolating = constants.isolation_house_effectiveness \
+            if infector.is_isolating(time) else 1
+        quarantine = constants.quarantine_house_effectiveness \
+            if infector.is_quarantined(time) else 1
         vacc_inf_drop = 1
         if infector.is_vaccinated:
-            vacc_params = Parameters.instance()\
-                .intervention_params['vaccine_params']
             if time > (infector.date_vaccinated +
-                       vacc_params['time_to_efficacy']):
-                vacc_inf_drop *= (1 - vacc_params['vacc_inf_drop'])
-
-        infectiousness = (HouseholdInfection.household_inf(infector, time)
-                          * seasonality
-                          * vacc_inf_drop
-                          * pyEpiabm.core.Parameters.instance().
-                          household_transmission
-                          * carehome_scale_inf
-                          * isolating * quarantine)
-        susceptibility = (HouseholdInfection.household_susc(infector,
-                                                            infectee, time)
-                          * carehome_scale_susc)
-        return (infectiousness * susceptibility)
+                       constants.time_to_efficacy):
+                vacc_inf_drop *= (1 - constants.vacc_inf_drop)
+
+        return (HouseholdInfection.household_inf(infector, time, constants)
+                * seasonality
+                * vacc_inf_drop
+                * constants.household_transmission
+                * carehome_scale_inf
+                * isolating * quarantine)
+
+    @staticmethod
+    def household_foi_susc(infector, infectee, time: float, constants):
+        """Calculate the infectee's part of the household force of
+        infection.
+
+        Parameters
+        ----------
+        infector : Person
+            Infector
+        infectee : Person
+            Infectee
+        time : float
+            Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
+
+        Returns
+        -------
+        float
+            Susceptibility factor of the force of infection
+
+        """
+        return (HouseholdInfection.household_susc(infector, infectee, time,
+                                                  constants)
+                * HouseholdInfection.household_carehome_susc(infectee,
+                                                             constants))
+
+    @staticmethod
+    def household_carehome_susc(infectee, constants):
+        """Calculate the factor by which the susceptibility of a care home
+        resident is scaled within households.
+
+        Parameters
+        ----------
+        infectee : Person
+            Infectee
+        constants : SimulationConstants
+            Compiled parameters
+
+        Returns
+        -------
+        float
+            Care home factor of the susceptibility
+
+        """
+        if not infectee.care_home_resident:
+            return 1
+        return constants.carehome_resident_household_scaling
+
+    @staticmethod
+    def household_foi_matrix(infectors, infectees, time: float,
+                             constants):
+        """Calculate the force of infection parameters of a household
+        for each pair of infector and infectee. The parts which depend only
+        on the infector and only on the infectee are evaluated once per
+        person, and combined with an outer product. This relies on
+        :meth:`PersonalInfection.person_susc`, which does not yet depend on
+        either person, always being 1.
+
+        Parameters
+        ----------
+        infectors : typing.List[Person]
+            Infectors of the household
+        infectees : typing.List[Person]
+            Susceptible members of the household
+        time : float
+            Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
+
+        Returns
+        -------
+        np.ndarray
+            Array of forces of infection, indexed by [infector, infectee]
+
+        """
+        infector_part = np.array([
+            HouseholdInfection.household_foi_inf(infector, time, constants)
+            * HouseholdInfection.household_distancing_susc(infector, time,
+                                                           constants)
+            for infector in infectors], dtype=float)
+        infectee_part = np.array([
+            HouseholdInfection.household_carehome_susc(infectee, constants)
+            for infectee in infectees], dtype=float)
+        return np.outer(infector_part, infectee_part)
@@ -4,10 +4,17 @@
 
 from enum import Enum
 
+import numpy as np
+
 
 class InfectionStatus(Enum):
     """Enum representing a person's current infection status.
 
+    The groups of statuses `infectious`, `symptomatic` and `terminal` are
+    available as frozensets of members, and as the boolean lookup tables
+    `is_infectious`, `is_symptomatic` and `is_terminal`, indexed by status
+    value.
+
     """
     Susceptible = 1
     Exposed = 2
@@ -20,3 +27,31 @@ class InfectionStatus(Enum):
     Recovered = 9
     Dead = 10
     Vaccinated = 11
+
+
+# Groups of statuses, as frozensets for membership tests on members, and
+# as boolean lookup tables indexed by status value for use as numpy masks
+# over arrays of status values (where 0 stands for no status).
+InfectionStatus.infectious = frozenset(
+    status for status in InfectionStatus if status.name.startswith('Infect'))
+InfectionStatus.symptomatic = InfectionStatus.infectious - {
+    InfectionStatus.InfectASympt}
+InfectionStatus.terminal = frozenset([InfectionStatus.Recovered,
+                                      InfectionStatus.Dead,
+                                      InfectionStatus.Vaccinated])
+
+
+def _lookup_table(statuses: frozenset) -> np.ndarray:
+    """Returns a boolean array, indexed by status value, which is True for
+    the given statuses.
+
+    """
+    table = np.zeros(len(InfectionStatus) + 1, dtype=bool)
+    table[[status.value for status in statuses]] = True
+    table.flags.writeable = False
+    return table
+
+
+InfectionStatus.is_infectious = _lookup_table(InfectionStatus.infectious)
+InfectionStatus.is_symptomatic = _lookup_table(InfectionStatus.symptomatic)
+InfectionStatus.is_terminal = _lookup_table(InfectionStatus.terminal)
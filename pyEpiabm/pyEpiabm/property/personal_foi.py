@@ -2,8 +2,6 @@
 # Calculate infectiousness and susceptibility for an individual
 #
 
-from pyEpiabm.core import Parameters
-
 
 class PersonalInfection:
     """Class to calculate the infectiousness and susceptibility
@@ -11,7 +9,7 @@ class PersonalInfection:
 
     """
     @staticmethod
-    def person_inf(infector, time: float):
+    def person_inf(infector, time: float, constants):
         """Calculate the infectiousness of a person.
 
         Parameters
@@ -20,6 +18,8 @@ class PersonalInfection:
             Infector
         time: float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -29,10 +29,8 @@ class PersonalInfection:
         """
         infector_inf = infector.infectiousness
         if infector.is_vaccinated:
-            params = Parameters.instance().\
-                intervention_params['vaccine_params']
-            if time > (infector.date_vaccinated + params['time_to_efficacy']):
-                infector_inf *= (1 - params['vacc_inf_drop'])
+            if time > (infector.date_vaccinated + constants.time_to_efficacy):
+                infector_inf *= (1 - constants.vacc_inf_drop)
 
         return infector_inf
 
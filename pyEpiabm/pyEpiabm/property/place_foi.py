@@ -2,18 +2,20 @@
 # Calculate place force of infection based on Covidsim code
 #
 
-from pyEpiabm.core import Parameters
-
 from .personal_foi import PersonalInfection
 
 
 class PlaceInfection:
     """Class to calculate the infectiousness and susceptibility
     parameters for the force of infection parameter, within places.
+
+    Each method takes an optional :class:`SimulationConstants` holding the
+    parameters it reads, which is built from the current parameters if
+    not given.
     """
 
     @staticmethod
-    def place_inf(place, infector, time: float):
+    def place_inf(place, infector, time: float, constants):
         """Calculate the infectiousness of a place. Does not include
         interventions such as isolation, or whether individual is a
         carehome resident.
@@ -29,6 +31,8 @@ class PlaceInfection:
             Infectious person
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -36,27 +40,17 @@ class PlaceInfection:
             Infectiousness parameter of place
 
         """
-        params = Parameters.instance().place_params
-        transmission = params["place_transmission"]
-        place_idx = place.place_type.value - 1
-        try:
-            num_groups = params["mean_group_size"][place_idx]
-        except IndexError:  # For place types not in parameters
-            num_groups = 1
         # Use group-wise capacity not max_capacity once implemented
-        place_inf = 0 if ((hasattr(infector.microcell, 'closure_start_time'))
-                          ) and (infector.is_place_closed(
-                            Parameters.instance().intervention_params[
-                                'place_closure']['closure_place_type'])) and (
-                                infector.microcell.closure_start_time <= time
-                                ) else \
-            (transmission / num_groups
-                * PersonalInfection.person_inf(infector, time))
+        place_inf = 0 if infector.microcell.is_closed(time) and (
+            infector.is_place_closed(constants.closure_place_type)) else \
+            (constants.place_transmission
+                / constants.place_group_size[place.place_type.value - 1]
+                * PersonalInfection.person_inf(infector, time, constants))
         return place_inf
 
     @staticmethod
     def place_susc(place, infector, infectee,
-                   time: float):
+                   time: float, constants):
         """Calculate the susceptibility of a place.
         Does not include interventions such as isolation,
         or whether individual is a carehome resident.
@@ -71,6 +65,8 @@ class PlaceInfection:
             Place
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -80,24 +76,17 @@ class PlaceInfection:
         """
         place_susc = 1.0
         place_idx = place.place_type.value - 1
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
-            if infector.distancing_enhanced is True:
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_enhanced_susc'][place_idx]
+        if infector.microcell.is_distancing(time):
+            if infector.distancing_enhanced:
+                place_susc *= \
+                    constants.distancing_place_enhanced_susc[place_idx]
             else:
-                place_susc *= Parameters.instance().\
-                             intervention_params[
-                             'social_distancing'][
-                             'distancing_place_susc'][place_idx]
+                place_susc *= constants.distancing_place_susc[place_idx]
         return place_susc
 
     @staticmethod
     def place_foi(place, infector, infectee,
-                  time: float):
+                  time: float, constants):
         """Calculate the force of infection of a place, for a particular
         infector and infectee.
 
@@ -111,6 +100,8 @@ class PlaceInfection:
             Place
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -118,26 +109,18 @@ class PlaceInfection:
             Force of infection parameter of place
 
         """
-
         carehome_scale_susc = 1
         if place.place_type.value == 5 and (infectee.key_worker
                                             or infector.key_worker):
-            carehome_scale_susc = Parameters.instance()\
-                .carehome_params["carehome_worker_group_scaling"]
-        isolating = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
+            carehome_scale_susc = constants.carehome_worker_group_scaling
+        isolating = constants.isolation_effectiveness \
+            if infector.is_isolating(time) else 1
         place_idx = place.place_type.value - 1
-        quarantine = Parameters.instance().\
-            intervention_params['household_quarantine'][
-                'quarantine_place_effectiveness'][place_idx]\
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
-        infectiousness = (PlaceInfection.place_inf(place, infector, time)
+        quarantine = constants.quarantine_place_effectiveness[place_idx] \
+            if infector.is_quarantined(time) else 1
+        infectiousness = (PlaceInfection.place_inf(place, infector, time,
+                                                   constants)
                           * isolating * quarantine)
         susceptibility = (PlaceInfection.place_susc(place, infector, infectee,
-                          time) * carehome_scale_susc * quarantine)
+                          time, constants) * carehome_scale_susc * quarantine)
         return (infectiousness * susceptibility)
@@ -1,18 +1,19 @@
 #
 # Calculate spatial force of infection based on Covidsim code
 #
-from pyEpiabm.core import Parameters
-
-import pyEpiabm.core
 
 
 class SpatialInfection:
     """Class to calculate the infectiousness and susceptibility
     parameters for the force of infection parameter, between cells.
 
+    Each method takes an optional :class:`SimulationConstants` holding the
+    parameters it reads, which is built from the current parameters if
+    not given.
+
     """
     @staticmethod
-    def cell_inf(inf_cell, time: float):
+    def cell_inf(inf_cell, time: float, constants):
         """Calculate the infectiousness of one cell
         towards its nearby cells. Does not include interventions such
         as isolation, or whether individual is a carehome resident.
@@ -23,6 +24,8 @@ class SpatialInfection:
             Cell causing the infection
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -30,7 +33,7 @@ class SpatialInfection:
             Average number of infection events from the cell
 
         """
-        R_0 = pyEpiabm.core.Parameters.instance().basic_reproduction_num
+        R_0 = constants.basic_reproduction_num
         total_infectors = inf_cell.number_infectious()
 
         average_number_to_infect = total_infectors * R_0
@@ -40,7 +43,7 @@ class SpatialInfection:
 
     @staticmethod
     def spatial_inf(inf_cell, infector,
-                    time: float):
+                    time: float, constants):
         """Calculate the infectiousness between cells, dependent on the
         infectious people in it.
 
@@ -52,6 +55,8 @@ class SpatialInfection:
             Infector
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -59,20 +64,17 @@ class SpatialInfection:
             Infectiousness parameter of cell
 
         """
-        age = pyEpiabm.core.Parameters.instance().\
-            age_contact[infector.age_group] \
-            if pyEpiabm.core.Parameters.instance().use_ages is True else 1
-        closure_spatial = Parameters.instance().\
-            intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
+        age = constants.age_contact[infector.age_group] \
+            if constants.use_ages is True else 1
+        closure_spatial = constants.closure_spatial_params \
+            if infector.microcell.is_closed(time) and (
+                infector.is_place_closed(constants.closure_place_type)) \
+            else 1
         return infector.infectiousness * age * closure_spatial
 
     @staticmethod
-    def spatial_susc(susc_cell, infector, infectee, time: float):
+    def spatial_susc(susc_cell, infector, infectee, time: float,
+                     constants):
         """Calculate the susceptibility of one cell towards its neighbouring
         cells.
 
@@ -86,6 +88,8 @@ class SpatialInfection:
             Infectee
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -94,34 +98,24 @@ class SpatialInfection:
 
         """
         spatial_susc = 1.0
-        if pyEpiabm.core.Parameters.instance().use_ages:
-            spatial_susc = pyEpiabm.core.Parameters.instance().\
-                age_contact[infectee.age_group]
-
-        spatial_susc *= Parameters.instance().\
-            intervention_params['place_closure']['closure_spatial_params'] \
-            if ((hasattr(infector.microcell, 'closure_start_time'))) and (
-                infector.is_place_closed(
-                    Parameters.instance().intervention_params[
-                        'place_closure']['closure_place_type'])) and (
-                        infector.microcell.closure_start_time <= time) else 1
-
-        if (hasattr(infector.microcell, 'distancing_start_time')) and (
-                infector.microcell.distancing_start_time is not None) and (
-                    infector.microcell.distancing_start_time <= time):
-            if infector.distancing_enhanced is True:
-                spatial_susc *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_spatial_enhanced_susc']
+        if constants.use_ages:
+            spatial_susc = constants.age_contact[infectee.age_group]
+
+        spatial_susc *= constants.closure_spatial_params \
+            if infector.microcell.is_closed(time) and (
+                infector.is_place_closed(constants.closure_place_type)) \
+            else 1
+
+        if infector.microcell.is_distancing(time):
+            if infector.distancing_enhanced:
+                spatial_susc *= constants.distancing_spatial_enhanced_susc
             else:
-                spatial_susc *= Parameters.instance().\
-                    intervention_params['social_distancing'][
-                        'distancing_spatial_susc']
+                spatial_susc *= constants.distancing_spatial_susc
         return spatial_susc
 
     @staticmethod
     def spatial_foi(inf_cell, susc_cell, infector,
-                    infectee, time: float):
+                    infectee, time: float, constants):
         """Calculate the force of infection between cells, for a particular
         infector and infectee.
 
@@ -137,6 +131,8 @@ class SpatialInfection:
             Infectee
         time : float
             Current simulation time
+        constants : SimulationConstants
+            Compiled parameters
 
         Returns
         -------
@@ -146,28 +142,19 @@ class SpatialInfection:
         """
         carehome_scale_inf = 1
         if infector.care_home_resident:
-            carehome_scale_inf = pyEpiabm.core.Parameters.instance()\
-                .carehome_params["carehome_resident_spatial_scaling"]
+            carehome_scale_inf = constants.carehome_resident_spatial_scaling
         carehome_scale_susc = 1
         if infectee.care_home_resident or infector.care_home_resident:
-            carehome_scale_susc = pyEpiabm.core.Parameters.instance()\
-                .carehome_params["carehome_resident_spatial_scaling"]
-
-        isolating = Parameters.instance().\
-            intervention_params['case_isolation']['isolation_effectiveness']\
-            if (hasattr(infector, 'isolation_start_time')) and (
-                infector.isolation_start_time is not None) and (
-                    infector.isolation_start_time <= time) else 1
-        quarantine = Parameters.instance().\
-            intervention_params['household_quarantine'][
-                'quarantine_spatial_effectiveness']\
-            if (hasattr(infector, 'quarantine_start_time')) and (
-                infector.quarantine_start_time is not None) and (
-                    infector.quarantine_start_time <= time) else 1
+            carehome_scale_susc = constants.carehome_resident_spatial_scaling
+
+        isolating = constants.isolation_effectiveness \
+            if infector.is_isolating(time) else 1
+        quarantine = constants.quarantine_spatial_effectiveness \
+            if infector.is_quarantined(time) else 1
         infectiousness = (SpatialInfection.spatial_inf(
-            inf_cell, infector, time) * carehome_scale_inf
+            inf_cell, infector, time, constants) * carehome_scale_inf
             * isolating * quarantine)
         susceptibility = (SpatialInfection.spatial_susc(
-            susc_cell, infector, infectee, time)
+            susc_cell, infector, infectee, time, constants)
             * carehome_scale_susc * quarantine)
         return (infectiousness * susceptibility)
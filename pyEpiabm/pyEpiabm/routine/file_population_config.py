@@ -27,6 +27,12 @@ class FilePopulationFactory:
         within each microcell. A random seed may be specified for reproducible
         populations.
 
+        The next infection statuses and transition times of people who are
+        infected in the input file are drawn for each microcell at once,
+        from the numpy random state rather than from the `random` module,
+        so populations made with a given seed differ from those of earlier
+        versions.
+
         Input file contains columns:
 
             * `cell`: ID code for cell
@@ -97,6 +103,7 @@ class FilePopulationFactory:
             cell.microcells.append(new_microcell)
             new_microcell.set_id(line["microcell"])
 
+            infected = []
             for column in input.columns.values:
                 if hasattr(InfectionStatus, column):
                     value = getattr(InfectionStatus, column)
@@ -108,11 +115,20 @@ class FilePopulationFactory:
                         if (person.infection_status
                                 == InfectionStatus.Susceptible):
                             continue  # Next status set upon infection
-                        host_sweep.update_next_infection_status(person)
-                        host_sweep.update_time_status_change(person, time)
-                        if str(person.infection_status).startswith('Infect'):
-                            HostProgressionSweep.set_infectiousness(person,
-                                                                    time)
+                        infected.append(person)
+
+            # Assign transitions of all infected people in the microcell
+            # at once. These are drawn with numpy, so the seeded output
+            # differs from drawing them person by person
+            if len(infected) > 0:
+                rows = np.array([person.store_row[1] for person in infected])
+                host_sweep.update_next_infection_status_batch(
+                    cell.population_store, rows)
+                host_sweep.update_time_status_change_batch(
+                    cell.population_store, rows, time)
+                for person in infected:
+                    if person.is_infectious():
+                        HostProgressionSweep.set_infectiousness(person, time)
 
             # Add households and places to microcell
             if len(Parameters.instance().household_size_distribution) == 0:
@@ -164,7 +180,7 @@ class FilePopulationFactory:
             if cell.id == cell_id:
                 return cell
         new_cell = Cell()
-        population.cells.append(new_cell)
+        population.add_cell(new_cell)
         new_cell.set_id(cell_id)
         return new_cell
 
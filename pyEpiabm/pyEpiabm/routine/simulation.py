@@ -11,7 +11,8 @@ from tqdm import tqdm
 
 from pyEpiabm.core import Parameters, Population
 from pyEpiabm.output import _CsvDictWriter
-from pyEpiabm.output import AbstractReporter
+from pyEpiabm.output import AbstractReporter, ReportingThread
+from pyEpiabm.output import ResultsRecorder
 from pyEpiabm.property import InfectionStatus
 from pyEpiabm.sweep import AbstractSweep
 from pyEpiabm.utility import log_exceptions
@@ -25,6 +26,7 @@ class Simulation:
         """ Constructor
         """
         self.writers = []
+        self.reporting_thread = None
 
     @log_exceptions()
     def configure(self,
@@ -50,6 +52,16 @@ class Simulation:
                should be used
             * `age_stratified`: Boolean to determine whether the output will \
                 be age stratified
+            * `csv_output`: Boolean to determine whether the results are \
+                exported to the output .csv file, in chunks of time points \
+                as the simulation runs (defaults to True)
+            * `results_file`: String for the name of a binary file, in the \
+                output folder, to which the results are streamed during \
+                the simulation, and which can be read with \
+                :class:`BinaryReader` (optional)
+            * `async_output`: Boolean to determine whether output files are \
+                written on a background thread while the simulation runs \
+                (defaults to True)
 
         Parameters
         ----------
@@ -103,55 +115,99 @@ class Simulation:
         logging.info(
             f"Set output location to {os.path.join(folder, filename)}")
 
-        output_titles = ["time"] + [s for s in InfectionStatus]
-        if self.spatial_output:
-            output_titles.insert(1, "cell")
-            output_titles.insert(2, "location_x")
-            output_titles.insert(3, "location_y")
+        self.csv_output = file_params["csv_output"] \
+            if "csv_output" in file_params else True
+
+        self.async_output = file_params["async_output"] \
+            if "async_output" in file_params else True
+
+        # Counts are recorded for each cell if spatial output is used, and
+        # for the whole population otherwise
+        ts = 1 / Parameters.instance().time_steps_per_day
+        nb_times = 1 + len(Simulation._sweep_times(self.sim_params, ts))
+        cells = self.population.cells if self.spatial_output else None
+        results_file = file_params["results_file"] \
+            if "results_file" in file_params else None
+        self.recorder = ResultsRecorder(
+            nb_times, self.population.compartment_counter.nb_age_groups,
+            cells, folder if results_file else None, results_file)
+
+        self.writer = None
+        # Time points recorded since the last export to the .csv file
+        self._csv_times = []
+        self._csv_counts = []
+        if self.csv_output:
+            output_titles = ["time"] + [s for s in InfectionStatus]
+            if self.spatial_output:
+                output_titles.insert(1, "cell")
+                output_titles.insert(2, "location_x")
+                output_titles.insert(3, "location_y")
 
-        if self.age_stratified:
-            output_titles.insert(1, "age_group")
+            if self.age_stratified:
+                output_titles.insert(1, "age_group")
 
-        self.writer = _CsvDictWriter(
-            folder, filename,
-            output_titles)
+            self.writer = _CsvDictWriter(
+                folder, filename,
+                output_titles)
 
     @log_exceptions()
     def run_sweeps(self):
         """Iteration step of the simulation. First the initialisation sweeps
         configure the population on the first timestep. Then at each
         subsequent timestep the sweeps run, updating the population. At each
-        timepoint, a count of each infection status is written to file. Note
-        that the elements of initial sweeps take the sim_params dict as an
-        argument for their call method but the elements of sweeps take time
-        as an argument for their call method.
+        timepoint, a count of each infection status is recorded, and the
+        recorded counts are exported to the output .csv file in chunks of
+        time points if required. Note that the elements of initial sweeps
+        take the sim_params dict as an argument for their call method but the
+        elements of sweeps take time as an argument for their call method.
+
+        If asynchronous output is used, the reporters write to file on a
+        background thread. Their files are closed at the end of the
+        simulation, even if it fails, in which case an error closing them
+        is logged so that it does not mask the error of the simulation.
 
         """
-        # Define time step between sweeps
-        ts = 1 / Parameters.instance().time_steps_per_day
-        # Initialise on the time step before starting.
-        for sweep in self.initial_sweeps:
-            sweep(self.sim_params)
-        logging.info("Initial Sweeps Completed at time "
-                     + f"{self.sim_params['simulation_start_time']} days")
-        # First entry of the data file is the initial state
-        self.write_to_file(self.sim_params["simulation_start_time"])
-
-        for t in tqdm(np.arange(self.sim_params["simulation_start_time"] + ts,
-                                self.sim_params["simulation_end_time"] + ts,
-                                ts)):
-            for sweep in self.sweeps:
-                sweep(t)
-            self.write_to_file(t)
-            for writer in self.writers:
-                writer.write(t, self.population)
-            logging.debug(f'Iteration at time {t} days completed')
-
-        logging.info(f"Final time {t} days reached")
+        if self.async_output:
+            self.reporting_thread = ReportingThread()
+        for reporter in self._reporters():
+            reporter.set_thread(self.reporting_thread)
+
+        try:
+            # Define time step between sweeps
+            ts = 1 / Parameters.instance().time_steps_per_day
+            # Initialise on the time step before starting.
+            for sweep in self.initial_sweeps:
+                sweep(self.sim_params)
+            logging.info("Initial Sweeps Completed at time "
+                         + f"{self.sim_params['simulation_start_time']} days")
+            # First entry of the data file is the initial state
+            self.write_to_file(self.sim_params["simulation_start_time"])
+
+            for t in tqdm(Simulation._sweep_times(self.sim_params, ts)):
+                for sweep in self.sweeps:
+                    sweep(t)
+                self.write_to_file(t)
+                for writer in self.writers:
+                    writer.write(t, self.population)
+                logging.debug(f'Iteration at time {t} days completed')
+
+            logging.info(f"Final time {t} days reached")
+            self.recorder.close()
+            self.export_csv()
+        except BaseException:
+            try:
+                self.close()
+            except Exception as e:
+                logging.exception(f"{type(e).__name__} closing the output"
+                                  + " of a failed simulation")
+            raise
+        self.close()
 
     def write_to_file(self, time):
-        """Records the count number of a given list of infection statuses
-        and writes these to file.
+        """Records the count number of each infection status, by age group
+        and by cell if spatial output is used, in the results recorder.
+        The counts are exported to the output .csv file each time a chunk
+        of time points, the size of the recorder's chunks, is recorded.
 
         Parameters
         ----------
@@ -159,61 +215,93 @@ class Simulation:
             Time of output data
 
         """
-        if Parameters.instance().use_ages:
-            nb_age_groups = len(Parameters.instance().age_proportions)
+        if self.spatial_output:
+            counts = [cell.compartment_counter.counts
+                      for cell in self.population.cells]
         else:
-            nb_age_groups = 1
-        if Parameters.instance().use_ages:
-            if self.spatial_output:  # Separate output line for each cell
-                for cell in self.population.cells:
-                    for age_i in range(0, nb_age_groups):
-                        data = {s: 0 for s in list(InfectionStatus)}
-                        for inf_status in data:
-                            data_per_inf_status =\
-                                cell.compartment_counter.retrieve()[inf_status]
-                            data[inf_status] += data_per_inf_status[age_i]
-                        # Age groups are numbered from 1 to the total number
-                        # of age groups (thus the +1):
-                        data["age_group"] = age_i+1
-                        data["time"] = time
-                        data["cell"] = cell.id
-                        data["location_x"] = cell.location[0]
-                        data["location_y"] = cell.location[1]
-                        self.writer.write(data)
-            else:  # Summed output across all cells in population
-                data = {s: 0 for s in list(InfectionStatus)}
-                for cell in self.population.cells:
-                    for age_i in range(0, nb_age_groups):
-                        for inf_status in list(InfectionStatus):
-                            data_per_inf_status =\
-                                cell.compartment_counter.retrieve()[inf_status]
-                            data[inf_status] += data_per_inf_status[age_i]
-                        data["age_group"] = age_i+1
-                        data["time"] = time
-                        self.writer.write(data)
-        else:  # If age not considered, age_group not written in csv
-            if self.spatial_output:  # Separate output line for each cell
-                for cell in self.population.cells:
-                    data = {s: 0 for s in list(InfectionStatus)}
-                    for k in data:
-                        data[k] += sum(cell.compartment_counter.retrieve()[k])
-                    data["time"] = time
-                    data["cell"] = cell.id
-                    data["location_x"] = cell.location[0]
-                    data["location_y"] = cell.location[1]
-                    self.writer.write(data)
-            else:  # Summed output across all cells in population
-                data = {s: 0 for s in list(InfectionStatus)}
-                for cell in self.population.cells:
-                    for k in data:
-                        # Sum across age compartments
-                        data[k] += sum(cell.compartment_counter.retrieve()[k])
-                data["time"] = time
-                self.writer.write(data)
+            counts = [self.population.compartment_counter.counts]
+        self.recorder.write(time, counts)
+
+        if self.writer is not None:
+            self._csv_times.append(time)
+            self._csv_counts.append(np.array(counts))
+            if len(self._csv_times) >= self.recorder.chunk_size:
+                self.export_csv()
+
+    @property
+    def results(self):
+        """Get the recorded counts as a dataframe, with the same columns as
+        the output .csv file.
+
+        """
+        return self.recorder.to_dataframe(self.age_stratified)
+
+    def export_csv(self):
+        """Writes the counts recorded since the last export to the output
+        .csv file, with a line for each time point, and for each age group
+        and cell if age stratified or spatial output is used. Times are
+        written as they were given, so an integer start time is written
+        without a decimal point.
+
+        """
+        if self.writer is None or not self._csv_times:
+            return
+        frame = ResultsRecorder.counts_to_dataframe(
+            np.array(self._csv_times, dtype=object),
+            np.stack(self._csv_counts), list(InfectionStatus),
+            self.recorder.cell_ids if self.spatial_output else None,
+            self.recorder.locations, self.age_stratified)
+        self._csv_times = []
+        self._csv_counts = []
+        self.writer.write_frame(frame)
+
+    def close(self):
+        """Waits for all output to be written, and closes the output files
+        of the simulation and of its added writers.
+
+        """
+        try:
+            if self.reporting_thread is not None:
+                self.reporting_thread.close()
+        finally:
+            self.reporting_thread = None
+            for reporter in self._reporters():
+                reporter.set_thread(None)
+                reporter.close()
+
+    def _reporters(self) -> typing.List[AbstractReporter]:
+        """Returns the reporters which write the output of the simulation.
+
+        """
+        reporters = [self.recorder] + self.writers
+        if self.writer is not None:
+            reporters.append(self.writer)
+        return reporters
 
     def add_writer(self, writer: AbstractReporter):
         self.writers.append(writer)
 
+    @staticmethod
+    def _sweep_times(sim_params: typing.Dict, ts: float):
+        """Returns the times at which the sweeps are run, after the initial
+        state at the simulation start time.
+
+        Parameters
+        ----------
+        sim_params : dict
+            Dictionary of parameters specific to the simulation
+        ts : float
+            Time step between sweeps
+
+        Returns
+        -------
+        np.ndarray
+            Array of sweep times
+
+        """
+        return np.arange(sim_params["simulation_start_time"] + ts,
+                         sim_params["simulation_end_time"] + ts, ts)
+
     @staticmethod
     def set_random_seed(seed):
         """ Set random seed for all subsequent operations. Should be used
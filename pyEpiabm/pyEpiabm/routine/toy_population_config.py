@@ -10,7 +10,8 @@ import math
 
 from pyEpiabm.core import Population, Parameters
 from pyEpiabm.property import PlaceType
-from pyEpiabm.utility import DistanceFunctions, log_exceptions
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex, \
+    log_exceptions
 
 from .abstract_population_config import AbstractPopulationFactory
 
@@ -186,18 +187,19 @@ class ToyPopulationFactory(AbstractPopulationFactory):
             if method == "random":
                 for cell in population.cells:
                     cell.set_location(tuple(np.random.rand(2)))
+                index = SpatialIndex([cell.location
+                                      for cell in population.cells])
+                for cell in population.cells:
                     for microcell in cell.microcells:
                         while True:
                             # Will keep random location only if microcell
                             # is closer to its cell's location than any other.
-                            # Not very efficient.
                             microcell.set_location(tuple(np.random.rand(2)))
                             cell_dist = (DistanceFunctions.dist(microcell.
                                          location, cell.location))
-                            inter_dist = [DistanceFunctions.dist(microcell.
-                                          location, cell2.location) for cell2
-                                          in population.cells]
-                            if min(inter_dist) == cell_dist:
+                            _, nearest = index.query_nearest(
+                                [microcell.location])
+                            if cell_dist <= nearest[0, 0]:
                                 break
 
             elif method == "uniform_x":
@@ -9,6 +9,10 @@ class AbstractSweep:
     """Abstract class for Population Sweeps.
 
     """
+    # Compiled parameters, set when binding the population by the sweeps
+    # which use them
+    _constants = None
+
     def bind_population(self, population: Population):
         """Set the population which the sweep will act on.
 
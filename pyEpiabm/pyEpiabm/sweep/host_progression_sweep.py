@@ -7,7 +7,7 @@ import numpy as np
 from collections import defaultdict
 
 import pyEpiabm as pe
-from pyEpiabm.core import Parameters, Person
+from pyEpiabm.core import Parameters, Person, SimulationConstants
 from pyEpiabm.property import InfectionStatus
 
 from .abstract_sweep import AbstractSweep
@@ -19,8 +19,10 @@ class HostProgressionSweep(AbstractSweep):
     and time to next infection status change.
 
     """
+    _delayed_values = [InfectionStatus.InfectMild.value,
+                       InfectionStatus.InfectGP.value]
 
-    def __init__(self):
+    def __init__(self, event_driven: bool = False):
         """Initialise parameters to be used in class methods. State
         transition matrix is set where each row of the matrix corresponds
         to a current infection status of a person. The columns of that
@@ -34,7 +36,16 @@ class HostProgressionSweep(AbstractSweep):
         infectiousness and which depends on time since the start of the
         infection, measured in timesteps (following what is done in Covidsim).
 
+        Parameters
+        ----------
+        event_driven : bool
+            Whether to only visit the people whose status change is due,
+            using the time-ordered queue of each cell's
+            :class:`PopulationStore`, rather than sweeping through every
+            person on each timestep
+
         """
+        self.event_driven = event_driven
         # Instantiate state transition matrix
         use_ages = Parameters.instance().use_ages
         coefficients = defaultdict(int, Parameters.instance()
@@ -51,6 +62,7 @@ class HostProgressionSweep(AbstractSweep):
         time_matrix_object = TransitionTimeMatrix()
         self.transition_time_matrix =\
             time_matrix_object.create_transition_time_matrix()
+        self.compile_tables()
         # Instantiate parameters to be used in update transition time
         # method
         self.latent_to_symptom_delay =\
@@ -99,6 +111,19 @@ class HostProgressionSweep(AbstractSweep):
             infectiousness_prog[i] /= scaling_param
         self.infectiousness_progression = infectiousness_prog
 
+    def compile_tables(self):
+        """Builds the dense numpy tables used to draw next infection statuses
+        and transition times for many people at once, from the state
+        transition matrix and the transition time matrix. Should be called
+        again if either matrix is modified after construction.
+
+        """
+        nb_age_groups = len(Parameters.instance().age_proportions)
+        self._cumulative_probabilities = StateTransitionMatrix.compile(
+            self.state_transition_matrix, max(nb_age_groups, 1))
+        self._fixed_times, self._icdfs = TransitionTimeMatrix.compile(
+            self.transition_time_matrix)
+
     @staticmethod
     def set_infectiousness(person: Person, time: float):
         """Assigns the initial infectiousness of a person for when they go from
@@ -240,6 +265,100 @@ class HostProgressionSweep(AbstractSweep):
 
         person.time_of_status_change = time + transition_time
 
+    def update_next_infection_status_batch(self, store, rows: np.ndarray):
+        """Assigns the next infection status of several people at once, as
+        in :meth:`update_next_infection_status`, but drawing from the
+        compiled table of cumulative transition probabilities. Carehome
+        residents in hospital who do not die continue through the usual
+        transitions.
+
+        Parameters
+        ----------
+        store : PopulationStore
+            Store holding the people to update
+        rows : np.ndarray
+            Rows of the people in the store
+
+        """
+        statuses = store.infection_status[rows].astype(int)
+        if self._cumulative_probabilities.shape[0] > 1:
+            age_groups = store.age_group[rows]
+        else:
+            age_groups = 0
+        cumulative = self._cumulative_probabilities[age_groups, statuses - 1]
+        r = np.random.random(len(rows))
+        next_statuses = (cumulative <= r[:, np.newaxis]).sum(axis=1) + 1
+        # Rows end at exactly one, but the draw is kept to valid statuses
+        np.minimum(next_statuses, len(InfectionStatus), out=next_statuses)
+        # No next status for rows without transitions, or terminal states
+        next_statuses[cumulative[:, -1] == 0] = 0
+        next_statuses[InfectionStatus.is_terminal[statuses]] = 0
+
+        carehome = store.care_home_resident[rows]
+        dead = InfectionStatus.Dead.value
+        next_statuses[carehome
+                      & (statuses == InfectionStatus.InfectICU.value)] = dead
+        in_hosp = carehome & (statuses == InfectionStatus.InfectHosp.value)
+        if in_hosp.any():
+            carehome_hosp = Parameters.instance().\
+                carehome_params['carehome_rel_prob_hosp']
+            dies = np.random.random(in_hosp.sum()) > carehome_hosp
+            next_statuses[np.flatnonzero(in_hosp)[dies]] = dead
+
+        store.next_infection_status[rows] = next_statuses
+
+    def update_time_status_change_batch(self, store, rows: np.ndarray,
+                                        time: float):
+        """Assigns the time of status change of several people at once, as
+        in :meth:`update_time_status_change`. The transition times of all
+        the people making the same transition are drawn in one call to
+        :meth:`InverseCdf.icdf_choose_noexp_batch`.
+
+        Parameters
+        ----------
+        store : PopulationStore
+            Store holding the people to update
+        rows : np.ndarray
+            Rows of the people in the store
+        time : float
+            Current simulation time
+
+        """
+        statuses = store.infection_status[rows].astype(int)
+        if (statuses == InfectionStatus.Susceptible.value).any():
+            raise ValueError("Method should not be used to infect people")
+        next_statuses = store.next_infection_status[rows].astype(int)
+        transition_times = np.full(len(rows), np.inf)
+        active = ~InfectionStatus.is_terminal[statuses]
+        if (next_statuses[active] == 0).any():
+            raise ValueError("Next infection status must be set before"
+                             + " the transition time")
+        i = statuses[active] - 1
+        j = next_statuses[active] - 1
+
+        times = self._fixed_times[i, j]
+        # Transitions are taken in order of status and next status, so
+        # that the draws do not depend on the order of the rows
+        transitions = i * len(InfectionStatus) + j
+        drawn = np.isnan(times)
+        for transition in np.unique(transitions[drawn]):
+            selected = drawn & (transitions == transition)
+            icdf = self._icdfs[divmod(transition, len(InfectionStatus))]
+            times[selected] = icdf.icdf_choose_noexp_batch(
+                np.count_nonzero(selected))
+        transition_times[active] = times
+
+        transition_times[np.isin(statuses, self._delayed_values)] += \
+            self.delay
+        if (transition_times < 0).any():
+            raise ValueError('New transition time must be larger than' +
+                             ' or equal to 0')
+
+        new_times = time + transition_times
+        store.time_of_status_change[rows] = new_times
+        for row, new_time in zip(rows.tolist(), new_times.tolist()):
+            store.schedule(row, new_time)
+
     def _updates_infectiousness(self, person: Person, time: float):
         """Updates infectiousness. Scales using the initial infectiousness
         if the person is in an infectious state. Updates the infectiousness to
@@ -257,7 +376,7 @@ class HostProgressionSweep(AbstractSweep):
 
         """
         # Updates infectiousness with scaling if person is infectious:
-        if str(person.infection_status).startswith('InfectionStatus.Infect'):
+        if person.infection_status in InfectionStatus.infectious:
             scale_infectiousness = self.infectiousness_progression
             time_since_infection = (int((time - person.infection_start_time)
                                         / self.model_time_step))
@@ -266,53 +385,161 @@ class HostProgressionSweep(AbstractSweep):
         # Sets infectiousness to 0 if person just became Recovered, Dead, or
         # Vaccinated, and sets its infection start time to None again.
         elif person.infectiousness != 0:
-            if person.infection_status in [InfectionStatus.Recovered,
-                                           InfectionStatus.Dead,
-                                           InfectionStatus.Vaccinated]:
+            if person.infection_status in InfectionStatus.terminal:
                 person.infectiousness = 0
                 person.infection_start_time = None
 
+    def bind_population(self, population):
+        super().bind_population(population)
+        self._constants = SimulationConstants()
+        if self.event_driven:
+            for cell in population.cells:
+                cell.population_store.enable_schedule()
+
     def __call__(self, time: float):
         """Sweeps through all people in the population, updates their
         infection status if it is time and assigns them their next infection
         status and the time of their next status change. Also updates their
         infectiousness.
 
+        The people whose status change is due are found by comparing every
+        stored time of status change with the current time, or, in event
+        driven mode, are taken from the time-ordered queue of each cell's
+        :class:`PopulationStore`. In both modes their next infection
+        statuses and transition times are drawn together from the compiled
+        tables, so that both modes give the same results for the same random
+        seed. Only the infectious people of each cell have their
+        infectiousness updated, so without disease testing the cost of a
+        time step in event driven mode scales with the number of infections
+        rather than the size of the population.
+
         Parameters
         ----------
         time : float
             Current simulation time
 
         """
-        # store list of uninfected or asymptomatic people for processing
-        # for disease testing.
+        testing = self._constants.testing
         asympt_or_uninf_people = []
         for cell in self._population.cells:
-            for person in cell.persons:
-                if person.time_of_status_change is None:
-                    assert person.is_susceptible()
-                    asympt_or_uninf_people.append((cell, person))
-                    continue  # pragma: no cover
-                if person.infection_status in [InfectionStatus.Recovered,
-                                               InfectionStatus.Vaccinated]:
-                    asympt_or_uninf_people.append((cell, person))
-                while person.time_of_status_change <= time:
-                    person.update_status(person.next_infection_status)
-                    if person.infection_status in \
-                            [InfectionStatus.InfectASympt,
-                             InfectionStatus.InfectMild,
-                             InfectionStatus.InfectGP]:
-                        self.set_infectiousness(person, time)
-                        if not person.is_symptomatic():
-                            asympt_or_uninf_people.append((cell, person))
-                    self.update_next_infection_status(person)
-                    self.update_time_status_change(person, time)
-                    self.sympt_testing_queue(cell, person)
-                self._updates_infectiousness(person, time)
-
-        self.asympt_uninf_testing_queue(asympt_or_uninf_people, time)
-
-    def sympt_testing_queue(self, cell, person: Person):
+            store = cell.population_store
+            if self.event_driven:
+                # Sorted, so that the random draws follow the same order as
+                # when sweeping through every person
+                rows = store.pop_due(time)
+            else:
+                times = store.view('time_of_status_change')
+                assert not (np.isnan(times)
+                            & ~store.status_mask(InfectionStatus.Susceptible)
+                            ).any(), \
+                    "Only susceptible people may have no time of status change"
+                rows = np.flatnonzero(times <= time).tolist()
+            if testing:
+                # Uninfected people are only needed for disease testing,
+                # and are found from their statuses before this time step,
+                # so people who recover in this time step are not included
+                uninfected = (np.isnan(store.view('time_of_status_change'))
+                              | store.status_mask(InfectionStatus.Recovered,
+                                                  InfectionStatus.Vaccinated))
+            new_asympt = self._do_transitions(cell, rows, time)
+            self._update_store_infectiousness(cell, time)
+
+            if testing:
+                # People who became asymptomatic are included unless they
+                # have since become symptomatic in the same time step, as
+                # symptomatic people may not join this testing queue
+                new_asympt = np.array(new_asympt, dtype=int)
+                symptomatic = InfectionStatus.is_symptomatic[
+                    store.infection_status[new_asympt]]
+                uninfected[new_asympt[~symptomatic]] = True
+                asympt_or_uninf_people.extend(
+                    (cell, store.persons[row])
+                    for row in np.flatnonzero(uninfected).tolist())
+
+        self.asympt_uninf_testing_queue(asympt_or_uninf_people, time,
+                                        self._constants)
+
+    def _do_transitions(self, cell, rows: list, time: float) -> list:
+        """Moves the people in the given rows of the cell's store through all
+        of the status changes which are due by the given time. Their next
+        infection statuses and times of status change are drawn for all of
+        them at once after each change.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell the people are members of
+        rows : list
+            Rows of the people whose status change is due, in the cell's
+            :class:`PopulationStore`
+        time : float
+            Current simulation time
+
+        Returns
+        -------
+        list
+            Rows of the people who became asymptomatic
+
+        """
+        store = cell.population_store
+        updated_rows = set(rows)
+        new_asympt = []
+        # People may make several transitions within one timestep
+        while len(rows) > 0:
+            for row in rows:
+                person = store.persons[row]
+                person.update_status(person.next_infection_status)
+                if person.infection_status in \
+                        [InfectionStatus.InfectASympt,
+                         InfectionStatus.InfectMild,
+                         InfectionStatus.InfectGP]:
+                    self.set_infectiousness(person, time)
+                    if not person.is_symptomatic():
+                        new_asympt.append(row)
+            row_array = np.array(rows)
+            self.update_next_infection_status_batch(store, row_array)
+            self.update_time_status_change_batch(store, row_array, time)
+            for row in rows:
+                self.sympt_testing_queue(cell, store.persons[row],
+                                         self._constants)
+            rows = row_array[store.time_of_status_change[row_array]
+                             <= time].tolist()
+        for row in sorted(updated_rows):
+            self._updates_infectiousness(store.persons[row], time)
+        return new_asympt
+
+    def _update_store_infectiousness(self, cell, time: float):
+        """Scales the infectiousness of every infectious person in the
+        cell according to the time since the start of their infection, as
+        in :meth:`_updates_infectiousness`. The people are taken from the
+        cell's registry of infectious people, so the rest of its store is
+        not read.
+
+        Parameters
+        ----------
+        cell : Cell
+            Cell of the people to update
+        time : float
+            Current simulation time
+
+        """
+        if len(cell.infectious_persons) == 0:
+            return
+        store = cell.population_store
+        rows = np.fromiter(cell.infectious_persons, dtype=int,
+                           count=len(cell.infectious_persons))
+        start_times = store.infection_start_time[rows]
+        started = np.isfinite(start_times)
+        rows, start_times = rows[started], start_times[started]
+        if len(rows) == 0:
+            return
+        time_since_infection = ((time - start_times)
+                                / self.model_time_step).astype(int)
+        store.infectiousness[rows] = (
+            store.initial_infectiousness[rows]
+            * self.infectiousness_progression[time_since_infection])
+
+    def sympt_testing_queue(self, cell, person: Person, constants):
         """ Adds symptomatic people to a testing queue with a given
         probability depedent on their status as either a care home
         resident or a key worker.
@@ -327,40 +554,30 @@ class HostProgressionSweep(AbstractSweep):
             will be added to the testing queue of.
         person : Person
             symptomatic inndividual to be added to a testing queue.
+        constants : SimulationConstants
+            Compiled parameters
 
         """
-        if hasattr(Parameters.instance(), 'intervention_params'):
-            if 'disease_testing' in Parameters.instance().\
-              intervention_params.keys():
-                testing_params = Parameters.instance().\
-                    intervention_params['disease_testing']
-                r = random.random()
-                type_r = random.random()
-
-                if (person.is_symptomatic() and
-                   person.date_positive is None):
-                    if person.care_home_resident:
-                        test_probability = testing_params['testing_sympt'][0]
-                        type_probability = testing_params['sympt_pcr'][0]
-                    elif person.key_worker:
-                        test_probability = testing_params['testing_sympt'][1]
-                        type_probability = testing_params['testing_sympt'][2]
+        if constants.testing:
+            r = random.random()
+            type_r = random.random()
+
+            if (person.is_symptomatic() and
+               person.date_positive is None):
+                group = HostProgressionSweep._testing_group(person)
+                if r < constants.testing_sympt[group]:
+                    if type_r < constants.sympt_pcr[group]:
+                        cell.enqueue_PCR_testing(person)
                     else:
-                        test_probability = testing_params['testing_sympt'][2]
-                        type_probability = testing_params['sympt_pcr'][2]
-
-                    if r < test_probability:
-                        if type_r < type_probability:
-                            cell.enqueue_PCR_testing(person)
-                        else:
-                            cell.enqueue_LFT_testing(person)
-
-                if (person.date_positive is not None and
-                    (person.next_infection_status in
-                     [InfectionStatus.Dead, InfectionStatus.Recovered])):
-                    person.date_positive = None
+                        cell.enqueue_LFT_testing(person)
 
-    def asympt_uninf_testing_queue(self, person_list: list, time):
+            if (person.date_positive is not None and
+                (person.next_infection_status in
+                 [InfectionStatus.Dead, InfectionStatus.Recovered])):
+                person.date_positive = None
+
+    def asympt_uninf_testing_queue(self, person_list: list, time,
+                                   constants):
         """ Adds asymptomatic and uninfected people to a testing queue
         with a given probability depedent on their status as either a care
         home resident or key worker.
@@ -376,45 +593,49 @@ class HostProgressionSweep(AbstractSweep):
         time : float
             current time point to determine whether uninfected indivuals
             should stop being considered as positive.
+        constants : SimulationConstants
+            Compiled parameters
 
         """
-        if hasattr(Parameters.instance(), 'intervention_params'):
-            if 'disease_testing' in Parameters.instance().\
-               intervention_params.keys():
-                testing_params = Parameters.instance().\
-                    intervention_params['disease_testing']
-                for item in person_list:
-                    cell = item[0]
-                    person = item[1]
-                    if person.is_symptomatic():
-                        raise ValueError("Function should not be called on" +
-                                         "symptomatic individuals.")
-                    r = random.random()
-                    type_r = random.random()
-
-                    if person.care_home_resident:
-                        test_probability = testing_params[
-                            'testing_asympt_uninf'][0]
-                        type_probability = testing_params[
-                            'asympt_uninf_pcr'][0]
-                    elif person.key_worker:
-                        test_probability = testing_params[
-                            'testing_asympt_uninf'][1]
-                        type_probability = testing_params[
-                            'asympt_uninf_pcr'][1]
+        if constants.testing:
+            for cell, person in person_list:
+                if person.is_symptomatic():
+                    raise ValueError("Function should not be called on" +
+                                     "symptomatic individuals.")
+                r = random.random()
+                type_r = random.random()
+
+                group = HostProgressionSweep._testing_group(person)
+                if (r < constants.testing_asympt_uninf[group] and
+                   person.date_positive is None):
+                    if type_r < constants.asympt_uninf_pcr[group]:
+                        cell.enqueue_PCR_testing(person)
                     else:
-                        test_probability = testing_params[
-                            'testing_asympt_uninf'][2]
-                        type_probability = testing_params[
-                            'asympt_uninf_pcr'][2]
-
-                    if (r < test_probability and
-                       person.date_positive is None):
-                        if type_r < type_probability:
-                            cell.enqueue_PCR_testing(person)
-                        else:
-                            cell.enqueue_LFT_testing(person)
-
-                    elif (person.date_positive is not None and
-                          person.date_positive + 10 >= time):
-                        person.date_positive = None
+                        cell.enqueue_LFT_testing(person)
+
+                elif (person.date_positive is not None and
+                      person.date_positive + 10 >= time):
+                    person.date_positive = None
+
+    @staticmethod
+    def _testing_group(person: Person):
+        """Returns the index of the person's group in the disease testing
+        parameters: 0 for care home residents, 1 for key workers and 2 for
+        everyone else.
+
+        Parameters
+        ----------
+        person : Person
+            Person to be tested
+
+        Returns
+        -------
+        int
+            Index of the person's testing group
+
+        """
+        if person.care_home_resident:
+            return 0
+        elif person.key_worker:
+            return 1
+        return 2
@@ -3,9 +3,10 @@
 #
 
 import random
+import numpy as np
 
+from pyEpiabm.core import SimulationConstants
 from pyEpiabm.property import HouseholdInfection
-from pyEpiabm.core import Person
 
 from .abstract_sweep import AbstractSweep
 
@@ -18,6 +19,32 @@ class HouseholdSweep(AbstractSweep):
     exposed person is added to an infection queue.
 
     """
+    def __init__(self, aggregated: bool = False):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        aggregated : bool
+            Whether to combine the forces of infection of all infectors of
+            a household, and test one infection event per susceptible
+            member, instead of one per infector and susceptible member
+
+        """
+        self.aggregated = aggregated
+
+    def bind_population(self, population):
+        """Binds the population, and compiles the current parameters into
+        the :class:`SimulationConstants` used in the sweep.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+
+        """
+        super().bind_population(population)
+        self._constants = SimulationConstants()
+
     def __call__(self, time: float):
         """Given a population structure, loops over infected members
         and considers whether they infected household members based
@@ -29,11 +56,14 @@ class HouseholdSweep(AbstractSweep):
             Simulation time
 
         """
+        if self.aggregated:
+            self._aggregated_call(time)
+            return
+
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
         for cell in self._population.cells:
-            infectious_persons = filter(Person.is_infectious, cell.persons)
-            for infector in infectious_persons:
+            for infector in cell.infectors():
 
                 if infector.household is None:
                     raise AttributeError(f"{infector} is not part of a "
@@ -45,7 +75,7 @@ class HouseholdSweep(AbstractSweep):
                     # Calculate "force of infection" parameter which will
                     # determine the likelihood of an infection event.
                     force_of_infection = HouseholdInfection.household_foi(
-                        infector, infectee, time)
+                        infector, infectee, time, self._constants)
 
                     # Compare a uniform random number to the force of infection
                     # to see whether an infection event occurs in this timestep
@@ -53,3 +83,61 @@ class HouseholdSweep(AbstractSweep):
                     r = random.uniform(0, 1)
                     if r < force_of_infection:
                         cell.enqueue_person(infectee)
+
+    def _aggregated_call(self, time: float):
+        """Aggregated version of the sweep. The infectors of each household
+        are grouped, and each susceptible member is infected with the
+        probability that at least one infector would infect them in the
+        pairwise version of the sweep.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time
+
+        """
+        for cell in self._population.cells:
+            households = {}
+            for infector in cell.infectors():
+                if infector.household is None:
+                    raise AttributeError(f"{infector} is not part of a "
+                                         + "household")
+                households.setdefault(infector.household, []).append(infector)
+
+            for household, infectors in households.items():
+                infectees = list(household.susceptible_persons)
+                if len(infectees) == 0:
+                    continue
+                force_of_infection = HouseholdInfection.household_foi_matrix(
+                    infectors, infectees, time, self._constants)
+                probabilities = HouseholdSweep.infection_probabilities(
+                    force_of_infection)
+                r = np.random.random(len(infectees))
+                for infectee, infected in zip(infectees, r < probabilities):
+                    if infected:
+                        cell.enqueue_person(infectee)
+
+    @staticmethod
+    def infection_probabilities(force_of_infection: np.ndarray):
+        """Calculates the probability that each infectee is infected by at
+        least one infector, when each infector independently infects them
+        with probability given by the force of infection (clipped to the
+        unit interval), as in the pairwise sweep. The escape probability of
+        each infectee is the product of the escape probabilities from each
+        infector, computed as the exponential of a sum of logarithms.
+
+        Parameters
+        ----------
+        force_of_infection : np.ndarray
+            Forces of infection, indexed by [infector, infectee]
+
+        Returns
+        -------
+        np.ndarray
+            Probability of infection of each infectee
+
+        """
+        foi = np.clip(force_of_infection, 0, 1)
+        with np.errstate(divide='ignore'):
+            log_escape = np.log1p(-foi).sum(axis=0)
+        return 1 - np.exp(log_escape)
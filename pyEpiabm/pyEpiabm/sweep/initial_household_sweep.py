@@ -17,11 +17,22 @@ class InitialHouseholdSweep(AbstractSweep):
     model as CovidSim. For a discription of the analagous function
     in CovidSim see
     https://github.com/SABS-R3-Epidemiology/epiabm/wiki/Overview-of-the-Ferguson-Model.
+
+    In batch mode, households are grouped by size and candidate ages for
+    all one and two person households are drawn together as arrays, with
+    only the rejected entries redrawn. This gives the same distribution of
+    ages, but a different sequence of random numbers.
     """
 
-    def __init__(self):
+    def __init__(self, batch: bool = False):
         """Call in variables from the parameters file.
+
+        Parameters
+        ----------
+        batch : bool
+            Whether to assign household sizes and ages in batches
         """
+        self.batch = batch
 
         self.use_ages = Parameters.instance().use_ages
         self.household_size_distribution \
@@ -42,6 +53,15 @@ class InitialHouseholdSweep(AbstractSweep):
             Instance of Population class
         """
 
+        if self.batch:
+            for cell in population.cells:
+                for microcell in cell.microcells:
+                    sizes = self.household_sizes(len(microcell.persons))
+                    bounds = np.concatenate(([0], np.cumsum(sizes)))
+                    for k, m in zip(bounds[:-1], bounds[1:]):
+                        microcell.add_household(microcell.persons[k:m])
+            return
+
         for cell in population.cells:
             for microcell in cell.microcells:
                 k = 0  # Counter of people with allocated household in mcell
@@ -68,6 +88,199 @@ class InitialHouseholdSweep(AbstractSweep):
                     microcell.add_household(people_in_household)
                     k += m
 
+    def household_sizes(self, num_people: int) -> np.ndarray:
+        """Method that draws the sizes of the households for the given
+        number of people from the household size distribution, in one
+        batch. Sizes are limited by the maximum household size, and the
+        last household is cut short to the number of people left.
+
+        Parameters
+        ----------
+        num_people : int
+            Number of people to assign to households
+
+        Returns
+        -------
+        np.ndarray
+            Array of household sizes, summing to the number of people
+
+        """
+        if num_people <= 0:
+            return np.zeros(0, dtype=int)
+        # There are at most as many households as people
+        cumulative = np.cumsum(self.household_size_distribution)
+        sizes = np.searchsorted(cumulative, np.random.random(num_people),
+                                side='left') + 1
+        sizes = np.minimum(sizes, self.max_household_size)
+        ends = np.cumsum(sizes)
+        num_households = np.searchsorted(ends, num_people, side='left') + 1
+        sizes = sizes[:num_households]
+        sizes[-1] -= ends[num_households - 1] - num_people
+        return sizes
+
+    def random_ages(self, size: int) -> np.ndarray:
+        """Method that draws random ages from the age distribution, in
+        the same way as :meth:`Person.set_random_age`.
+
+        Parameters
+        ----------
+        size : int
+            Number of ages to draw
+
+        Returns
+        -------
+        np.ndarray
+            Array of ages
+
+        """
+        probs = np.asarray(self.age_proportions, dtype=float)
+        age_groups = np.random.choice(self.num_age_groups, size=size,
+                                      p=probs / probs.sum())
+        return (np.random.randint(0, self.age_group_width, size=size)
+                + self.age_group_width * age_groups)
+
+    def sample_ages(self, size: int, accept) -> np.ndarray:
+        """Method that draws random ages for a batch of people, redrawing
+        the ages which are rejected until all are accepted.
+
+        Parameters
+        ----------
+        size : int
+            Number of ages to draw
+        accept : typing.Callable[[np.ndarray, np.ndarray], np.ndarray]
+            Function taking candidate ages and the indices they are drawn
+            for, and returning a boolean mask of the accepted ages
+
+        Returns
+        -------
+        np.ndarray
+            Array of accepted ages
+
+        """
+        ages = np.zeros(size, dtype=int)
+        pending = np.arange(size)
+        while len(pending) > 0:
+            ages[pending] = self.random_ages(len(pending))
+            pending = pending[~accept(ages[pending], pending)]
+        return ages
+
+    def _old_age_accepted(self, ages: np.ndarray) -> np.ndarray:
+        """Acceptance condition for an elderly person living without
+        children.
+
+        """
+        break_ratio = ((ages - self.age_params["no_child_pers_age"] + 1)
+                       / (self.age_params["old_pers_age"]
+                          - self.age_params["no_child_pers_age"] + 1))
+        return ((ages >= self.age_params["no_child_pers_age"])
+                & (np.random.random(len(ages)) <= break_ratio))
+
+    def _young_age_accepted(self, ages: np.ndarray) -> np.ndarray:
+        """Acceptance condition for a young adult without children.
+
+        """
+        break_ratio = (1 - self.age_params["young_and_single_slope"]
+                       * ((ages - self.age_params["min_adult_age"])
+                          / (self.age_params["young_and_single"]
+                             - self.age_params["min_adult_age"])))
+        return ((ages <= self.age_params["young_and_single"])
+                & (ages >= self.age_params["min_adult_age"])
+                & (np.random.random(len(ages)) <= break_ratio))
+
+    def _partner_age_accepted(self, ages: np.ndarray,
+                              partner_ages: np.ndarray) -> np.ndarray:
+        """Acceptance condition for the partner of a person of the given
+        ages.
+
+        """
+        return ((ages <= partner_ages
+                 + self.age_params["max_MF_partner_age_gap"])
+                & (ages >= partner_ages
+                   - self.age_params["max_FM_partner_age_gap"]))
+
+    def one_person_household_ages_batch(self, people: list):
+        """Method that assigns ages to the people in a batch of one
+        person households, with the same conditions as
+        :meth:`one_person_household_age`.
+
+        Parameters
+        ----------
+        people : list
+            List of the people living alone
+
+        """
+        r = np.random.random(len(people))
+        old = r < self.age_params["one_pers_house_prob_old"]
+        young = (~old & (self.age_params["one_pers_house_prob_young"] > 0)
+                 & (r - self.age_params["one_pers_house_prob_old"]
+                    < self.age_params["one_pers_house_prob_young"]))
+
+        def accept(ages, index):
+            return np.where(old[index], self._old_age_accepted(ages),
+                            np.where(young[index],
+                                     self._young_age_accepted(ages),
+                                     ages >= self.age_params["min_adult_age"]))
+
+        self._set_ages(people, self.sample_ages(len(people), accept))
+
+    def two_person_household_ages_batch(self, households: list):
+        """Method that assigns ages to the people in a batch of two
+        person households, with the same conditions as
+        :meth:`two_person_household_ages`.
+
+        Parameters
+        ----------
+        households : list
+            List of the lists of two people in each household
+
+        """
+        assert all(len(people) == 2 for people in households), \
+               'Only lists of two people should be passed to this method'
+        r = np.random.random(len(households))
+        old = r < self.age_params["two_pers_house_prob_old"]
+        r = r - self.age_params["two_pers_house_prob_old"]
+        child = (~old & (self.age_params["one_child_two_pers_prob"] > 0)
+                 & (r < self.age_params["one_child_two_pers_prob"]))
+        r = r - self.age_params["one_child_two_pers_prob"]
+        young = (~old & ~child
+                 & (self.age_params["two_pers_house_prob_young"] > 0)
+                 & (r < self.age_params["two_pers_house_prob_young"]))
+        adult = self.age_params["min_adult_age"]
+
+        def accept_first(ages, index):
+            return np.select(
+                [old[index], child[index], young[index]],
+                [self._old_age_accepted(ages),
+                 ages <= self.age_params["max_child_age"],
+                 self._young_age_accepted(ages)],
+                ages >= adult)
+        first_ages = self.sample_ages(len(households), accept_first)
+
+        def accept_second(ages, index):
+            partner = self._partner_age_accepted(ages, first_ages[index])
+            parent = ((ages <= first_ages[index]
+                       + self.age_params["max_parent_age_gap"])
+                      & (ages >= first_ages[index]
+                         + self.age_params["min_parent_age_gap"])
+                      & (ages >= adult))
+            return np.select(
+                [old[index], child[index]],
+                [partner & self._old_age_accepted(ages), parent],
+                partner & (ages >= adult))
+        second_ages = self.sample_ages(len(households), accept_second)
+
+        self._set_ages([people[0] for people in households], first_ages)
+        self._set_ages([people[1] for people in households], second_ages)
+
+    def _set_ages(self, people: list, ages: np.ndarray):
+        """Sets the ages, and corresponding age groups, of the given
+        people.
+
+        """
+        for person, age in zip(people, ages.tolist()):
+            person.age = age
+            person.age_group = age // self.age_group_width
+
     def one_person_household_age(self, person: Person):
         """Method that assigns an age to the person
         in a one person household. A random number is first drawn
@@ -430,12 +643,18 @@ class InitialHouseholdSweep(AbstractSweep):
         # If ages need to be set call method to assign
         # ages of people in households
         if self.use_ages:
+            if self.batch:
+                self._batch_household_ages()
             for cell in self._population.cells:
                 cell.compartment_counter.clear_counter()
                 for microcell in cell.microcells:
                     microcell.compartment_counter.clear_counter()
                     for household in microcell.households:
-                        if len(household.persons) == 1:
+                        if self.batch and 0 < len(household.persons) < 3:
+                            # Ages already assigned in batches
+                            pass
+
+                        elif len(household.persons) == 1:
                             self.one_person_household_age(household.persons[0])
 
                         elif len(household.persons) == 2:
@@ -456,3 +675,17 @@ class InitialHouseholdSweep(AbstractSweep):
                                 _increment_compartment(1, status, age_group)
                             person.microcell.cell.compartment_counter.\
                                 _increment_compartment(1, status, age_group)
+
+    def _batch_household_ages(self):
+        """Assigns ages to the people in all one and two person households
+        of the population, in one batch for each household size.
+
+        """
+        households = [household.persons
+                      for cell in self._population.cells
+                      for microcell in cell.microcells
+                      for household in microcell.households]
+        self.one_person_household_ages_batch(
+            [people[0] for people in households if len(people) == 1])
+        self.two_person_household_ages_batch(
+            [people for people in households if len(people) == 2])
@@ -54,10 +54,8 @@ class InitialInfectedSweep(AbstractSweep):
 
         # Checks whether there are enough susceptible people to infect.
         status = InfectionStatus.Susceptible
-        num_susceptible = 0
-        for cell in self._population.cells:
-            num_susceptible = num_susceptible + \
-                sum(cell.compartment_counter.retrieve()[status])
+        num_susceptible = sum(
+            self._population.compartment_counter.retrieve()[status])
 
         if num_susceptible < sim_params["initial_infected_number"]:
             raise ValueError('There are not enough susceptible people in the \
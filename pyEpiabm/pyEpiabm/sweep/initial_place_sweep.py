@@ -2,6 +2,8 @@
 # Sweep to initialise people present in a place
 #
 
+import numpy as np
+
 from pyEpiabm.core import Parameters
 
 from .abstract_sweep import AbstractSweep
@@ -36,6 +38,8 @@ class InitialisePlaceSweep(AbstractSweep):
         params = Parameters.instance().place_params
         schools = ["PrimarySchool", "SecondarySchool", "SixthForm"]
         for cell in self._population.cells:
+            # Ages may have changed since the index was last built
+            cell.build_age_index()
             for place in cell.places:
                 param_ind = place.place_type.value - 1
                 if param_ind < len(params["mean_size"]):
@@ -122,22 +126,21 @@ class InitialisePlaceSweep(AbstractSweep):
         prop = [params["age_group1_prop"][param_ind],
                 params["age_group2_prop"][param_ind],
                 params["age_group3_prop"][param_ind]]
-        person_list = []
-        weights = []
-        for person in place.cell.persons:
-            if (place.place_type in person.place_types):
-                # People can't have more than one place of each type.
-                continue
-
-            if not Parameters.instance().use_ages:
-                person_list.append(person)
-                weights.append(prop[2])  # Add everyone to adult group
-            else:
-                for i in range(3):
-                    if (person.age > (min_age[i]-1)
-                            and person.age < max_age[i]):
-                        # Assumes age groups are distinct and integers.
-                        person_list.append(person)
-                        weights.append(prop[i])
-                        break
+        # Positions of the people in each age group, where the first
+        # matching group is used if groups overlap
+        cell = place.cell
+        if not Parameters.instance().use_ages:
+            # Add everyone to adult group
+            positions = cell.persons_in_age_range(
+                exclude_place_type=place.place_type)
+            groups = np.full(len(positions), 2)
+        else:
+            group_positions = [cell.persons_in_age_range(
+                min_age[i], max_age[i], place.place_type) for i in range(3)]
+            positions = np.concatenate(group_positions)
+            groups = np.repeat(np.arange(3), list(map(len, group_positions)))
+            positions, first = np.unique(positions, return_index=True)
+            groups = groups[first]
+        person_list = [cell.persons[i] for i in positions]
+        weights = np.asarray(prop, dtype=float)[groups].tolist()
         return person_list, weights
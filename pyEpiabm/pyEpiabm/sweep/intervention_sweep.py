@@ -28,13 +28,25 @@ class InterventionSweep(AbstractSweep):
 
     """
 
-    def __init__(self):
+    def __init__(self, fused: bool = False):
         """Read in variables from the parameters file
 
+        Parameters
+        ----------
+        fused : bool
+            If True, all active interventions which provide a cell,
+            microcell or person kernel (see
+            :class:`AbstractIntervention`) are applied in a single pass
+            over the population, instead of each intervention walking
+            the whole population in turn. The interventions then draw
+            their random numbers in a different order, so results
+            differ from the default mode for a given seed
+
         """
         # Implemented interventions and their activity status
         self.intervention_active_status = {}
         self.intervention_params = Parameters.instance().intervention_params
+        self.fused = fused
 
     def bind_population(self, population):
         self._population = population
@@ -60,17 +72,23 @@ class InterventionSweep(AbstractSweep):
             Simulation time
 
         """
-        for intervention in self.intervention_active_status.keys():
-            # TODO:
-            # - Include an alternative way of case-count.
-            #   Idealy this will be a global parameter that we can plot
-            # - Include condition on ICU
-            #   Intervention will be activated based on time and cases now.
-            #   We would like to implement a threshold based on ICU numbers.
-            num_cases = sum(map(lambda cell: cell.number_infectious(),
+        # TODO:
+        # - Include an alternative way of case-count.
+        #   Idealy this will be a global parameter that we can plot
+        # - Include condition on ICU
+        #   Intervention will be activated based on time and cases now.
+        #   We would like to implement a threshold based on ICU numbers.
+        # Interventions do not change infection statuses, so the number of
+        # cases is the same for all interventions in this time step
+        num_cases = sum(map(lambda cell: cell.number_infectious(),
                             self._population.cells))
+        active_interventions = []
+        for intervention in self.intervention_active_status.keys():
             if intervention.is_active(time, num_cases):
-                intervention(time)
+                if self.fused:
+                    active_interventions.append(intervention)
+                else:
+                    intervention(time)
                 if self.intervention_active_status[intervention] is False:
                     self.intervention_active_status[intervention] = True
 
@@ -78,3 +96,47 @@ class InterventionSweep(AbstractSweep):
                 # turn off intervention
                 self.intervention_active_status[intervention] = False
                 intervention.turn_off()
+
+        if self.fused:
+            self.fused_call(time, active_interventions)
+
+    def fused_call(self, time, interventions):
+        """Apply the given interventions in a single pass over the cells,
+        microcells and persons of the population. In each cell the cell
+        kernels are applied first, then for each microcell its microcell
+        kernels followed by the person kernels of each of its persons.
+        Kernels at the same level are applied in the order the
+        interventions are given, after the windows of each intervention
+        which have ended are expired. Interventions without a kernel are
+        run in full before the pass.
+
+        Parameters
+        ----------
+        time : float
+            Simulation time
+        interventions : list
+            List of interventions to apply
+
+        """
+        kernels = {'cell': [], 'microcell': [], 'person': []}
+        for intervention in interventions:
+            if intervention.kernel_level is None:
+                intervention(time)
+            else:
+                intervention.expire(time)
+                kernels[intervention.kernel_level].append(getattr(
+                    intervention, intervention.kernel_level + '_kernel'))
+        if not any(kernels.values()):
+            return
+
+        for cell in self._population.cells:
+            for kernel in kernels['cell']:
+                kernel(time, cell)
+            if not (kernels['microcell'] or kernels['person']):
+                continue
+            for microcell in cell.microcells:
+                for kernel in kernels['microcell']:
+                    kernel(time, microcell)
+                for person in microcell.persons:
+                    for kernel in kernels['person']:
+                        kernel(time, person)
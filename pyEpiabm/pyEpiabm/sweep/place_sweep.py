@@ -5,6 +5,7 @@
 import random
 import numpy as np
 
+from pyEpiabm.core import SimulationConstants
 from pyEpiabm.property import PlaceInfection
 
 from .abstract_sweep import AbstractSweep
@@ -18,6 +19,19 @@ class PlaceSweep(AbstractSweep):
     exposed person is added to an infection queue.
 
     """
+    def bind_population(self, population):
+        """Binds the population, and compiles the current parameters into
+        the :class:`SimulationConstants` used in the sweep.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+
+        """
+        super().bind_population(population)
+        self._constants = SimulationConstants()
+
     def __call__(self, time: float):
         """
         Given a population structure with places, loops over infected
@@ -34,14 +48,10 @@ class PlaceSweep(AbstractSweep):
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
         for cell in self._population.cells:
-            for infector in cell.persons:
-                if not infector.is_infectious():
-                    continue
-                place_list = [i[0] for i in infector.places]
-                for place in place_list:
-                    infector_group = place.get_group_index(infector)
-                    infectiousness = PlaceInfection.place_inf(place, infector,
-                                                              time)
+            for infector in cell.infectors():
+                for place, infector_group in infector.places.items():
+                    infectiousness = PlaceInfection.place_inf(
+                        place, infector, time, self._constants)
                     # Covidsim only considers infectees in
                     # the group with the infector. I suggest we use this line
                     # to easily change the list of possible infectees.
@@ -67,7 +77,7 @@ class PlaceSweep(AbstractSweep):
                         # Pick that number of potential infectees from place
                         # members.
                         potential_infectees = random.sample(
-                            possible_infectees, num_infectees)
+                            list(possible_infectees), num_infectees)
 
                         # Check to see whether a place member is susceptible.
                         for infectee in potential_infectees:
@@ -81,7 +91,7 @@ class PlaceSweep(AbstractSweep):
 
                             force_of_infection = PlaceInfection.\
                                 place_foi(place, infector, infectee,
-                                          time)
+                                          time, self._constants)
 
                             # Compare a uniform random number to the force of
                             # infection to see whether an infection event
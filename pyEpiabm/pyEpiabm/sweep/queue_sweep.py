@@ -1,7 +1,6 @@
 #
 # Sweeps for enqueued persons to update infection status
 #
-import random
 import numpy as np
 
 from pyEpiabm.core import Parameters
@@ -25,29 +24,39 @@ class QueueSweep(AbstractSweep):
             Simulation time
 
         """
+        vacc_params = None
         for cell in self._population.cells:
-            while not cell.person_queue.empty():
-                person = cell.person_queue.get()
-                # Get takes person from the queue and removes them, so clears
-                # the queue for the next timestep.
-                # Update the infection status
-                if person.is_vaccinated:
-                    vacc_params = Parameters.instance().\
-                        intervention_params['vaccine_params']
-                    delay = np.random.poisson(vacc_params['time_to_efficacy'],
-                                              1)
-                    if time > (person.date_vaccinated +
-                               delay):
-                        r = random.random()
-                        if r < vacc_params['vacc_protectiveness']:
-                            person.next_infection_status = InfectionStatus.\
-                                Vaccinated
-                        else:
-                            person.next_infection_status = InfectionStatus.\
-                                Exposed
-                    else:
-                        person.next_infection_status = InfectionStatus.Exposed
-                else:
-                    person.next_infection_status = InfectionStatus.Exposed
-
-                person.time_of_status_change = time
+            # Draining the queue clears it for the next timestep.
+            people = cell.person_queue.drain()
+            if len(people) == 0:
+                continue
+            # People are processed in bulk, by the store holding their data
+            rows_by_store = {}
+            for person in people:
+                store, row = person.store_row
+                rows_by_store.setdefault(store, []).append(row)
+            for store, rows in rows_by_store.items():
+                rows = np.array(rows, dtype=int)
+                next_status = np.full(len(rows),
+                                      InfectionStatus.Exposed.value,
+                                      dtype=store.next_infection_status.dtype)
+
+                vaccinated = np.flatnonzero(store.is_vaccinated[rows])
+                if len(vaccinated) > 0:
+                    if vacc_params is None:
+                        vacc_params = Parameters.instance().\
+                            intervention_params['vaccine_params']
+                    delays = np.random.poisson(
+                        vacc_params['time_to_efficacy'], len(vaccinated))
+                    protected = (
+                        (time > store.date_vaccinated[rows[vaccinated]]
+                         + delays)
+                        & (np.random.random(len(vaccinated))
+                           < vacc_params['vacc_protectiveness']))
+                    next_status[vaccinated[protected]] = \
+                        InfectionStatus.Vaccinated.value
+
+                store.next_infection_status[rows] = next_status
+                store.time_of_status_change[rows] = time
+                for row in rows.tolist():
+                    store.schedule(row, time)
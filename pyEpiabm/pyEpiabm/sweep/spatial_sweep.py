@@ -8,9 +8,10 @@ import numpy as np
 import logging
 import typing
 
-from pyEpiabm.core import Cell, Parameters, Person
+from pyEpiabm.core import Cell, Parameters, Person, SimulationConstants
 from pyEpiabm.property import InfectionStatus, SpatialInfection
-from pyEpiabm.utility import DistanceFunctions, SpatialKernel
+from pyEpiabm.utility import DistanceFunctions, SpatialIndex, \
+    SpatialKernel
 
 from .abstract_sweep import AbstractSweep
 
@@ -48,59 +49,75 @@ class SpatialSweep(AbstractSweep):
         # break immediately to save time.
         if Parameters.instance().infection_radius == 0:
             return
+        # Susceptibles per cell do not change during the sweep, as new
+        # infections are only queued here.
+        susceptibles = self._susceptible_counts()
+        total_susceptibles = susceptibles.sum()
         # Double loop over the whole population, checking infectiousness
         # status, and whether they are absent from their household.
-        for cell in self._population.cells:
+        for cell_index, cell in enumerate(self._population.cells):
             # Check to ensure there is an infector in the cell
             total_infectors = cell.number_infectious()
             if total_infectors == 0:
                 continue
-            # Creates a list of possible infectee cells which excludes the
-            # infector cell.
-            poss_susc_cells = self._population.cells.copy()
-            poss_susc_cells.remove(cell)
-            possible_infectee_num = sum([sum(cell2.compartment_counter
-                                        .retrieve()[InfectionStatus
-                                                    .Susceptible])
-                                        for cell2 in poss_susc_cells])
+            # Number of possible infectees, outside the infector cell.
+            possible_infectee_num = (total_susceptibles
+                                     - susceptibles[cell_index])
             if possible_infectee_num == 0:
                 # Break the loop if no people outside the cell are susceptible.
                 continue
             # If there are any infectors calculate number of infection events
             # given out in total by the cell
-            ave_num_of_infections = SpatialInfection.cell_inf(cell, time)
+            ave_num_of_infections = SpatialInfection.cell_inf(
+                cell, time, self._constants)
             number_to_infect = np.random.poisson(ave_num_of_infections)
 
             # Sample at random from the cell to find an infector. Have
             # checked to ensure there is an infector present.
-            possible_infectors = [person for person in cell.persons
-                                  if person.is_infectious()]
-            infector = random.choice(possible_infectors)
+            infector = random.choice(cell.infectors())
 
             if Parameters.instance().do_CovidSim:
-                infectee_list = self.find_infectees_Covidsim(infector,
-                                                             poss_susc_cells,
-                                                             number_to_infect)
+                infectee_list = self.find_infectees_Covidsim(infector, None,
+                                                             number_to_infect,
+                                                             susceptibles)
             else:
-                infectee_list = self.find_infectees(cell,
-                                                    poss_susc_cells,
+                infectee_list = self.find_infectees(cell, None,
                                                     number_to_infect)
             for infectee in infectee_list:
                 self.do_infection_event(infector, infectee, time)
 
+    def _susceptible_counts(self) -> np.ndarray:
+        """Returns the number of susceptible people in each cell of the
+        population, in the order of the population's cells.
+
+        Returns
+        -------
+        np.ndarray
+            Array of susceptible counts per cell
+
+        """
+        return np.array([cell.compartment_counter.retrieve()
+                         [InfectionStatus.Susceptible].sum()
+                         for cell in self._population.cells])
+
     def find_infectees(self, infector_cell: Cell,
-                       possible_infectee_cells: typing.List[Cell],
+                       possible_infectee_cells: typing.Optional[
+                           typing.List[Cell]],
                        number_to_infect: int):
         """Given a specific infector, a list of possible infectee cells,
         and the number of people needed to infect, follows a distance based
-        implementation to create a list of infectees.
+        implementation to create a list of infectees. Infectee cells are
+        chosen among the neighbours of the infector cell, weighted by the
+        inverse of their distance, using the index built when binding the
+        population.
 
         Parameters
         ----------
         infector_cell : Cell
             Infector cell instance of Cell
         possible_infectee_cells : typing.List[Cell]
-            List of possible cells to infect
+            List of possible cells to infect. If None, all neighbouring
+            cells may be infected
         number_to_infect : int
             maximum number of people to infect
 
@@ -114,25 +131,30 @@ class SpatialSweep(AbstractSweep):
         # Chooses a list of cells (with replacement) for each infection
         # event to occur in.
         # Specifically inter-cell infections so can't be the same cell.
-        distance_weights = []
         # Use of the cutoff distance idea from CovidSim.
         cutoff = Parameters.instance().infection_radius
-        # Will catch the case if distance weights isn't configured
-        # correctly and returns the wrong length.
-        actual_infectee_cells = []
-        for cell2 in possible_infectee_cells:
-            if cell2.id in infector_cell.nearby_cells.keys():
-                distance_weights.append(
-                    1/infector_cell.nearby_cells.get(cell2.id))
-                actual_infectee_cells.append(cell2)
+        row = self._cell_index[infector_cell.id]
+        start = self._neighbour_ptr[row]
+        end = self._neighbour_ptr[row + 1]
+        neighbours = self._neighbour_indices[start:end]
+        if possible_infectee_cells is None:
+            cum_weights = self._neighbour_cum_weights[start:end]
+        else:
+            allowed = [self._cell_index[cell2.id]
+                       for cell2 in possible_infectee_cells
+                       if cell2.id in self._cell_index]
+            keep = np.isin(neighbours, allowed)
+            neighbours = neighbours[keep]
+            cum_weights = np.cumsum(self._neighbour_weights[start:end][keep])
 
         try:
             # Will catch a list of zeros
-            if sum(distance_weights) == 0:
+            if len(cum_weights) == 0 or cum_weights[-1] == 0:
                 raise ValueError
-            cell_list = random.choices(actual_infectee_cells,
-                                       weights=distance_weights,
-                                       k=number_to_infect)
+            cells = self._population.cells
+            cell_list = [cells[index] for index in random.choices(
+                neighbours.tolist(), cum_weights=cum_weights.tolist(),
+                k=number_to_infect)]
         except ValueError as e:
             logging.exception(f"{type(e).__name__}: no cells"
                               + f" within radius {cutoff} of"
@@ -150,20 +172,29 @@ class SpatialSweep(AbstractSweep):
         return infectee_list
 
     def find_infectees_Covidsim(self, infector: Person,
-                                possible_infectee_cells: typing.List[Cell],
-                                number_to_infect: int):
+                                possible_infectee_cells: typing.Optional[
+                                    typing.List[Cell]],
+                                number_to_infect: int,
+                                susceptibles: np.ndarray = None):
         """Given a specific infector, a list of possible infectee cells,
         and the number of people needed to infect, follows Covidsim's
-        implementation to create a list of infectees.
+        implementation to create a list of infectees. The spatial kernel
+        between cells within the infection radius is cached when binding
+        the population, so cells are weighted by the cached kernel times
+        their number of susceptibles.
 
         Parameters
         ----------
         infector : Person
             Infector instance of person
         possible_infectee_cells : typing.List[Cell]
-            List of possible cells to infect
+            List of possible cells to infect. If None, all cells within
+            the infection radius may be infected
         number_to_infect : int
             Maximum number of people to infect
+        susceptibles : np.ndarray
+            Number of susceptible people in each cell of the population.
+            Counted from the cells if not given
 
         Returns
         -------
@@ -173,21 +204,43 @@ class SpatialSweep(AbstractSweep):
         """
         current_cell = infector.microcell.cell
         infectee_list = []
+        if self._neighbour_acceptance is None:
+            self._cache_kernels()
+        if susceptibles is None:
+            susceptibles = self._susceptible_counts()
+
+        row = self._cell_index[current_cell.id]
+        start = self._neighbour_ptr[row]
+        end = self._neighbour_ptr[row + 1]
+        neighbours = self._neighbour_indices[start:end]
+        kernels = self._neighbour_kernels[start:end]
+        acceptance = self._neighbour_acceptance[start:end]
+        if possible_infectee_cells is not None:
+            allowed = [self._cell_index[cell2.id]
+                       for cell2 in possible_infectee_cells
+                       if cell2.id in self._cell_index]
+            keep = np.isin(neighbours, allowed)
+            neighbours = neighbours[keep]
+            kernels = kernels[keep]
+            acceptance = acceptance[keep]
+
+        # Weighting for cell choice in Covidsim uses cum_trans and
+        # invCDF arrays, which are equivalent to weighting by total
+        # susceptibles*max_transmission. May want to add transmission
+        # parameter later. Susceptibles do not change during the sweep.
+        cum_weights = np.cumsum(kernels * susceptibles[neighbours]).tolist()
+        if len(cum_weights) == 0 or cum_weights[-1] <= 0:
+            return infectee_list
+        positions = range(len(cum_weights))
+
+        cells = self._population.cells
+        total_people = self._population.total_people()
         count = 0
-        while number_to_infect > 0 and count < self._population.total_people():
+        while number_to_infect > 0 and count < total_people:
             count += 1
-            # Weighting for cell choice in Covidsim uses cum_trans and
-            # invCDF arrays, which are equivalent to weighting by total
-            # susceptibles*max_transmission. May want to add transmission
-            # parameter later
-            weights = [sum(cell2.compartment_counter.retrieve()
-                       [InfectionStatus.Susceptible]) * SpatialKernel
-                       .weighting(DistanceFunctions.dist(cell2.location,
-                                                         current_cell
-                                                         .location))
-                       for cell2 in possible_infectee_cells]
-            infectee_cell = random.choices(possible_infectee_cells,
-                                           weights=weights, k=1)[0]
+            position = random.choices(positions, cum_weights=cum_weights,
+                                      k=1)[0]
+            infectee_cell = cells[neighbours[position]]
             # Sample at random from the infectee cell to find
             # an infectee
             infectee = random.sample(infectee_cell.persons, 1)[0]
@@ -195,13 +248,7 @@ class SpatialSweep(AbstractSweep):
             # of the spatial kernel applied to the distance between people
             # to the spatial kernel of the shortest distance between
             # their cells.
-            infection_distance = DistanceFunctions.dist(
-                infector.microcell.cell.location, infectee_cell.location)
-            minimum_dist = DistanceFunctions.minimum_between_cells(
-                infectee_cell, current_cell)
-            infection_kernel = (SpatialKernel.weighting(infection_distance) /
-                                SpatialKernel.weighting(minimum_dist))
-            if (infection_kernel > random.random()):
+            if (acceptance[position] > random.random()):
                 # Covidsim rejects the infection event if the distance
                 # between infector/infectee is too large.
                 infectee_list.append(infectee)
@@ -211,6 +258,29 @@ class SpatialSweep(AbstractSweep):
                 # total population.
         return infectee_list
 
+    def _cache_kernels(self):
+        """Caches, for each pair of neighbouring cells in the neighbour
+        index, the spatial kernel of the distance between the cells and
+        the ratio of this kernel to the kernel of the minimum distance
+        between their microcells, used to accept infection events.
+
+        """
+        cells = self._population.cells
+        distances = 1 / self._neighbour_weights
+        self._neighbour_kernels = SpatialKernel.weighting(distances)
+        min_kernels = np.zeros(len(distances))
+        for row, cell in enumerate(cells):
+            for k in range(self._neighbour_ptr[row],
+                           self._neighbour_ptr[row + 1]):
+                min_kernels[k] = SpatialKernel.weighting(
+                    DistanceFunctions.minimum_between_cells(
+                        cells[self._neighbour_indices[k]], cell))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            acceptance = self._neighbour_kernels / min_kernels
+        # Cells without microcells have no one to infect
+        acceptance[~np.isfinite(acceptance)] = 0
+        self._neighbour_acceptance = acceptance
+
     def do_infection_event(self, infector: Person, infectee: Person,
                            time: float):
         """Helper function which takes an infector and infectee,
@@ -239,7 +309,7 @@ class SpatialSweep(AbstractSweep):
         # involved in the infection event
         force_of_infection = SpatialInfection.\
             spatial_foi(infector.microcell.cell, infectee.microcell.cell,
-                        infector, infectee, time)
+                        infector, infectee, time, self._constants)
 
         # Compare a uniform random number to the force of
         # infection to see whether an infection event
@@ -250,7 +320,52 @@ class SpatialSweep(AbstractSweep):
             infectee.microcell.cell.enqueue_person(infectee)
 
     def bind_population(self, population):
+        """Binds the population, finds the nearby cells of each cell and
+        builds the neighbour index used to choose infectee cells. The
+        index is in compressed sparse row form: the neighbours of the
+        cell at position i in the population are
+        `_neighbour_indices[_neighbour_ptr[i]:_neighbour_ptr[i + 1]]`,
+        with weights given by the inverse of their distance. If the
+        CovidSim mode is used, the spatial kernels between neighbouring
+        cells are cached too. The current parameters are compiled into the
+        :class:`SimulationConstants` used in the sweep.
+
+        Parameters
+        ----------
+        population : Population
+            Population to bind
+
+        """
         super().bind_population(population)
+        self._constants = SimulationConstants()
+        index = SpatialIndex([cell.location for cell in population.cells],
+                             Parameters.instance().infection_radius)
         for cell in population.cells:
-            other_cells = [x for x in population.cells if x != cell]
-            cell.find_nearby_cells(other_cells)
+            cell.find_nearby_cells(population.cells, index)
+
+        self._cell_index = {cell.id: i
+                            for i, cell in enumerate(population.cells)}
+        pointers = [0]
+        indices = []
+        distances = []
+        for cell in population.cells:
+            for cell_id, distance in cell.nearby_cells.items():
+                if cell_id in self._cell_index:
+                    indices.append(self._cell_index[cell_id])
+                    distances.append(distance)
+            pointers.append(len(indices))
+        self._neighbour_ptr = np.array(pointers, dtype=int)
+        self._neighbour_indices = np.array(indices, dtype=int)
+        with np.errstate(divide='ignore'):
+            self._neighbour_weights = 1 / np.array(distances, dtype=float)
+        # Cumulative weights restart for each cell's neighbours
+        self._neighbour_cum_weights = np.zeros(len(indices))
+        for start, end in zip(pointers[:-1], pointers[1:]):
+            self._neighbour_cum_weights[start:end] = np.cumsum(
+                self._neighbour_weights[start:end])
+
+        # Kernels used in the CovidSim mode, cached now if it is used
+        self._neighbour_kernels = None
+        self._neighbour_acceptance = None
+        if Parameters.instance().do_CovidSim:
+            self._cache_kernels()
@@ -134,6 +134,48 @@ class StateTransitionMatrix:
         column = next_infection_status_column.name
         self.matrix.loc[row, column] = new_probability
 
+    @staticmethod
+    def compile(matrix: pd.DataFrame, nb_age_groups: int = 1) -> np.ndarray:
+        """Converts a state transition matrix into a dense array of
+        cumulative transition probabilities, for use when drawing the next
+        infection status of many people at once. Age dependent entries are
+        expanded over the age groups, and each row is normalised by its
+        total. Rows with no possible transitions are left at zero.
+
+        Parameters
+        ----------
+        matrix : pd.DataFrame
+            State transition matrix, as built by this class
+        nb_age_groups : int
+            Number of age groups to expand age dependent entries over
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (age group, current status, next status), where
+            the element [a, i, j] is the probability that someone in age
+            group a moves from status i to any status up to and including j
+
+        """
+        nb_states = len(InfectionStatus)
+        if matrix.shape != (nb_states, nb_states):
+            raise ValueError('Matrix dimensions must match number of'
+                             + ' infection states')
+        weights = np.zeros((nb_age_groups, nb_states, nb_states))
+        for i, row in enumerate(matrix.to_numpy()):
+            for j, entry in enumerate(row):
+                entry = np.asarray(entry, dtype=float)
+                if entry.ndim == 0:
+                    weights[:, i, j] = entry
+                else:
+                    weights[:, i, j] = entry[:nb_age_groups]
+        cumulative = np.cumsum(weights, axis=2)
+        # Normalised by the last cumulative entry, rather than a separately
+        # summed total, so that each row ends at exactly one
+        totals = cumulative[:, :, -1:].copy()
+        np.divide(cumulative, totals, out=cumulative, where=totals > 0)
+        return cumulative
+
     def remove_age_dependence(self):
         """Conducts weighted average over age groups to remove age dependence
         in the state transition matrix.
@@ -223,6 +265,42 @@ class TransitionTimeMatrix:
                        pe.Parameters.instance().icurecov_to_recov)
         return matrix
 
+    @staticmethod
+    def compile(matrix: pd.DataFrame):
+        """Converts a transition time matrix into arrays indexed by the
+        values of the infection statuses, for use when drawing the
+        transition times of many people at once.
+
+        Parameters
+        ----------
+        matrix : pd.DataFrame
+            Transition time matrix, as built by this class
+
+        Returns
+        -------
+        np.ndarray
+            Array of fixed transition times indexed by [current status,
+            next status], which is NaN where the transition time is drawn
+            from an :class:`InverseCdf`. Transitions which are not expected
+            to happen keep their value of -1.0
+        np.ndarray
+            Object array of the :class:`InverseCdf` of each transition,
+            indexed by [current status, next status], which is None where
+            the transition time is fixed
+
+        """
+        nb_states = len(InfectionStatus)
+        entries = matrix.to_numpy()
+        fixed = np.full((nb_states, nb_states), np.nan)
+        icdfs = np.full((nb_states, nb_states), None, dtype=object)
+        for i in range(nb_states):
+            for j in range(nb_states):
+                if isinstance(entries[i, j], InverseCdf):
+                    icdfs[i, j] = entries[i, j]
+                else:
+                    fixed[i, j] = entries[i, j]
+        return fixed, icdfs
+
     def update_transition_time_with_float(
                         self,
                         current_infection_status_row: InfectionStatus,
@@ -8,6 +8,7 @@ import numpy as np
 import logging
 
 from pyEpiabm.core import Parameters
+from pyEpiabm.property import PlaceType
 
 from .abstract_sweep import AbstractSweep
 
@@ -43,13 +44,12 @@ class UpdatePlaceSweep(AbstractSweep):
                     # Variable population is people not in the fixed pop.
                     # Held in the last group of the place.
                     # Changed at each timestep
+                    # Current members are excluded when sampling.
                     group_ind = list(place.person_groups.keys())[-1]
                     place.empty_place(groups_to_empty=[group_ind])
-                    person_list = [person for person in place.cell.persons
-                                   if person not in place.persons]
                     self.update_place_group(place, group_index=group_ind,
                                             mean_capacity=mean_cap,
-                                            person_list=person_list.copy())
+                                            person_list=place.cell.persons)
 
                 elif place.place_type.name == "OutdoorSpace":
                     place.empty_place()
@@ -86,7 +86,7 @@ class UpdatePlaceSweep(AbstractSweep):
             carehome_params = Parameters.instance().carehome_params
         # If a specific list of people is not provided, use the whole cell
         if person_list is None:
-            person_list = (place.cell.persons).copy()
+            person_list = place.cell.persons
         # Ensure that the number of people put in the place
         # is at most its capacity or the total number of
         # people in the cell. Will use a power law calculation if
@@ -113,57 +113,68 @@ class UpdatePlaceSweep(AbstractSweep):
             logging.info("List of 0 weights given: no people"
                          + " of acceptable age for this place")
             return
-        count = 0
-
         try:
             num_groups = np.random.poisson(math.ceil(new_capacity/group_size))
         except ZeroDivisionError:
             # Will occur when no group_size is set, if there are no groups
             # implemented in this place type
             num_groups = 1
-        while count < new_capacity:
-            if person_weights is not None:
-                assert len(person_weights) == len(person_list),\
-                    ('Weights given is a different size to the person list.')
-                person = random.choices(person_list, person_weights, k=1)[0]
-            else:
-                i = random.randint(1, len(person_list))
-                person = person_list[i-1]
-            # Checks person is not already in the place, and that they
-            # haven't already been assigned to this place type.
-            if ((person not in place.persons) and
-                    (place.place_type not in person.place_types)):
-                if place.place_type == 5:
-                    if hasattr(Parameters.instance(), 'carehome_params'):
-                        if person.age >= carehome_params[
-                                "carehome_minimum_age"]:
-                            group_index = 1
-                            person.care_home_resident = True
-                        elif person.age < carehome_params[
-                             "carehome_minimum_age"]:
-                            group_index = 0
-                            person.key_worker = True
-                elif (hasattr(Parameters.instance(), 'use_key_workers') and
-                      Parameters.instance().use_key_workers != 0):
-                    r = random.random()
-                    if r < Parameters.instance().use_key_workers:
-                        person.key_worker = True
 
-                if group_index is not None:
-                    # If the index is specified
-                    place.add_person(person, group_index)
-                else:
-                    # Add people randomly to any group within the place
-                    place.add_person(person,
-                                     random.randint(0, max(0, num_groups - 1)))
-                count += 1
-
-            # Prevent person being readded to list
-            if person_weights is not None:
-                person_weights.pop(person_list.index(person))
-            person_list.remove(person)
-
-            if len(person_list) <= 0:
-                # logging.warning("Insufficient people in the person list"
-                #                 + " supplied to update " + str(place))
-                break
+        if person_weights is not None:
+            assert len(person_weights) == len(person_list),\
+                ('Weights given is a different size to the person list.')
+
+        # People already assigned a place of this type, which includes the
+        # people already in the place, may not be chosen.
+        cell = place.cell
+        if person_list is cell.persons:
+            rows = cell.person_rows()
+        else:
+            rows = np.empty(len(person_list), dtype=int)
+            for i, person in enumerate(person_list):
+                store, rows[i] = person.store_row
+                assert store is cell.population_store, \
+                    ("People in the person list must be in the cell"
+                     + " of the place")
+        bit = 1 << PlaceType(place.place_type).value
+        eligible = (cell.population_store.place_type_mask[rows] & bit) == 0
+        if person_weights is not None:
+            probabilities = np.where(
+                eligible, np.asarray(person_weights, dtype=float), 0.0)
+        else:
+            probabilities = eligible.astype(float)
+        num_eligible = np.count_nonzero(probabilities)
+        new_capacity = min(new_capacity, num_eligible)
+        if new_capacity <= 0:
+            return
+
+        # Draw distinct people in one call, weighted if weights are given
+        chosen = np.random.choice(len(person_list), size=new_capacity,
+                                  replace=False,
+                                  p=probabilities / probabilities.sum())
+
+        for i in chosen:
+            person = person_list[i]
+            if place.place_type == 5:
+                if hasattr(Parameters.instance(), 'carehome_params'):
+                    if person.age >= carehome_params[
+                            "carehome_minimum_age"]:
+                        group_index = 1
+                        person.care_home_resident = True
+                    elif person.age < carehome_params[
+                         "carehome_minimum_age"]:
+                        group_index = 0
+                        person.key_worker = True
+            elif (hasattr(Parameters.instance(), 'use_key_workers') and
+                  Parameters.instance().use_key_workers != 0):
+                r = random.random()
+                if r < Parameters.instance().use_key_workers:
+                    person.key_worker = True
+
+            if group_index is not None:
+                # If the index is specified
+                place.add_person(person, group_index)
+            else:
+                # Add people randomly to any group within the place
+                place.add_person(person,
+                                 random.randint(0, max(0, num_groups - 1)))
@@ -2,6 +2,7 @@
 # Custom testing class to patch logging
 #
 
+import copy
 from unittest.mock import patch, mock_open
 
 import pyEpiabm as pe
@@ -18,6 +19,11 @@ class TestFunctional(TestMockedLogs):
     simulations to evaluate intervention effectiveness.
 
     """
+    # Population seeds of the replicate simulations run for each scenario,
+    # so that comparisons between scenarios do not depend on a single
+    # random trajectory
+    seeds = list(range(40, 45))
+
     @staticmethod
     def notqdm(iterable, *args, **kwargs):
         """Replacement for tqdm that just passes back the iterable
@@ -35,8 +41,10 @@ class TestFunctional(TestMockedLogs):
                            'household_number': [1, 1],
                            'Susceptible': [80, 90], 'InfectMild': [10, 0],
                            'place_number': 6}
+        # Simulations end before the epidemic reaches the whole
+        # population, so that interventions change the final counts
         self.sim_params = {"simulation_start_time": 0,
-                           "simulation_end_time": 15,
+                           "simulation_end_time": 6,
                            "initial_infected_number": 0}
 
         self.file_params = {"output_file": "output.csv",
@@ -45,7 +53,8 @@ class TestFunctional(TestMockedLogs):
                             "age_stratified": True}
 
     @classmethod
-    def file_simulation(self, pop_file, sim_params, file_params, sweep_list):
+    def file_simulation(self, pop_file, sim_params, file_params, sweep_list,
+                        random_seed=40):
         """ Creates a population based on the parameter dicts given.
 
         Parameters
@@ -59,10 +68,12 @@ class TestFunctional(TestMockedLogs):
             Dictionary of parameters specific to the output file
         sweep_list : typing.List
             List of sweeps used in the simulation
+        random_seed : int
+            Seed of the population, which also seeds the simulation
 
         """
         population = pe.routine.FilePopulationFactory.make_pop(
-            pop_file, random_seed=40)
+            pop_file, random_seed=random_seed)
         pe.routine.FilePopulationFactory.print_population(population,
                                                           "test.csv")
 
@@ -84,3 +95,32 @@ class TestFunctional(TestMockedLogs):
         del sim.writer
         del sim
         return population
+
+    @classmethod
+    def replicate_simulations(self, pop_file, sim_params, file_params,
+                              sweep_list):
+        """ Runs the simulation of :meth:`file_simulation` once for each
+        of the seeds in :attr:`seeds`, with a copy of the given sweeps.
+
+        Parameters
+        ----------
+        pop_file : str
+            Path to input file which stores population
+        sim_params : dict
+            Dictionary of parameters specific to the simulation used and used
+            as input for call method of initial sweeps
+        file_params : dict
+            Dictionary of parameters specific to the output file
+        sweep_list : typing.List
+            List of sweeps used in the simulation
+
+        Returns
+        -------
+        typing.List[Population]
+            Final population of each replicate, in the order of the seeds
+
+        """
+        return [TestFunctional.file_simulation(
+                    pop_file, sim_params, file_params,
+                    copy.deepcopy(sweep_list), random_seed=seed)
+                for seed in TestFunctional.seeds]
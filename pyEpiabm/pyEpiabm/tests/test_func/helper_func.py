@@ -3,6 +3,7 @@
 #
 
 import unittest
+import numpy as np
 
 import pyEpiabm as pe
 from pyEpiabm.property.infection_status import InfectionStatus
@@ -13,66 +14,59 @@ class HelperFunc(unittest.TestCase):
 
     """
 
-    def assertNonZeroGreater(self, val_1, val_2):
-        """Require groups with nonzero populations to increase
-        in magnitude, but check for equality in groups with
-        zero values.
+    @staticmethod
+    def count_status(population, status=InfectionStatus.Susceptible):
+        """Returns the number of people of the given status in the
+        population, over all cells and age groups.
 
         Parameters
         ----------
-        val_1 : Numeric
-            Expected to be the larger value in comparison
-        val_2 : Numeric
-            Expected to be the smaller value in comparison
+        population : Population
+            Population to count
+        status : InfectionStatus
+            The infection status to count
 
         """
-        if val_1 == 0:
-            self.assertEqual(val_1, val_2)
-        else:
-            self.assertGreater(val_1, val_2)
+        return sum(cell.compartment_counter.retrieve()[status].sum()
+                   for cell in population.cells)
 
-    def compare_susceptible_groups(self, small_pop, large_pop,
+    def compare_susceptible_groups(self, small_pops, large_pops,
                                    status=InfectionStatus.Susceptible,
                                    method='greater'):
-        """Compare all elements in the list to verify if they are all
-         larger or equal to elements in the other list.
+        """Compare the final populations of two scenarios, each simulated
+        once for each seed. With the 'greater' method, the total number of
+        people of the given status over all replicates, cells and age groups
+        must be larger in the second scenario, as single replicates and age
+        groups are too small to compare reliably. With the 'equal' method,
+        the intervention is expected to have no effect, so the counts of
+        each age group in each cell must be equal for every seed.
 
         Parameters
         ----------
-        small_pop : list
-            The population with fewer individuals
-        large_pop : list
-            The population with more individuals
+        small_pops : list
+            The replicate populations with fewer individuals
+        large_pops : list
+            The replicate populations with more individuals
         status : InfectionStatus
             The infection status wants to be compared
         method : {'greater', 'equal'}
             Specify if the comparing is for greater or equal or only equal
 
         """
-        for age_group in range(len(pe.Parameters.instance().age_proportions)):
-            with self.subTest(age_group=age_group):
-                if method == 'greater':
-                    self.assertNonZeroGreater(
-                        large_pop[0].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[0].compartment_counter.retrieve()[
-                            status][age_group])
-                    self.assertNonZeroGreater(
-                        large_pop[1].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[1].compartment_counter.retrieve()[
-                            status][age_group])
-                elif method == 'equal':
-                    self.assertEqual(
-                        large_pop[0].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[0].compartment_counter.retrieve()[
-                            status][age_group])
-                    self.assertEqual(
-                        large_pop[1].compartment_counter.retrieve()[
-                            status][age_group],
-                        small_pop[1].compartment_counter.retrieve()[
-                            status][age_group])
+        self.assertEqual(len(small_pops), len(large_pops))
+        if method == 'greater':
+            self.assertGreater(
+                sum(self.count_status(pop, status) for pop in large_pops),
+                sum(self.count_status(pop, status) for pop in small_pops))
+        elif method == 'equal':
+            for seed, (small_pop, large_pop) in enumerate(
+                    zip(small_pops, large_pops)):
+                for small_cell, large_cell in zip(small_pop.cells,
+                                                  large_pop.cells):
+                    with self.subTest(replicate=seed):
+                        np.testing.assert_array_equal(
+                            large_cell.compartment_counter.retrieve()[status],
+                            small_cell.compartment_counter.retrieve()[status])
 
     @classmethod
     def sweep_list_initialise(cls):
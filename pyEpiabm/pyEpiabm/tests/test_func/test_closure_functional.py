@@ -8,7 +8,7 @@ from pyEpiabm.tests.test_func import HelperFunc
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write', Mock())
+@patch('pyEpiabm.output._CsvDictWriter.write_frame', Mock())
 @patch('os.makedirs', Mock())
 @patch("pandas.DataFrame.to_csv")
 @patch("pandas.read_csv")
@@ -44,22 +44,23 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         # Without intervention
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise()[1:])
 
         # Enable place closure
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_closure = TestFunctional.file_simulation(
+        pop_closure = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_closure.cells)
+             pop, pop_closure)
 
     def test_no_closure_type(self, mock_read, mock_csv):
         """Place closure functional test to ensure when no place
@@ -73,22 +74,23 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         # Without intervention
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise()[1:])
 
         pe.Parameters.instance().intervention_params = self.intervention
         self.intervention['place_closure']['closure_place_type'] = []
-        pop_closure = TestFunctional.file_simulation(
+        pop_closure = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_closure.cells, method='equal')
+             pop, pop_closure, method='equal')
 
     def test_closure_type_large(self, mock_read, mock_csv):
         """Place closure functional test to ensure more people will be
@@ -101,22 +103,23 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['place_closure']['closure_place_type'] = [
             1, 2, 3, 4, 5, 6]
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop_standard.cells, pop.cells)
+             pop_standard, pop)
 
     def test_spatial_params_large(self, mock_read, mock_csv):
         """Place closure functional test to ensure fewer people will be
@@ -130,22 +133,23 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['place_closure'][
             'closure_spatial_params'] = 1
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
     def test_microcell_threshold_extreme(self, mock_read, mock_csv):
         """Place closure functional test to ensure when the case
@@ -160,23 +164,24 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         # Without intervention
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise()[1:])
 
         pe.Parameters.instance().intervention_params = self.intervention
         self.intervention['place_closure'][
             'case_microcell_threshold'] = 1000
-        pop_closure = TestFunctional.file_simulation(
+        pop_closure = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_closure.cells, method='equal')
+             pop, pop_closure, method='equal')
 
     def test_microcell_threshold_large(self, mock_read, mock_csv):
         """Place closure functional test to ensure fewer people will be
@@ -189,22 +194,23 @@ class TestClosureFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['place_closure'][
             'case_microcell_threshold'] = 15
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
 
 if __name__ == '__main__':
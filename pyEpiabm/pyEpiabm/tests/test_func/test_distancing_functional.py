@@ -8,7 +8,7 @@ from pyEpiabm.tests.test_func import HelperFunc
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write', Mock())
+@patch('pyEpiabm.output._CsvDictWriter.write_frame', Mock())
 @patch('os.makedirs', Mock())
 @patch("pandas.DataFrame.to_csv")
 @patch("pandas.read_csv")
@@ -50,22 +50,23 @@ class TestDistancingFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         # Without intervention
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise()[1:])
 
         # Enable social distancing
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_distancing = TestFunctional.file_simulation(
+        pop_distancing = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_distancing.cells)
+             pop, pop_distancing)
 
     def test_spatial_enhanced_large(self, mock_read, mock_csv):
         """Social distancing functional test to ensure fewer people will be
@@ -78,22 +79,23 @@ class TestDistancingFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['social_distancing'][
             'distancing_spatial_enhanced_susc'] = 0.8
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
     def test_prob_lower(self, mock_read, mock_csv):
         """Social distancing functional test to ensure people within the
@@ -107,22 +109,23 @@ class TestDistancingFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['social_distancing'][
             'distancing_enhanced_prob'] = [0.1]*17
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
 
 if __name__ == '__main__':
@@ -7,7 +7,7 @@ from pyEpiabm.tests import TestFunctional
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write')
+@patch('pyEpiabm.output._CsvDictWriter.write_frame')
 @patch('os.makedirs')
 @patch('logging.warning')
 @patch('logging.error')
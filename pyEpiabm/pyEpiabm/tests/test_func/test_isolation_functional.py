@@ -8,7 +8,7 @@ from pyEpiabm.tests.test_func import HelperFunc
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write', Mock())
+@patch('pyEpiabm.output._CsvDictWriter.write_frame', Mock())
 @patch('os.makedirs', Mock())
 @patch("pandas.DataFrame.to_csv")
 @patch("pandas.read_csv")
@@ -44,22 +44,23 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         # Without intervention
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise()[1:])
 
         # Enable case isolation
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_isolation = TestFunctional.file_simulation(
+        pop_isolation = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_isolation.cells)
+             pop, pop_isolation)
 
     def test_threshold_num(self, mock_read, mock_csv):
         """Case isolation functional test to ensure more people will be
@@ -73,21 +74,22 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['case_isolation']['case_threshold'] = 20
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
     def test_delay_days(self, mock_read, mock_csv):
         """Case isolation functional test to ensure more people will be
@@ -100,21 +102,22 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc().sweep_list_initialise())
 
         self.intervention['case_isolation']['isolation_delay'] = 10
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc().sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
     def test_duration_days(self, mock_read, mock_csv):
         """Case isolation functional test to ensure more people will be
@@ -128,21 +131,22 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['case_isolation']['isolation_duration'] = 1
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
     def test_isolation_prob(self, mock_read, mock_csv):
         """Case isolation functional test to ensure fewer people will be
@@ -155,21 +159,22 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['case_isolation']['isolation_probability'] = 1
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop_standard.cells, pop.cells)
+             pop_standard, pop)
 
     def test_isolation_effectiveness(self, mock_read, mock_csv):
         """Case isolation functional test to ensure more people will be
@@ -182,21 +187,22 @@ class TestIsolationFunctional(TestFunctional):
         pe.Parameters.instance().infection_radius = 1.6
 
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_standard = TestFunctional.file_simulation(
+        pop_standard = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         self.intervention['case_isolation']['isolation_effectiveness'] = 0.5
-        pop = TestFunctional.file_simulation(
+        pop = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop.cells, pop_standard.cells)
+             pop, pop_standard)
 
 
 if __name__ == '__main__':
@@ -8,7 +8,7 @@ from pyEpiabm.tests.test_func import HelperFunc
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write', Mock())
+@patch('pyEpiabm.output._CsvDictWriter.write_frame', Mock())
 @patch('os.makedirs', Mock())
 @patch("pandas.DataFrame.to_csv")
 @patch("pandas.read_csv")
@@ -58,22 +58,23 @@ class TestQuarantineFunctional(TestFunctional):
         # Enable case isolation
         pe.Parameters.instance().intervention_params = {
             "case_isolation": self.intervention['case_isolation']}
-        pop_isolation = TestFunctional.file_simulation(
+        pop_isolation = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         # Enable both case isolation and household quarantine
         pe.Parameters.instance().intervention_params = self.intervention
-        pop_quarantine = TestFunctional.file_simulation(
+        pop_quarantine = TestFunctional.replicate_simulations(
             "test_input.csv", self.sim_params, self.file_params,
             HelperFunc.sweep_list_initialise())
 
         mock_read.assert_called_with('test_input.csv')
-        self.assertEqual(mock_csv.call_count, 2)
+        self.assertEqual(mock_csv.call_count,
+                         2 * len(TestFunctional.seeds))
 
         # Compare number of susceptible individuals for each age group
         HelperFunc().compare_susceptible_groups(
-             pop_isolation.cells, pop_quarantine.cells)
+             pop_isolation, pop_quarantine)
 
 
 if __name__ == '__main__':
@@ -139,7 +139,7 @@ class TestSimulationRandomSeeds(TestFunctional):
         cls.sweeps = [pe.sweep.PlaceSweep()]
 
     @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-    @patch('pyEpiabm.output._CsvDictWriter.write')
+    @patch('pyEpiabm.output._CsvDictWriter.write_frame')
     @patch('os.makedirs')
     def test_random_seed(self, mock_mkdir, mock_write):
         pop_params = {"population_size": 250, "cell_number": 1,
@@ -167,7 +167,7 @@ class TestSimulationRandomSeeds(TestFunctional):
             seed_sim.configure(seed_pop, initial_sweeps, sim_sweeps,
                                sim_params, self.file_params)
             seed_sim.run_sweeps()
-        seed_output = mock_write.call_args
+        seed_output = mock_write.call_args.args[0].iloc[-1].to_dict()
 
         with patch('pyEpiabm.output._csv_dict_writer.open', mo):
             comp_pop = self.pop_factory.make_pop(pop_params)
@@ -175,7 +175,7 @@ class TestSimulationRandomSeeds(TestFunctional):
             comp_sim.configure(comp_pop, initial_sweeps, sim_sweeps,
                                sim_params, self.file_params)
             comp_sim.run_sweeps()
-        comp_output = mock_write.call_args
+        comp_output = mock_write.call_args.args[0].iloc[-1].to_dict()
 
         sim_params["simulation_seed"] = 43  # Change seed of population
         with patch('pyEpiabm.output._csv_dict_writer.open', mo):
@@ -184,7 +184,7 @@ class TestSimulationRandomSeeds(TestFunctional):
             diff_sim.configure(diff_pop, initial_sweeps, sim_sweeps,
                                sim_params, self.file_params)
             diff_sim.run_sweeps()
-        diff_output = mock_write.call_args
+        diff_output = mock_write.call_args.args[0].iloc[-1].to_dict()
 
         folder = os.path.join(os.getcwd(), self.mock_output_dir)
         mock_mkdir.assert_called_with(folder)
@@ -10,7 +10,7 @@ from pyEpiabm.tests import TestFunctional
 
 
 @patch('pyEpiabm.routine.simulation.tqdm', TestFunctional.notqdm)
-@patch('pyEpiabm.output._CsvDictWriter.write')
+@patch('pyEpiabm.output._CsvDictWriter.write_frame')
 @patch('os.makedirs')
 @patch("pandas.DataFrame.to_csv")
 @patch("pandas.read_csv")
@@ -101,7 +101,6 @@ class TestSimFunctional(TestFunctional):
         self.assertEqual(len(pop.cells), pop_params["cell_number"])
         self.assertEqual(pop.total_people(), pop_params["population_size"])
 
-        cell_count = len(pop.cells)
         mcell_count = 0
         place_count = 0
         for cell in pop.cells:
@@ -118,8 +117,11 @@ class TestSimFunctional(TestFunctional):
                               "test_folder/integration_tests")
         mocks[2].assert_called_with(folder)  # Mock for mkdir()
         nb_age_group = len(pe.Parameters.instance().age_proportions)
-        mock_output_count = iter_num * nb_age_group * cell_count
-        self.assertEqual(mocks[3].call_count, mock_output_count)
+        # Counts are summed across cells, with a line for each age group
+        mock_output_count = iter_num * nb_age_group
+        self.assertEqual(sum(len(call.args[0])
+                             for call in mocks[3].call_args_list),
+                         mock_output_count)
 
     def test_total_infection(self, *mocks):
         """Basic functional test to ensure everyone is infected when the entire
@@ -183,6 +185,9 @@ class TestSimFunctional(TestFunctional):
         sweep_list = [pe.sweep.HouseholdSweep(), pe.sweep.QueueSweep(),
                       pe.sweep.HostProgressionSweep()]
 
+        # Seeded, as the infected people may rarely recover without
+        # infecting the rest of their household
+        pe.routine.Simulation.set_random_seed(seed=30)
         pe.Parameters.instance().household_size_distribution = []
         pop = TestSimFunctional.file_simulation("test_input.csv",
                                                 self.sim_params,
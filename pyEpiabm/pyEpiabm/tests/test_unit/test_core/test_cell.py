@@ -1,5 +1,4 @@
 import unittest
-from queue import Queue
 
 import pyEpiabm as pe
 from pyEpiabm.property.infection_status import InfectionStatus
@@ -19,9 +18,13 @@ class TestCell(TestPyEpiabm):
         self.assertEqual(self.cell.microcells, [])
         self.assertEqual(self.cell.persons, [])
         self.assertEqual(self.cell.places, [])
-        self.assertIsInstance(self.cell.person_queue, Queue)
-        self.assertIsInstance(self.cell.PCR_queue, Queue)
-        self.assertIsInstance(self.cell.LFT_queue, Queue)
+        self.assertIsInstance(self.cell.person_queue, pe.PersonBuffer)
+        self.assertIsInstance(self.cell.PCR_queue, pe.PersonBuffer)
+        self.assertIsInstance(self.cell.LFT_queue, pe.PersonBuffer)
+        self.assertNotIsInstance(self.cell.person_queue,
+                                 pe.ThreadSafePersonBuffer)
+        self.assertIsInstance(pe.Cell(thread_safe=True).person_queue,
+                              pe.ThreadSafePersonBuffer)
         self.assertRaises(ValueError, pe.Cell, (.2, .3, .4))
 
     def test_repr(self):
@@ -59,11 +62,86 @@ class TestCell(TestPyEpiabm):
         person.update_status(InfectionStatus.Recovered)
         self.assertEqual(self.cell.number_infectious(), 0)
 
+    def test_infectors(self):
+        cell = pe.Cell()
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(3)
+        person1, person2, person3 = cell.persons
+        self.assertEqual(cell.infectors(), [])
+        person3.update_status(InfectionStatus.InfectMild)
+        person1.update_status(InfectionStatus.InfectASympt)
+        self.assertEqual(cell.infectors(), [person1, person3])
+        person1.update_status(InfectionStatus.InfectGP)
+        person3.update_status(InfectionStatus.Recovered)
+        self.assertEqual(cell.infectors(), [person1])
+        # Directly setting the status also updates the registry
+        person2.infection_status = InfectionStatus.InfectHosp
+        self.assertEqual(cell.infectors(), [person1, person2])
+
+    def test_persons_in_age_range(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(5)
+        for person, age in zip(self.cell.persons, [30, 5, 12, 5, 70]):
+            person.age = age
+        self.cell.build_age_index()
+        self.assertListEqual(
+            self.cell.persons_in_age_range(5, 13).tolist(), [1, 2, 3])
+        self.assertListEqual(
+            self.cell.persons_in_age_range(max_age=30).tolist(), [1, 2, 3])
+        self.assertListEqual(
+            self.cell.persons_in_age_range(70).tolist(), [4])
+        self.assertListEqual(
+            self.cell.persons_in_age_range(13, 30).tolist(), [])
+        # Bounds need not be integers
+        self.assertListEqual(
+            self.cell.persons_in_age_range(4.5, 12.5).tolist(), [1, 2, 3])
+        self.assertListEqual(
+            self.cell.persons_in_age_range(5.5, 12).tolist(), [])
+        self.assertListEqual(
+            self.cell.persons_in_age_range(11.5, 30.5).tolist(), [0, 2])
+
+        place_type = pe.property.PlaceType.PrimarySchool
+        self.cell.microcells[0].add_place(1, (1.0, 1.0), place_type)
+        self.cell.places[0].add_person(self.cell.persons[2])
+        self.assertListEqual(self.cell.persons_in_age_range(
+            5, 13, exclude_place_type=place_type).tolist(), [1, 3])
+        self.assertListEqual(self.cell.persons_in_age_range(
+            5, 13, exclude_place_type=pe.property.PlaceType.Workplace
+            ).tolist(), [1, 2, 3])
+
+    def test_person_rows(self):
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(3)
+        rows = self.cell.person_rows()
+        self.assertListEqual(rows.tolist(),
+                             [person._row for person in self.cell.persons])
+        # Rebuilt when people are added
+        self.cell.microcells[0].add_people(2)
+        self.assertEqual(len(self.cell.person_rows()), 5)
+
     def test_set_loc(self):
         self.assertEqual(self.cell.location, (0, 0))
         self.cell.set_location((3.0, 2.0))
         self.assertEqual(self.cell.location, (3.0, 2.0))
 
+    def test_find_nearby_cells(self):
+        pe.Parameters.instance().infection_radius = 2.0
+        cells = [pe.Cell((float(x), 0.0)) for x in range(5)]
+        for i, cell in enumerate(cells):
+            cell.set_id(i)
+        cells[0].find_nearby_cells(cells[1:])
+        self.assertEqual(cells[0].nearby_cells, {1: 1.0})
+
+        # The cell itself is skipped when included
+        index = pe.utility.SpatialIndex([cell.location for cell in cells],
+                                        2.0)
+        cells[2].find_nearby_cells(cells, index)
+        self.assertEqual(cells[2].nearby_cells, {1: 1.0, 3: 1.0})
+
+        pe.Parameters.instance().infection_radius = 0
+        cells[4].find_nearby_cells(cells[:4])
+        self.assertEqual(cells[4].nearby_cells, {})
+
     def test_testing_queue(self):
         self.cell.add_microcells(1)
         self.cell.microcells[0].add_people(1)
@@ -43,6 +43,39 @@ class TestCompartmentCounter(TestPyEpiabm):
         self.assertEqual(counter.retrieve()[InfectionStatus.Susceptible].all(),
                          0)
 
+    def test_counts(self):
+        counter = pe._CompartmentCounter("test")
+        self.assertEqual(counter.counts.shape,
+                         (len(InfectionStatus), counter.nb_age_groups))
+        counter._increment_compartment(2, InfectionStatus.Exposed, 0)
+        self.assertEqual(counter.counts[InfectionStatus.Exposed.value - 1,
+                                        0], 2)
+        # Retrieved arrays are views of the counts
+        compartments = counter.retrieve()
+        self.assertIs(compartments, counter.retrieve())
+        counter.report(InfectionStatus.Exposed, InfectionStatus.InfectMild)
+        self.assertEqual(compartments[InfectionStatus.InfectMild][0], 1)
+        self.assertEqual(compartments[InfectionStatus.Exposed][0], 1)
+
+    def test_parent(self):
+        parent = pe._CompartmentCounter("parent")
+        child = pe._CompartmentCounter("child")
+        child._increment_compartment(2, InfectionStatus.Susceptible, 0)
+        child.set_parent(parent)
+        np.testing.assert_array_equal(parent.counts, child.counts)
+        child.report(InfectionStatus.Susceptible, InfectionStatus.Exposed)
+        child._increment_compartment(1, InfectionStatus.Recovered, 0)
+        np.testing.assert_array_equal(parent.counts, child.counts)
+        child.clear_counter()
+        self.assertEqual(parent.counts.sum(), 0)
+
+        # Moving to a new parent removes counts from the old parent
+        new_parent = pe._CompartmentCounter("new parent")
+        child._increment_compartment(1, InfectionStatus.Dead, 0)
+        child.set_parent(new_parent)
+        self.assertEqual(parent.counts.sum(), 0)
+        self.assertEqual(new_parent.counts.sum(), 1)
+
     @patch('pyEpiabm.core.Parameters.instance')
     def test_construct_no_age(self, mock_params):
         mock_params.return_value.use_ages = False
@@ -17,6 +17,8 @@ class TestMicrocell(TestPyEpiabm):
         self.assertEqual(self.microcell.persons, [])
         self.assertEqual(self.microcell.cell, self.cell)
         self.assertEqual(self.microcell.places, [])
+        self.assertIsNone(self.microcell.closure_start_time)
+        self.assertIsNone(self.microcell.distancing_start_time)
 
     def test_repr(self):
         self.assertEqual(repr(self.microcell),
@@ -109,6 +111,18 @@ class TestMicrocell(TestPyEpiabm):
             person.update_status(InfectionStatus(i+3))
         self.assertEqual(self.microcell.count_infectious(), 4)
 
+    def test_is_closed(self):
+        self.assertFalse(self.microcell.is_closed(5))
+        self.microcell.closure_start_time = 3
+        self.assertFalse(self.microcell.is_closed(2))
+        self.assertTrue(self.microcell.is_closed(3))
+
+    def test_is_distancing(self):
+        self.assertFalse(self.microcell.is_distancing(5))
+        self.microcell.distancing_start_time = 3
+        self.assertFalse(self.microcell.is_distancing(2))
+        self.assertTrue(self.microcell.is_distancing(3))
+
 
 if __name__ == '__main__':
     unittest.main()
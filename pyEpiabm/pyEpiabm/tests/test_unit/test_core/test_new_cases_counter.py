@@ -0,0 +1,56 @@
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestNewCasesCounter(TestPyEpiabm):
+    """Test the _NewCasesCounter class
+    """
+    def setUp(self) -> None:
+        pe.Parameters.instance().time_steps_per_day = 2
+        self.subject = pe._NewCasesCounter()
+
+    def test_construct(self):
+        np.testing.assert_array_equal(self.subject.retrieve(0, 3), [0, 0, 0])
+
+    def test_report(self):
+        self.subject.report(None, 1.0)
+        self.subject.report(None, 1.5, 2)
+        self.subject.report(None, 1.5, 2)
+        np.testing.assert_array_equal(self.subject.retrieve(1.5), [1, 0, 2])
+        np.testing.assert_array_equal(self.subject.retrieve(1.5, 4),
+                                      [1, 0, 2, 0])
+
+        # Infections starting at the start of the day are not counted
+        np.testing.assert_array_equal(self.subject.retrieve(2), [0, 0, 2])
+        np.testing.assert_array_equal(self.subject.retrieve(2.5), [0, 0, 0])
+
+        self.subject.report(1.5, None, 2)
+        np.testing.assert_array_equal(self.subject.retrieve(2), [0, 0, 1])
+
+    def test_ring_buffer(self):
+        self.subject.report(None, 1.0)
+        # Reuses the slot of time 1.0
+        self.subject.report(None, 2.0)
+        np.testing.assert_array_equal(self.subject.retrieve(2), [1])
+        # Starts older than their slot are discarded
+        self.subject.report(None, 1.0)
+        self.subject.report(1.0, None)
+        np.testing.assert_array_equal(self.subject.retrieve(2), [1])
+
+    def test_times_between_steps(self):
+        # Allows for rounding errors in times on the grid
+        self.subject.report(None, 0.1 + 0.2 + 0.2)
+        np.testing.assert_array_equal(self.subject.retrieve(1.0), [1])
+        np.testing.assert_array_equal(self.subject.retrieve(1.5), [0])
+        # Counted from the next time step, as 1.2 > 1.5 - 1
+        self.subject.report(None, 1.2)
+        np.testing.assert_array_equal(self.subject.retrieve(1.5), [1])
+        np.testing.assert_array_equal(self.subject.retrieve(2), [1])
+        np.testing.assert_array_equal(self.subject.retrieve(2.5), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
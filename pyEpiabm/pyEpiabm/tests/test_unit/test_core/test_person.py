@@ -21,6 +21,24 @@ class TestPerson(TestPyEpiabm):
         self.assertTrue(0 <= self.person.age_group < 17)
         self.assertEqual(self.person.infectiousness, 0)
         self.assertEqual(self.person.microcell, self.microcell)
+        self.assertIs(self.cell.population_store.persons[0], self.person)
+
+    def test_store_row(self):
+        store, row = self.person.store_row
+        self.assertIs(store, self.cell.population_store)
+        self.assertEqual(row, 0)
+        self.microcell.add_people(1)
+        store, row = self.microcell.persons[1].store_row
+        self.assertIs(store.persons[row], self.microcell.persons[1])
+
+    def test_household(self):
+        self.assertIsNone(self.person.household)
+        household = pe.Household(self.microcell, (1.0, 1.0))
+        household.add_person(self.person)
+        self.assertEqual(self.person.household, household)
+        self.assertEqual(self.cell.population_store.household[0], 0)
+        self.person.household = None
+        self.assertEqual(self.cell.population_store.household[0], -1)
 
     @patch("random.randint")
     @patch("random.choices")
@@ -87,15 +105,20 @@ class TestPerson(TestPyEpiabm):
                                 test_cell, pe.Microcell(test_cell))
         self.assertRaises(AttributeError, self.person.add_place, test_place_2)
 
+        mask = self.cell.population_store.place_type_mask
+        self.assertEqual(mask[self.person._row],
+                         1 << pe.property.PlaceType.Workplace.value)
+
         self.person.remove_place(test_place)
         self.assertEqual(len(self.person.places), 0)
+        self.assertEqual(mask[self.person._row], 0)
         self.assertRaises(KeyError, self.person.remove_place, test_place_2)
 
     def test_is_place_closed(self):
         closure_place_type = pe.Parameters.instance().intervention_params[
             'place_closure']['closure_place_type']
         # Not in place closure
-        self.assertFalse(hasattr(self.person.microcell, 'closure_start_time'))
+        self.assertIsNone(self.person.microcell.closure_start_time)
         self.assertFalse(self.person.is_place_closed(closure_place_type))
         # Place closure time starts but the place is not in closure_place_type
         self.person.microcell.closure_start_time = 1
@@ -105,6 +128,44 @@ class TestPerson(TestPyEpiabm):
         self.person.place_types.append(pe.property.PlaceType.PrimarySchool)
         self.assertTrue(self.person.is_place_closed(closure_place_type))
 
+    def test_intervention_fields(self):
+        self.assertIsNone(self.person.isolation_start_time)
+        self.assertIsNone(self.person.quarantine_start_time)
+        self.assertFalse(self.person.distancing_enhanced)
+        self.assertFalse(self.person.is_isolating(5))
+        self.assertFalse(self.person.is_quarantined(5))
+
+        self.person.isolation_start_time = 3
+        self.person.quarantine_start_time = 4
+        self.person.distancing_enhanced = True
+        self.assertEqual(self.person._store.isolation_start_time[
+            self.person._row], 3)
+        self.assertTrue(self.person.distancing_enhanced)
+        self.assertTrue(self.person.is_isolating(3))
+        self.assertFalse(self.person.is_quarantined(3))
+        self.assertTrue(self.person.is_quarantined(4))
+
+        self.person.isolation_start_time = None
+        self.assertIsNone(self.person.isolation_start_time)
+        self.assertFalse(self.person.is_isolating(5))
+
+    def test_infection_start_time(self):
+        counter = self.cell.new_cases_counter
+        age_group = self.person.age_group
+        self.assertIsNone(self.person.infection_start_time)
+        self.person.infection_start_time = 2.0
+        self.assertEqual(self.person.infection_start_time, 2.0)
+        self.assertEqual(counter.retrieve(2)[age_group], 1)
+
+        # Changing the age group moves the count
+        self.person.age_group = age_group + 1
+        self.assertEqual(counter.retrieve(2)[age_group], 0)
+        self.assertEqual(counter.retrieve(2)[age_group + 1], 1)
+
+        self.person.infection_start_time = None
+        self.assertIsNone(self.person.infection_start_time)
+        self.assertEqual(counter.retrieve(2).sum(), 0)
+
     def test_vaccinate(self):
         self.person.vaccinate(time=5)
         self.assertTrue(self.person.is_vaccinated)
@@ -0,0 +1,77 @@
+import threading
+import unittest
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestPersonBuffer(TestPyEpiabm):
+    """Test the 'PersonBuffer' class.
+    """
+    def setUp(self) -> None:
+        self.cell = pe.Cell()
+        self.cell.add_microcells(1)
+        self.cell.microcells[0].add_people(4)
+        self.people = self.cell.persons
+        self.buffer = pe.PersonBuffer()
+
+    def test__init__(self):
+        self.assertTrue(self.buffer.empty())
+        self.assertEqual(self.buffer.qsize(), 0)
+        self.assertEqual(len(self.buffer), 0)
+
+    def test_put_get(self):
+        for person in self.people[:3]:
+            self.buffer.put(person)
+        self.assertFalse(self.buffer.empty())
+        self.assertEqual(self.buffer.qsize(), 3)
+        self.assertIs(self.buffer.get(), self.people[0])
+        self.assertEqual(len(self.buffer), 2)
+        self.buffer.drain()
+        self.assertRaises(IndexError, self.buffer.get)
+
+    def test_duplicates(self):
+        self.buffer.put(self.people[0])
+        self.buffer.put(self.people[1])
+        self.buffer.put(self.people[0])
+        self.assertEqual(self.buffer.drain(), self.people[:2])
+
+        # People may be added again once removed
+        self.buffer.put(self.people[0])
+        self.assertEqual(self.buffer.get(), self.people[0])
+        self.buffer.put(self.people[0])
+        self.assertEqual(self.buffer.qsize(), 1)
+
+    def test_drain(self):
+        for person in self.people:
+            self.buffer.put(person)
+        self.assertEqual(self.buffer.drain(0), [])
+        self.assertEqual(self.buffer.drain(3), self.people[:3])
+        self.buffer.put(self.people[0])
+        self.assertEqual(self.buffer.drain(5),
+                         [self.people[3], self.people[0]])
+        self.assertTrue(self.buffer.empty())
+        self.assertEqual(self.buffer.drain(), [])
+
+    def test_thread_safe(self):
+        buffer = pe.ThreadSafePersonBuffer()
+        people = [pe.Person(self.cell.microcells[0]) for _ in range(400)]
+
+        def fill(start):
+            for person in people[start::4]:
+                buffer.put(person)
+                buffer.put(person)
+        threads = [threading.Thread(target=fill, args=(i,))
+                   for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(buffer.qsize(), 400)
+        self.assertEqual(set(buffer.drain(100)) | set(buffer.drain()),
+                         set(people))
+        self.assertTrue(buffer.empty())
+
+
+if __name__ == '__main__':
+    unittest.main()
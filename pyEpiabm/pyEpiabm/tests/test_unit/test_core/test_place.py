@@ -25,9 +25,9 @@ class TestPlace(TestPyEpiabm):
         test_place = pe.Place((1.0, 1.0), PlaceType.Workplace,
                               self.cell, self.microcell)
         self.assertEqual(test_place._location, (1.0, 1.0))
-        self.assertEqual(test_place.persons, [])
+        self.assertEqual(test_place.persons, {})
         self.assertEqual(test_place.place_type, PlaceType.Workplace)
-        self.assertDictEqual(test_place.person_groups, {0: []})
+        self.assertDictEqual(test_place.person_groups, {0: {}})
         self.assertEqual(test_place.susceptibility, 0)
         self.assertEqual(test_place.infectiousness, 0)
         new_cell = pe.Cell()
@@ -51,12 +51,13 @@ class TestPlace(TestPyEpiabm):
                               self.cell, self.microcell)
         test_place.add_person(self.person)
         self.assertEqual(len(self.person.places), 1)
-        self.assertDictEqual(test_place.person_groups, {0: [self.person]})
+        self.assertDictEqual(test_place.person_groups,
+                             {0: {self.person: None}})
         self.assertEqual(len(test_place.persons), 1)
         self.assertEqual(test_place.get_group_index(self.person), 0)
 
         test_place.remove_person(self.person)
-        self.assertDictEqual(test_place.person_groups, {0: []})
+        self.assertDictEqual(test_place.person_groups, {0: {}})
         self.assertEqual(len(test_place.persons), 0)
         self.assertRaises(KeyError, test_place.remove_person, self.person)
 
@@ -70,6 +71,26 @@ class TestPlace(TestPyEpiabm):
         self.assertEqual(len(test_place.persons), 0)
         self.assertRaises(KeyError, test_place.get_group_index, self.person)
 
+    def test_empty_place(self):
+        test_place = pe.Place((1.0, 1.0), pe.property.PlaceType.Workplace,
+                              self.cell, self.microcell)
+        people = [pe.Person(self.microcell) for _ in range(5)]
+        for i, person in enumerate(people):
+            test_place.add_person(person, person_group=i % 2)
+        test_place.empty_place([1])
+        self.assertDictEqual(test_place.person_groups,
+                             {0: {people[0]: None, people[2]: None,
+                                  people[4]: None}, 1: {}})
+        self.assertEqual(len(test_place.persons), 3)
+        self.assertDictEqual(people[1].places, {})
+        self.assertEqual(people[1].place_types, [])
+        self.assertDictEqual(people[2].places, {test_place: 0})
+
+        test_place.empty_place()
+        self.assertEqual(len(test_place.persons), 0)
+        for person in people:
+            self.assertEqual(len(person.places), 0)
+
     def test_set_susc(self):
         test_place = pe.Place((1.0, 1.0), pe.property.PlaceType.Workplace,
                               self.cell, self.microcell)
@@ -1,6 +1,7 @@
 import unittest
 
 import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
 from pyEpiabm.tests.test_unit.mocked_logging_tests import TestMockedLogs
 
 
@@ -13,7 +14,7 @@ class TestPopulation(TestMockedLogs):
         cls.population = pe.Population()
 
     def test__init__(self):
-        self.assertEqual(self.population.cells, [])
+        self.assertEqual(self.population.cells, ())
 
     def test_repr(self):
         self.assertEqual(repr(self.population),
@@ -24,6 +25,71 @@ class TestPopulation(TestMockedLogs):
         self.assertEqual(len(population.cells), 0)
         population.add_cells(n)
         self.assertEqual(len(population.cells), n)
+        # Added cells are numbered after the existing cells
+        population.add_cells(2)
+        self.assertListEqual([cell.id for cell in population.cells],
+                             list(range(n + 2)))
+
+    def test_add_cell(self):
+        population = pe.Population()
+        cell = pe.Cell()
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(3)
+        population.add_cell(cell)
+        self.assertEqual(population.cells, (cell,))
+        counts = population.compartment_counter.retrieve()
+        self.assertEqual(sum(counts[InfectionStatus.Susceptible]), 3)
+
+        # Aggregate counter is updated with the cell counters
+        cell.persons[0].update_status(InfectionStatus.Exposed)
+        self.assertEqual(sum(counts[InfectionStatus.Susceptible]), 2)
+        self.assertEqual(sum(counts[InfectionStatus.Exposed]), 1)
+        population.add_cells(1)
+        population.cells[1].add_microcells(1)
+        population.cells[1].microcells[0].add_people(2)
+        self.assertEqual(sum(counts[InfectionStatus.Susceptible]), 4)
+
+    def test_set_cells(self):
+        population = pe.Population()
+        population.add_cells(1)
+        cell = pe.Cell()
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(3)
+        cell.persons[0].update_status(InfectionStatus.InfectMild)
+        # Cells may not be added without aggregating their counts
+        with self.assertRaises(AttributeError):
+            population.cells.append(cell)
+
+        population.cells = [cell]
+        self.assertEqual(population.cells, (cell,))
+        self.assertIs(cell.population, population)
+        self.assertEqual(population.infectors(), [cell.persons[0]])
+        counts = population.compartment_counter.retrieve()
+        self.assertEqual(sum(counts[InfectionStatus.Susceptible]), 2)
+        cell.persons[1].update_status(InfectionStatus.Exposed)
+        self.assertEqual(sum(counts[InfectionStatus.Susceptible]), 1)
+
+    def test_infectors(self):
+        population = pe.Population()
+        population.add_cells(2)
+        for cell in population.cells:
+            cell.add_microcells(1)
+            cell.microcells[0].add_people(2)
+        person1 = population.cells[0].persons[0]
+        person2 = population.cells[1].persons[1]
+        self.assertEqual(population.infectors(), [])
+        person1.update_status(InfectionStatus.InfectMild)
+        person2.update_status(InfectionStatus.InfectICU)
+        self.assertEqual(population.infectors(), [person1, person2])
+        person1.update_status(InfectionStatus.Dead)
+        self.assertEqual(population.infectors(), [person2])
+
+        # Infectors of added cells are registered
+        cell = pe.Cell()
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(1, InfectionStatus.InfectGP)
+        population.add_cell(cell)
+        self.assertEqual(population.infectors(), [person2, cell.persons[0]])
 
     def test_total_people(self):
         self.assertEqual(self.population.total_people(), 0)
@@ -0,0 +1,108 @@
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestPopulationStore(TestPyEpiabm):
+    """Test the 'PopulationStore' class.
+    """
+    def setUp(self) -> None:
+        self.store = pe.PopulationStore(capacity=2)
+
+    def test__init__(self):
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(len(self.store.persons), 0)
+        for name in pe.PopulationStore.column_names():
+            self.assertEqual(len(self.store.view(name)), 0)
+
+    def test_repr(self):
+        self.assertEqual(repr(self.store), "PopulationStore with 0 people.")
+
+    def test_add_row(self):
+        rows = [self.store.add_row() for _ in range(5)]
+        self.assertEqual(rows, [0, 1, 2, 3, 4])
+        self.assertEqual(len(self.store), 5)
+        self.assertGreaterEqual(len(self.store.infection_status), 5)
+        np.testing.assert_array_equal(
+            self.store.view('infection_status'),
+            [InfectionStatus.Susceptible.value] * 5)
+        self.assertTrue(np.isnan(self.store.view('time_of_status_change'))
+                        .all())
+
+    def test_reserve(self):
+        self.store.add_row()
+        self.store.infectiousness[0] = 2.0
+        self.store.reserve(100)
+        self.assertEqual(len(self.store.infectiousness), 100)
+        self.assertEqual(self.store.infectiousness[0], 2.0)
+        self.store.reserve(10)  # Never shrinks
+        self.assertEqual(len(self.store.infectiousness), 100)
+
+    def test_view(self):
+        self.store.add_row()
+        self.store.view('infectiousness')[0] = 3.0
+        self.assertEqual(self.store.infectiousness[0], 3.0)
+        self.assertRaises(KeyError, self.store.view, 'not_a_column')
+
+    def test_status_mask(self):
+        for _ in range(3):
+            self.store.add_row()
+        self.store.infection_status[1] = InfectionStatus.InfectMild.value
+        self.store.infection_status[2] = InfectionStatus.Recovered.value
+        np.testing.assert_array_equal(
+            self.store.status_mask(InfectionStatus.InfectMild,
+                                   InfectionStatus.Recovered),
+            [False, True, True])
+
+    def test_schedule(self):
+        for _ in range(3):
+            self.store.add_row()
+        self.store.time_of_status_change[0] = 2.0
+        self.assertRaises(RuntimeError, self.store.pop_due, 1.0)
+        self.store.schedule(1, 1.0)  # Ignored until enabled
+        self.store.enable_schedule()
+        self.assertEqual(self.store.pop_due(1.0), [])
+        self.store.time_of_status_change[1] = 1.0
+        self.store.schedule(1, 1.0)
+        self.store.schedule(2, np.inf)
+        self.assertEqual(self.store.pop_due(3.0), [0, 1])
+        self.assertEqual(self.store.pop_due(3.0), [])
+
+        # Out of date entries are discarded
+        self.store.schedule(2, 4.0)
+        self.store.time_of_status_change[2] = 6.0
+        self.store.schedule(2, 6.0)
+        self.assertEqual(self.store.pop_due(5.0), [])
+        self.assertEqual(self.store.pop_due(6.0), [2])
+
+    def test_person_view(self):
+        cell = pe.Cell()
+        cell.add_microcells(1)
+        cell.microcells[0].add_people(3)
+        store = cell.population_store
+        self.assertEqual(len(store), 3)
+        person = cell.persons[1]
+        self.assertIs(store.persons[1], person)
+
+        person.infection_status = InfectionStatus.InfectGP
+        self.assertEqual(store.infection_status[1],
+                         InfectionStatus.InfectGP.value)
+        store.infectiousness[1] = 0.5
+        self.assertEqual(person.infectiousness, 0.5)
+        self.assertIsNone(person.next_infection_status)
+        self.assertIsNone(person.time_of_status_change)
+        person.time_of_status_change = 2.0
+        self.assertEqual(store.time_of_status_change[1], 2.0)
+        person.time_of_status_change = None
+        self.assertIsNone(person.time_of_status_change)
+
+        store.enable_schedule()
+        person.time_of_status_change = 3.0
+        self.assertEqual(store.pop_due(3.0), [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestSimulationConstants(TestPyEpiabm):
+    """Test the 'SimulationConstants' class.
+    """
+    def setUp(self) -> None:
+        self.params = pe.Parameters.instance()
+        self.constants = pe.SimulationConstants()
+
+    def test__init__(self):
+        self.assertEqual(self.constants.basic_reproduction_num,
+                         self.params.basic_reproduction_num)
+        self.assertEqual(self.constants.household_transmission,
+                         self.params.household_transmission)
+        self.assertEqual(self.constants.use_ages, self.params.use_ages)
+        np.testing.assert_array_equal(self.constants.age_contact,
+                                      self.params.age_contact)
+        self.assertEqual(self.constants.place_transmission,
+                         self.params.place_params['place_transmission'])
+        group_size = self.params.place_params['mean_group_size']
+        np.testing.assert_array_equal(
+            self.constants.place_group_size[:len(group_size)], group_size)
+        self.assertEqual(len(self.constants.place_group_size),
+                         len(pe.property.PlaceType))
+
+    def test_intervention_params(self):
+        interventions = self.params.intervention_params
+        self.assertEqual(
+            self.constants.isolation_effectiveness,
+            interventions['case_isolation']['isolation_effectiveness'])
+        np.testing.assert_array_equal(
+            self.constants.distancing_place_susc,
+            interventions['social_distancing']['distancing_place_susc'])
+        self.assertEqual(
+            self.constants.closure_place_type,
+            set(interventions['place_closure']['closure_place_type']))
+        self.assertTrue(self.constants.testing)
+        np.testing.assert_array_equal(
+            self.constants.sympt_pcr,
+            interventions['disease_testing']['sympt_pcr'])
+
+    def test_given_parameters(self):
+        params = mock.Mock(spec=[])
+        params.basic_reproduction_num = 3
+        params.place_params = {'mean_group_size': [2, 4]}
+        constants = pe.SimulationConstants(params)
+        self.assertEqual(constants.basic_reproduction_num, 3.0)
+        np.testing.assert_array_equal(constants.place_group_size,
+                                      [2, 4, 1, 1, 1, 1])
+
+    def test_defaults(self):
+        constants = pe.SimulationConstants(mock.Mock(spec=[]))
+        self.assertEqual(constants.basic_reproduction_num, 0)
+        self.assertFalse(constants.use_ages)
+        self.assertFalse(constants.testing)
+        self.assertEqual(constants.closure_place_type, frozenset())
+        self.assertEqual(constants.isolation_effectiveness, 1)
+        self.assertEqual(constants.quarantine_spatial_effectiveness, 1)
+        self.assertEqual(constants.closure_spatial_params, 1)
+        np.testing.assert_array_equal(
+            constants.quarantine_place_effectiveness,
+            np.ones(len(pe.property.PlaceType)))
+        np.testing.assert_array_equal(
+            constants.distancing_place_enhanced_susc,
+            np.ones(len(pe.property.PlaceType)))
+
+    @mock.patch('pyEpiabm.core.Parameters.instance')
+    def test_mocked_parameters(self, mock_params):
+        mock_params.return_value.basic_reproduction_num = 2
+        constants = pe.SimulationConstants()
+        self.assertEqual(constants.basic_reproduction_num, 2)
+        self.assertFalse(constants.testing)
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.constants.basic_reproduction_num = 1
+        with self.assertRaises(AttributeError):
+            del self.constants.household_transmission
+        with self.assertRaises(ValueError):
+            self.constants.age_contact[0] = 0
+
+
+if __name__ == '__main__':
+    unittest.main()
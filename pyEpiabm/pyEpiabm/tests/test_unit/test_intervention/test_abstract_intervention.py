@@ -38,6 +38,15 @@ class TestAbstractIntervention(unittest.TestCase):
         self.assertRaises(NotImplementedError,
                           self.intervention_object.__call__, 1)
 
+    def test_kernels(self):
+        self.assertIsNone(self.intervention_object.kernel_level)
+        self.assertRaises(NotImplementedError,
+                          self.intervention_object.cell_kernel, 1, None)
+        self.assertRaises(NotImplementedError,
+                          self.intervention_object.microcell_kernel, 1, None)
+        self.assertRaises(NotImplementedError,
+                          self.intervention_object.person_kernel, 1, None)
+
     def test_turn_off(self):
         self.assertRaises(NotImplementedError,
                           self.intervention_object.turn_off)
@@ -50,17 +50,17 @@ class TestCaseIsolation(TestPyEpiabm):
     def test___call__(self, mock_random):
         mock_random.return_value = 0
         # Before isolation starts
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
-        self.assertFalse(hasattr(self.person_symp, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
+        self.assertIsNone(self.person_symp.isolation_start_time)
 
         # Start isolation if the person is symptomatic
         self.caseisolation(time=5)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
         self.assertEqual(self.person_symp.isolation_start_time, 5)
 
         # End isolation
         self.caseisolation(time=150)
-        self.assertFalse(hasattr(self.person_susc, 'isolation_start_time'))
+        self.assertIsNone(self.person_susc.isolation_start_time)
         self.assertIsNone(self.person_symp.isolation_start_time)
 
     @mock.patch('random.random')
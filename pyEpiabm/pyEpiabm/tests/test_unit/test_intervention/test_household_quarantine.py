@@ -61,14 +61,14 @@ class TestHouseholdQuarantine(TestPyEpiabm):
         self.householdquarantine.quarantine_individual_compliant = 1.0
         self.sympt_person.isolation_start_time = 3
         self.householdquarantine(time=3)
-        self.assertFalse(hasattr(self.sympt_person, 'quarantine_start_time'))
+        self.assertIsNone(self.sympt_person.quarantine_start_time)
         self.assertEqual(self.susc_person1.quarantine_start_time, 4)
         self.assertEqual(self.susc_person2.quarantine_start_time, 4)
 
         # second household infection while in quarantine
         self.susc_person2.isolation_start_time = 6
         self.householdquarantine(time=6)
-        self.assertFalse(hasattr(self.sympt_person, 'quarantine_start_time'))
+        self.assertIsNone(self.sympt_person.quarantine_start_time)
         self.assertIsNone(self.susc_person2.quarantine_start_time)
         self.assertEqual(self.susc_person1.quarantine_start_time, 7)
 
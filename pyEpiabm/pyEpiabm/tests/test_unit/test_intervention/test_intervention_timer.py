@@ -0,0 +1,91 @@
+import unittest
+
+import pyEpiabm as pe
+from pyEpiabm.intervention import InterventionTimer
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestInterventionTimer(TestPyEpiabm):
+    """Test the 'InterventionTimer' class.
+    """
+
+    def setUp(self) -> None:
+        super(TestInterventionTimer, self).setUp()
+        self.timer = InterventionTimer('isolation_start_time', 10)
+        self.microcell = pe.Microcell(pe.Cell((0, 0)))
+        self.microcell.add_people(3)
+        self.people = self.microcell.persons
+
+    def test_construct(self):
+        self.assertEqual(self.timer.attribute, 'isolation_start_time')
+        self.assertEqual(self.timer.duration, 10)
+        self.assertEqual(len(self.timer), 0)
+
+    def test_start(self):
+        self.timer.start(self.people[0], 2)
+        self.assertEqual(self.people[0].isolation_start_time, 2)
+        self.assertEqual(len(self.timer), 1)
+        self.assertIn(self.people[0], self.timer)
+        self.assertNotIn(self.people[1], self.timer)
+
+    def test_expire(self):
+        self.timer.start(self.people[0], 2)
+        self.timer.start(self.people[1], 5)
+        self.assertEqual(self.timer.expire(12), set())
+        self.assertEqual(self.people[0].isolation_start_time, 2)
+
+        # Windows end once the time is strictly greater than their end
+        self.assertEqual(self.timer.expire(13), {self.people[0]})
+        self.assertIsNone(self.people[0].isolation_start_time)
+        self.assertEqual(self.people[1].isolation_start_time, 5)
+        self.assertEqual(self.timer.expire(20), {self.people[1]})
+        self.assertEqual(len(self.timer), 0)
+
+    def test_expire_restarted(self):
+        self.timer.start(self.people[0], 2)
+        self.timer.start(self.people[0], 8)
+        self.assertEqual(self.timer.expire(13), set())
+        self.assertEqual(self.people[0].isolation_start_time, 8)
+        self.assertEqual(self.timer.expire(19), {self.people[0]})
+
+    def test_expire_changed_outside(self):
+        self.timer.start(self.people[0], 2)
+        self.timer.start(self.people[1], 2)
+        self.people[0].isolation_start_time = 6
+        self.people[1].isolation_start_time = None
+        self.assertEqual(self.timer.expire(13), set())
+        self.assertEqual(self.people[0].isolation_start_time, 6)
+        self.assertEqual(len(self.timer), 1)
+        self.assertEqual(self.timer.expire(17), {self.people[0]})
+
+    def test_track(self):
+        self.timer.track(self.people[0])
+        self.assertEqual(len(self.timer), 0)
+        self.people[0].isolation_start_time = 1
+        self.timer.track(self.people[0])
+        self.timer.track(self.people[0])
+        self.assertEqual(len(self.timer), 1)
+        self.assertEqual(self.timer.expire(12), {self.people[0]})
+        self.assertIsNone(self.people[0].isolation_start_time)
+
+    def test_stop(self):
+        self.timer.start(self.people[0], 2)
+        self.timer.stop(self.people[0])
+        self.timer.stop(self.people[1])
+        self.assertIsNone(self.people[0].isolation_start_time)
+        self.assertIsNone(self.people[1].isolation_start_time)
+        self.assertEqual(len(self.timer), 0)
+        self.assertEqual(self.timer.expire(20), set())
+
+    def test_clear(self):
+        for i, person in enumerate(self.people):
+            self.timer.start(person, i)
+        self.timer.clear()
+        self.assertEqual(len(self.timer), 0)
+        for person in self.people:
+            self.assertIsNone(person.isolation_start_time)
+        self.assertEqual(self.timer.expire(20), set())
+
+
+if __name__ == '__main__':
+    unittest.main()
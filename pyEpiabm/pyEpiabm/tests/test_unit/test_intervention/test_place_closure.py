@@ -45,7 +45,7 @@ class TestPlaceClosure(TestPyEpiabm):
                          self.params['case_microcell_threshold'])
 
     def test___call__(self):
-        self.assertFalse(hasattr(self._microcell, 'closure_start_time'))
+        self.assertIsNone(self._microcell.closure_start_time)
         self.placeclosure(time=5)
         self.assertIsNotNone(self._microcell.closure_start_time)
         self.placeclosure(time=150)
@@ -51,11 +51,11 @@ class TestSocialDistancing(TestPyEpiabm):
 
     def test___call__(self):
         # Social distancing haven't start
-        self.assertFalse(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertIsNone(self.microcell.distancing_start_time)
         # Age group exists with normal social distancing
         self.person.age_group = 0
         self.socialdistancing(time=5)
-        self.assertTrue(hasattr(self.microcell, 'distancing_start_time'))
+        self.assertIsNotNone(self.microcell.distancing_start_time)
         self.assertFalse(self.person.distancing_enhanced)
         # Social distancing ends
         self.socialdistancing(time=150)
@@ -75,7 +75,7 @@ class TestSocialDistancing(TestPyEpiabm):
         self.assertFalse(self.person.distancing_enhanced)
 
     def test_turn_off(self):
-        self.microcell.distancing_start_time = 370
+        self.socialdistancing.timer.start(self.microcell, 370)
         self.socialdistancing.turn_off()
         self.assertIsNone(self.microcell.distancing_start_time)
 
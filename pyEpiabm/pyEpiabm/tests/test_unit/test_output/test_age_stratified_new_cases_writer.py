@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import random
 import os
+import tempfile
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -58,6 +59,34 @@ class TestAgeStratifiedNewCasesWriter(TestPyEpiabm):
             call(f'10,{p.cells[0].id},{0},{n_new_cases}\r\n'),
             call(f'10,{p.cells[0].id},{1},{n_new_cases_group_2}\r\n')])
 
+    def test_write_binary(self):
+        """Test the write method of the AgeStratifiedNewCasesWriter class,
+        writing to a binary file.
+        """
+        pe.Parameters.instance().time_steps_per_day = 1
+        p = pe.Population()
+        p.add_cells(1)
+        p.cells[0].add_microcells(1)
+        p.cells[0].microcells[0].add_people(3)
+        for person, age_group in zip(p.cells[0].persons, [0, 2, 2]):
+            person.age_group = age_group
+            person.infection_start_time = 10.0
+
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output.AgeStratifiedNewCasesWriter(folder, binary=True)
+            m.write(10, p)
+            m.close()
+            self.assertIsNone(m.binary_writer.f)
+            reader = pe.output.BinaryReader(
+                os.path.join(folder, 'age_stratified_new_cases.bin'))
+            nb_age_groups = len(pe.Parameters.instance().age_proportions)
+            self.assertEqual(reader.nb_age_groups, nb_age_groups)
+            expected = [0] * nb_age_groups
+            expected[0] = 1
+            expected[2] = 2
+            self.assertListEqual(reader.counts[0, 0, 0].tolist(), expected)
+            del reader
+
     @patch('os.makedirs')
     def test_del(self, mock_mkdir):
         """Test the destructor method of the NewCasesWriter class.
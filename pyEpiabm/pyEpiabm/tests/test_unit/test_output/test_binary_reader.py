@@ -0,0 +1,84 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestBinaryReader(TestPyEpiabm):
+    """Test the methods of the 'BinaryReader' class.
+    """
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, 'test.bin')
+        self.cells = [pe.Cell((0, 1)), pe.Cell((2, 3))]
+        self.counts = np.arange(3 * 2 * 2 * 4).reshape(3, 2, 2, 4)
+        writer = pe.output._BinaryWriter(self.folder.name, 'test.bin',
+                                         ['Cat1', 'Cat2'], 4, self.cells)
+        writer.write(0, self.counts[0])
+        writer.write_chunk([1, 2], self.counts[1:])
+        writer.close()
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_init(self):
+        reader = pe.output.BinaryReader(self.path)
+        self.assertEqual(len(reader), 3)
+        self.assertTrue(reader.spatial)
+        self.assertEqual(reader.columns, ['Cat1', 'Cat2'])
+        self.assertEqual(reader.nb_age_groups, 4)
+        self.assertEqual(reader.cells, [cell.id for cell in self.cells])
+        np.testing.assert_array_equal(reader.locations, [[0, 1], [2, 3]])
+        self.assertIsInstance(reader.counts.base, np.memmap)
+        np.testing.assert_array_equal(reader.times, [0, 1, 2])
+        np.testing.assert_array_equal(reader.counts, self.counts)
+
+    def test_views(self):
+        reader = pe.output.BinaryReader(self.path)
+        np.testing.assert_array_equal(reader.column('Cat2'),
+                                      self.counts[:, :, 1, :])
+        np.testing.assert_array_equal(reader.cell(self.cells[1].id),
+                                      self.counts[:, 1])
+        self.assertRaises(ValueError, reader.column, 'Cat3')
+
+    def test_to_dataframe(self):
+        reader = pe.output.BinaryReader(self.path)
+        frame = reader.to_dataframe(age_stratified=False)
+        self.assertListEqual(list(frame.columns),
+                             ["time", "cell", "location_x", "location_y",
+                              "Cat1", "Cat2"])
+        self.assertEqual(len(frame), 6)
+        np.testing.assert_array_equal(frame["Cat1"],
+                                      self.counts[:, :, 0].sum(axis=2)
+                                      .ravel())
+
+    def test_truncated(self):
+        with open(self.path, 'ab') as f:
+            f.write(b'\x00' * 10)
+        reader = pe.output.BinaryReader(self.path)
+        self.assertEqual(len(reader), 3)
+
+    def test_invalid(self):
+        path = os.path.join(self.folder.name, 'invalid.bin')
+        with open(path, 'wb') as f:
+            f.write(b'time,cell\n')
+        self.assertRaises(ValueError, pe.output.BinaryReader, path)
+
+    def test_empty(self):
+        writer = pe.output._BinaryWriter(self.folder.name, 'empty.bin',
+                                         ['Cat1'])
+        writer.close()
+        reader = pe.output.BinaryReader(
+            os.path.join(self.folder.name, 'empty.bin'))
+        self.assertEqual(len(reader), 0)
+        self.assertFalse(reader.spatial)
+        self.assertEqual(reader.counts.shape, (0, 1, 1, 1))
+        self.assertRaises(ValueError, reader.cell, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
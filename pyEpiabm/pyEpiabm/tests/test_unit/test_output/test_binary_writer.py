@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch, mock_open, MagicMock
+import os
+import json
+import numpy as np
+
+import pyEpiabm as pe
+
+
+class TestBinaryWriter(unittest.TestCase):
+    """Test the methods of the '_BinaryWriter' class.
+    """
+
+    @patch('os.makedirs')
+    def test_init(self, mock_mkdir):
+        """Test the constructor method of the _BinaryWriter class.
+        """
+        mo = mock_open()
+        with patch('pyEpiabm.output._binary_writer.open', mo):
+            m = pe.output._BinaryWriter('mock_folder', 'mock_filename',
+                                        ['Cat1', 'Cat2'], 3)
+            self.assertEqual(m.dtype["counts"].shape, (1, 2, 3))
+            del m
+        mo.assert_called_once_with(
+            os.path.join('mock_folder', 'mock_filename'), 'wb')
+        header = mo().write.call_args_list[0][0][0]
+        self.assertTrue(header.startswith(pe.output._BinaryWriter.MAGIC))
+        self.assertEqual(len(header) % pe.output._BinaryWriter.ALIGNMENT, 0)
+        description = json.loads(header[12:].decode('utf-8'))
+        self.assertEqual(description["columns"], ['Cat1', 'Cat2'])
+        self.assertEqual(description["age_groups"], 3)
+        self.assertIsNone(description["cells"])
+        mock_mkdir.assert_called_with('mock_folder')
+
+    @patch('os.makedirs')
+    def test_write(self, mock_mkdir):
+        """Test the write method of the _BinaryWriter class.
+        """
+        mo = mock_open()
+        with patch('pyEpiabm.output._binary_writer.open', mo):
+            m = pe.output._BinaryWriter('mock_folder', 'mock_filename',
+                                        ['Cat1', 'Cat2'])
+            m.write(1.5, [[[4], [5]]])
+        record = np.frombuffer(mo().write.call_args_list[-1][0][0],
+                               dtype=m.dtype)
+        self.assertEqual(record["time"][0], 1.5)
+        np.testing.assert_array_equal(record["counts"][0].ravel(), [4, 5])
+
+    @patch('os.makedirs')
+    def test_del(self, mock_mkdir):
+        """Test the destructor method of the _BinaryWriter class.
+        """
+        fake_file = MagicMock()
+        with patch("builtins.open", return_value=fake_file, create=True):
+            m = pe.output._BinaryWriter('mock_folder', 'mock_filename',
+                                        ['Cat1'])
+            m.__del__()
+            fake_file.close.assert_called_once()
+            self.assertIsNone(m.f)
+
+
+if __name__ == '__main__':
+    unittest.main()
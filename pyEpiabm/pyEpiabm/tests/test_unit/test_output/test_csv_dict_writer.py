@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import os
+import pandas as pd
 
 import pyEpiabm as pe
 
@@ -38,6 +39,22 @@ class TestCsvDictWriter(unittest.TestCase):
         mo().write.assert_has_calls([call('Cat1,Cat2,Cat3\r\n'),
                                     call('a,b,c\r\n')])
 
+    @patch('os.makedirs')
+    def test_write_frame(self, mock_mkdir):
+        """Test the write_frame method of the _CsvDictWriter class.
+        """
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            mock_categories = ['Cat1', 'Cat2', 'Cat3']
+            frame = pd.DataFrame({'Cat3': ['c', 'f'], 'Cat1': [0, 1.0],
+                                  'Cat2': ['b', 'e']})
+            m = pe.output._CsvDictWriter('mock_folder', 'mock_filename',
+                                         mock_categories)
+            m.write_frame(frame)
+        mo().write.assert_has_calls([call('Cat1,Cat2,Cat3\r\n'),
+                                    call('0.0,b,c\r\n1.0,e,f\r\n')])
+        mo().flush.assert_called_once()
+
     @patch('os.makedirs')
     def test_del(self, mock_mkdir):
         """Test the destructor method of the _CsvDictWriter class.
@@ -50,6 +67,24 @@ class TestCsvDictWriter(unittest.TestCase):
             m.__del__()
             fake_file.close.assert_called_once()
 
+    @patch('os.makedirs')
+    def test_close(self, mock_mkdir):
+        """Test that the close method of the _CsvDictWriter class waits for
+        writes on its thread.
+        """
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            m = pe.output._CsvDictWriter('mock_folder', 'mock_filename',
+                                         ['Cat1'])
+            with pe.output.ReportingThread() as thread:
+                m.set_thread(thread)
+                m.write({'Cat1': 'a'})
+                m.close()
+                m.close()
+            self.assertIsNone(m.f)
+        mo().write.assert_has_calls([call('Cat1\r\n'), call('a\r\n')])
+        mo().close.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -49,6 +49,26 @@ class TestCsvWriter(unittest.TestCase):
             m.__del__()
             fake_file.close.assert_called_once()
 
+    @patch('os.makedirs')
+    def test_thread(self, mock_mkdir):
+        """Test that the _CsvWriter class writes on its thread, and waits
+        for it when closed.
+        """
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_writer.open', mo):
+            m = pe.output._CsvWriter('mock_folder', 'mock_filename',
+                                     ['1', '2', '3'])
+            thread = pe.output.ReportingThread()
+            m.set_thread(thread)
+            m.write(['a', 'b', 'c'])
+            m.write_rows([['d', 'e', 'f'], ['g', 'h', 'i']])
+            m.close()
+            self.assertIsNone(m.f)
+            thread.close()
+        mo().write.assert_has_calls([call('1,2,3\r\n'), call('a,b,c\r\n'),
+                                     call('d,e,f\r\n'), call('g,h,i\r\n')])
+        mo().close.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import patch, mock_open, call, MagicMock
 import random
 import os
+import tempfile
 
 import pyEpiabm as pe
 from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
@@ -51,6 +52,38 @@ class TestNewCasesWriter(TestPyEpiabm):
             call('t,cell,new_cases\r\n'),
             call(f'10,{p.cells[0].id},{n_new_cases}\r\n')])
 
+    def test_write_binary(self):
+        """Test the write method of the NewCasesWriter class, writing to
+        a binary file.
+        """
+        pe.Parameters.instance().time_steps_per_day = 1
+        p = pe.Population()
+        p.add_cells(2)
+        p.cells[0].add_microcells(1)
+        p.cells[0].microcells[0].add_people(3)
+        p.cells[1].add_microcells(1)
+        p.cells[1].microcells[0].add_people(2)
+        p.cells[0].persons[0].infection_start_time = 1.0
+        p.cells[0].persons[1].infection_start_time = 10.0
+        p.cells[1].persons[0].infection_start_time = 9.5
+
+        with tempfile.TemporaryDirectory() as folder:
+            m = pe.output.NewCasesWriter(folder, binary=True)
+            self.assertIsNone(m.f)
+            m.write(10, p)
+            m.write(11, p)
+            m.close()
+            self.assertIsNone(m.binary_writer.f)
+            reader = pe.output.BinaryReader(
+                os.path.join(folder, 'new_cases.bin'))
+            self.assertEqual(reader.columns, ['new_cases'])
+            self.assertEqual(reader.cells, [cell.id for cell in p.cells])
+            self.assertListEqual(reader.counts[:, :, 0, 0].tolist(),
+                                 [[1, 1], [0, 0]])
+            self.assertFalse(os.path.exists(
+                os.path.join(folder, 'new_cases.csv')))
+            del reader
+
     @patch('os.makedirs')
     def test_del(self, mock_mkdir):
         """Test the destructor method of the NewCasesWriter class.
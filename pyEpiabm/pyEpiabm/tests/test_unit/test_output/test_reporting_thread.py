@@ -0,0 +1,85 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+import pyEpiabm as pe
+
+
+class TestReportingThread(unittest.TestCase):
+    """Test the methods of the 'ReportingThread' class.
+    """
+
+    def test_init(self):
+        thread = pe.output.ReportingThread(2)
+        self.assertTrue(thread.running)
+        self.assertEqual(thread._queue.maxsize, 2)
+        thread.close()
+        self.assertFalse(thread.running)
+        self.assertRaises(ValueError, pe.output.ReportingThread, 0)
+
+    def test_submit(self):
+        results = []
+        with pe.output.ReportingThread(1) as thread:
+            for i in range(10):
+                thread.submit(results.append, i)
+        self.assertListEqual(results, list(range(10)))
+        self.assertRaises(RuntimeError, thread.submit, results.append, 10)
+
+    def test_back_pressure(self):
+        release = threading.Event()
+        task = MagicMock()
+        thread = pe.output.ReportingThread(1)
+        # The first task blocks the thread, the second fills the queue
+        thread.submit(release.wait)
+        thread.submit(task)
+        blocked = threading.Thread(target=thread.submit, args=(task,))
+        blocked.start()
+        blocked.join(0.1)
+        self.assertTrue(blocked.is_alive())
+        release.set()
+        blocked.join()
+        thread.flush()
+        self.assertEqual(task.call_count, 2)
+        thread.close()
+
+    def test_nested_submit(self):
+        results = []
+        with pe.output.ReportingThread(1) as thread:
+            thread.submit(lambda: [thread.submit(results.append, i)
+                                   for i in range(3)])
+            thread.flush()
+            self.assertListEqual(results, [0, 1, 2])
+
+    def test_error(self):
+        task = MagicMock(side_effect=OSError)
+        later_task = MagicMock()
+        release = threading.Event()
+        thread = pe.output.ReportingThread()
+        thread.submit(release.wait)
+        thread.submit(task, 1)
+        thread.submit(later_task)
+        release.set()
+        self.assertRaises(OSError, thread.close)
+        task.assert_called_once_with(1)
+        later_task.assert_not_called()
+        self.assertFalse(thread.running)
+        # The error is only raised once
+        thread.close()
+
+    def test_error_after_raised(self):
+        task = MagicMock(side_effect=OSError)
+        later_task = MagicMock()
+        thread = pe.output.ReportingThread()
+        thread.submit(task)
+        self.assertRaises(OSError, thread.flush)
+        # Tasks queued before the error was raised are still discarded
+        thread._queue.put((later_task, ()))
+        thread._queue.join()
+        later_task.assert_not_called()
+        self.assertRaises(RuntimeError, thread.submit, later_task)
+        thread.close()
+        later_task.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
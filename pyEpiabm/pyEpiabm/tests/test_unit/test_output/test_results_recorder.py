@@ -0,0 +1,112 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+import pyEpiabm as pe
+from pyEpiabm.property import InfectionStatus
+from pyEpiabm.tests.test_unit.parameter_config_tests import TestPyEpiabm
+
+
+class TestResultsRecorder(TestPyEpiabm):
+    """Test the methods of the 'ResultsRecorder' class.
+    """
+
+    def setUp(self) -> None:
+        self.nb_status = len(InfectionStatus)
+        self.counts = np.arange(2 * self.nb_status * 3).reshape(
+            2, self.nb_status, 3)
+
+    def test_init(self):
+        recorder = pe.output.ResultsRecorder(4, 3)
+        self.assertFalse(recorder.streaming)
+        self.assertEqual(len(recorder), 0)
+        self.assertEqual(recorder.capacity, 4)
+        self.assertFalse(recorder.spatial)
+        self.assertIsNone(recorder.writer)
+        self.assertEqual(recorder.counts.shape, (0, 1, self.nb_status, 3))
+        with self.assertRaises(ValueError):
+            pe.output.ResultsRecorder(4, 3, chunk_size=0)
+
+    def test_write(self):
+        recorder = pe.output.ResultsRecorder(2, 3)
+        recorder.write(0.5, [self.counts[0]])
+        recorder.write(1.5, [self.counts[1]])
+        self.assertEqual(len(recorder), 2)
+        np.testing.assert_array_equal(recorder.times, [0.5, 1.5])
+        np.testing.assert_array_equal(recorder.counts[:, 0], self.counts)
+        with self.assertRaises(ValueError):
+            recorder.write(2.5, [self.counts[0]])
+
+    def test_to_dataframe(self):
+        cells = [pe.Cell((0, 1)), pe.Cell((2, 3))]
+        recorder = pe.output.ResultsRecorder(2, 3, cells)
+        recorder.write(0, self.counts)
+        frame = recorder.to_dataframe()
+        self.assertListEqual(list(frame.columns),
+                             ["time", "age_group", "cell", "location_x",
+                              "location_y"] + list(InfectionStatus))
+        self.assertEqual(len(frame), 6)
+        row = frame.iloc[4]
+        self.assertEqual(row["age_group"], 2)
+        self.assertEqual(row["cell"], cells[1].id)
+        self.assertEqual(row["location_x"], 2)
+        self.assertEqual(row[InfectionStatus.Exposed], self.counts[1, 1, 1])
+
+        frame = recorder.to_dataframe(age_stratified=False)
+        self.assertNotIn("age_group", frame.columns)
+        self.assertEqual(len(frame), 2)
+        np.testing.assert_array_equal(frame[InfectionStatus.Susceptible],
+                                      self.counts[:, 0].sum(axis=1))
+
+    def test_stream(self):
+        with tempfile.TemporaryDirectory() as folder:
+            recorder = pe.output.ResultsRecorder(3, 3, folder=folder,
+                                                 filename='results.bin',
+                                                 chunk_size=2)
+            path = os.path.join(folder, 'results.bin')
+            recorder.writer.flush()
+            header_size = os.path.getsize(path)
+            record_size = recorder.writer.dtype.itemsize
+            recorder.write(0, [self.counts[0]])
+            self.assertEqual(os.path.getsize(path), header_size)
+            recorder.write(1, [self.counts[1]])
+            self.assertEqual(os.path.getsize(path),
+                             header_size + 2 * record_size)
+            recorder.write(2, [self.counts[1]])
+            # Only a chunk of time points is held in memory
+            self.assertTrue(recorder.streaming)
+            self.assertEqual(len(recorder._data), 2)
+            self.assertEqual(recorder.capacity, 3)
+            # Counts are read back from the file
+            np.testing.assert_array_equal(recorder.times, [0, 1, 2])
+            np.testing.assert_array_equal(recorder.counts[:, 0],
+                                          self.counts[[0, 1, 1]])
+            recorder.close()
+            self.assertIsNone(recorder.writer)
+            self.assertEqual(os.path.getsize(path),
+                             header_size + 3 * record_size)
+
+            reader = pe.output.BinaryReader(path)
+            np.testing.assert_array_equal(reader.times, [0, 1, 2])
+            np.testing.assert_array_equal(reader.counts[:2, 0], self.counts)
+            del reader
+            frame = recorder.to_dataframe()
+            self.assertEqual(len(frame), 9)
+            del frame
+
+    def test_stream_thread(self):
+        with tempfile.TemporaryDirectory() as folder:
+            recorder = pe.output.ResultsRecorder(3, 3, folder=folder,
+                                                 filename='results.bin',
+                                                 chunk_size=2)
+            with pe.output.ReportingThread() as thread:
+                recorder.set_thread(thread)
+                for time in range(3):
+                    recorder.write(time, [self.counts[time % 2]])
+                np.testing.assert_array_equal(recorder.times, [0, 1, 2])
+                recorder.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
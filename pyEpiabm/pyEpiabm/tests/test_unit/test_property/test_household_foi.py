@@ -30,27 +30,51 @@ class TestHouseholdInfection(TestPyEpiabm):
         self.infector.infectiousness = 1.0
 
     def test_house_inf(self):
-        result = HouseholdInfection.household_inf(self.infector, self.time)
+        result = HouseholdInfection.household_inf(self.infector, self.time,
+                                                  pe.SimulationConstants())
         self.assertEqual(result, 1)
         self.assertIsInstance(result, float)
 
     def test_house_susc(self):
         result = HouseholdInfection.household_susc(self.infector,
                                                    self.infectee,
-                                                   self.time)
+                                                   self.time,
+                                                   pe.SimulationConstants())
         self.assertEqual(result, 1.0)
         self.assertIsInstance(result, float)
 
     def test_house_inf_force(self):
         result = HouseholdInfection.household_foi(self.infector,
                                                   self.infectee,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
 
         self.assertEqual(result, 0.1)
         # expected value based on infectiousness(1) * susceptibiliy (1)
         # * household transmission (0.1)
         self.assertIsInstance(result, float)
 
+    def test_house_foi_matrix(self):
+        self.infectee.infectiousness = 2.0
+        self.infectee.care_home_resident = True
+        self.infector.distancing_enhanced = True
+        people = [self.infector, self.infectee]
+        for distancing in [False, True]:
+            with patch.object(self.infector.microcell, 'is_distancing',
+                              return_value=distancing):
+                result = HouseholdInfection.household_foi_matrix(
+                    people, people, self.time, pe.SimulationConstants())
+                self.assertEqual(result.shape, (2, 2))
+                for i, infector in enumerate(people):
+                    for j, infectee in enumerate(people):
+                        self.assertAlmostEqual(
+                            result[i, j], HouseholdInfection.household_foi(
+                                infector, infectee, self.time,
+                                pe.SimulationConstants()))
+        self.assertEqual(HouseholdInfection.household_foi_matrix(
+            [self.infector], [], self.time,
+            pe.SimulationConstants()).shape, (1, 0))
+
     def test_vaccine_inf_drop(self):
         self.infectee.is_vaccinated = True
         self.infector.is_vaccinated = True
@@ -59,7 +83,8 @@ class TestHouseholdInfection(TestPyEpiabm):
 
         result = HouseholdInfection.household_foi(self.infector,
                                                   self.infectee,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
 
         self.assertEqual(result, 0.05)
         # expected value based on infectiousness(1) * susceptibiliy (1) *
@@ -68,16 +93,15 @@ class TestHouseholdInfection(TestPyEpiabm):
     def test_house_case_isolation(self):
         # Not isolating (isolation_start_time = None)
         result = HouseholdInfection.household_foi(
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
 
         # Case isolate
         isolation_house_effectiveness = \
             pe.Parameters.instance().intervention_params[
                 'case_isolation']['isolation_house_effectiveness']
         self.infector.isolation_start_time = 1
-        result_isolating = HouseholdInfection.household_foi(self.infector,
-                                                            self.infectee,
-                                                            self.time)
+        result_isolating = HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertEqual(result*isolation_house_effectiveness,
                          result_isolating)
 
@@ -85,7 +109,7 @@ class TestHouseholdInfection(TestPyEpiabm):
         # Update place type, no place closure (closure_start_time = None)
         self.infector.place_types.append(PlaceType.PrimarySchool)
         result = HouseholdInfection.household_inf(
-            self.infector, self.time)
+            self.infector, self.time, pe.SimulationConstants())
 
         # Place closure
         closure_household_infectiousness = \
@@ -93,30 +117,29 @@ class TestHouseholdInfection(TestPyEpiabm):
                 'place_closure']['closure_household_infectiousness']
         self.infector.microcell.closure_start_time = 1
         result_closure = HouseholdInfection.household_inf(
-            self.infector, self.time)
+            self.infector, self.time, pe.SimulationConstants())
         self.assertEqual(result*closure_household_infectiousness,
                          result_closure)
 
     def test_house_household_quarantine(self):
         # Not in quarantine (quarantine_start_time = None)
         result = HouseholdInfection.household_foi(
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
 
         # Household quarantine
         quarantine_house_effectiveness = \
             pe.Parameters.instance().intervention_params[
                 'household_quarantine']['quarantine_house_effectiveness']
         self.infector.quarantine_start_time = 1
-        result_isolating = HouseholdInfection.household_foi(self.infector,
-                                                            self.infectee,
-                                                            self.time)
+        result_isolating = HouseholdInfection.household_foi(
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertEqual(result*quarantine_house_effectiveness,
                          result_isolating)
 
     def test_house_social_distancing(self):
         # Not in social distancing (distancing_start_time = None)
         result = HouseholdInfection.household_susc(
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
 
         # Normal social distancing
         self.infector.microcell.distancing_start_time = 1
@@ -125,7 +148,7 @@ class TestHouseholdInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_house_susc']
         result_distancing = HouseholdInfection.household_susc(
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertEqual(result*distancing_house_susc,
                          result_distancing)
 
@@ -135,7 +158,7 @@ class TestHouseholdInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_house_enhanced_susc']
         result_distancing_enhanced = HouseholdInfection.household_susc(
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertEqual(result*distancing_house_enhanced_susc,
                          result_distancing_enhanced)
 
@@ -156,21 +179,24 @@ class TestHouseholdInfection(TestPyEpiabm):
         self.infectee.care_home_resident = False
         result = HouseholdInfection.household_foi(self.infector,
                                                   self.infectee,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
         self.assertEqual(result, 2)
 
         self.infector.care_home_resident = False
         self.infectee.care_home_resident = True
         result = HouseholdInfection.household_foi(self.infector,
                                                   self.infectee,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
         self.assertEqual(result, 2)
 
         self.infector.care_home_resident = True
         self.infectee.care_home_resident = True
         result = HouseholdInfection.household_foi(self.infector,
                                                   self.infectee,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
         self.assertEqual(result, 4)
 
         self.assertEqual(mock_inf.call_count, 3)
@@ -1,4 +1,5 @@
 import unittest
+import numpy as np
 
 from pyEpiabm.property import InfectionStatus
 
@@ -20,6 +21,36 @@ class TestInfectionStatus(unittest.TestCase):
             InfectionStatus.Recovered,
             InfectionStatus.Dead]
 
+    def test_status_groups(self):
+        self.assertEqual(len(InfectionStatus.infectious), 6)
+        self.assertIn(InfectionStatus.InfectASympt,
+                      InfectionStatus.infectious)
+        self.assertNotIn(InfectionStatus.InfectASympt,
+                         InfectionStatus.symptomatic)
+        self.assertIn(InfectionStatus.InfectICURecov,
+                      InfectionStatus.symptomatic)
+        self.assertEqual(InfectionStatus.terminal,
+                         {InfectionStatus.Recovered, InfectionStatus.Dead,
+                          InfectionStatus.Vaccinated})
+        self.assertEqual(len(list(InfectionStatus)), 11)
+
+    def test_lookup_tables(self):
+        for status in InfectionStatus:
+            with self.subTest(status=status):
+                self.assertEqual(InfectionStatus.is_infectious[status.value],
+                                 status in InfectionStatus.infectious)
+                self.assertEqual(InfectionStatus.is_symptomatic[status.value],
+                                 status in InfectionStatus.symptomatic)
+                self.assertEqual(InfectionStatus.is_terminal[status.value],
+                                 status in InfectionStatus.terminal)
+        # Value 0 stands for no status
+        self.assertFalse(InfectionStatus.is_infectious[0])
+        statuses = np.array([1, 3, 9, 0])
+        self.assertEqual(InfectionStatus.is_infectious[statuses].tolist(),
+                         [False, True, False, False])
+        with self.assertRaises(ValueError):
+            InfectionStatus.is_terminal[0] = True
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -29,7 +29,8 @@ class TestPersonalInfection(TestPyEpiabm):
         cls.time = 1
 
     def test_person_inf(self):
-        result = PersonalInfection.person_inf(self.infector, self.time)
+        result = PersonalInfection.person_inf(self.infector, self.time,
+                                              pe.SimulationConstants())
         self.assertEqual(result, 0.5)
         self.assertIsInstance(result, float)
 
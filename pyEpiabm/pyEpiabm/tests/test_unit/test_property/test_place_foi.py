@@ -31,58 +31,67 @@ class TestPlaceInfection(TestPyEpiabm):
 
     def test_place_susc(self):
         result = PlaceInfection.place_susc(self.place, self.infector,
-                                           self.infectee, self.time)
+                                           self.infectee, self.time,
+                                           pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
     def test_place_inf(self):
-        result = PlaceInfection.place_inf(self.place, self.infector, self.time)
+        result = PlaceInfection.place_inf(self.place, self.infector, self.time,
+                                          pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
         # Parameter free test
         place = pe.Place((1, 1), pe.property.PlaceType.OutdoorSpace,
                          self.cell, self.microcell)
-        result = PlaceInfection.place_inf(place, self.infector, self.time)
+        result = PlaceInfection.place_inf(place, self.infector, self.time,
+                                          pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
     def test_place_foi(self):
         result = PlaceInfection.place_foi(self.place, self.infector,
-                                          self.infectee, self.time)
+                                          self.infectee, self.time,
+                                          pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
     def test_place_case_isolation(self):
         # Not isolating (isolation_start_time = None)
         result = PlaceInfection.place_foi(self.place, self.infector,
-                                          self.infectee, self.time)
+                                          self.infectee, self.time,
+                                          pe.SimulationConstants())
 
         # Case isolate
         isolation_effectiveness = pe.Parameters.instance().intervention_params[
             'case_isolation']['isolation_effectiveness']
         self.infector.isolation_start_time = 1
         result_isolating = PlaceInfection.place_foi(self.place, self.infector,
-                                                    self.infectee, self.time)
+                                                    self.infectee, self.time,
+                                                    pe.SimulationConstants())
         self.assertEqual(result*isolation_effectiveness,
                          result_isolating)
 
     def test_place_place_closure(self):
         # Update place type, not place closure (closure_start_time = None)
         self.infector.place_types.append(PlaceType.PrimarySchool)
-        result = PlaceInfection.place_inf(self.place, self.infector, self.time)
+        result = PlaceInfection.place_inf(self.place, self.infector, self.time,
+                                          pe.SimulationConstants())
         self.assertNotEqual(result, 0)
 
         # Place closure
         self.infector.microcell.closure_start_time = 1
         result_closure = PlaceInfection.place_inf(self.place, self.infector,
-                                                  self.time)
+                                                  self.time,
+                                                  pe.SimulationConstants())
         self.assertEqual(result_closure, 0)
 
     def test_place_household_quarantine(self):
         # Update place type, not in quarantine (quarantine_start_time = None)
         result = PlaceInfection.place_foi(self.place, self.infector,
-                                          self.infectee, self.time)
+                                          self.infectee, self.time,
+                                          pe.SimulationConstants())
 
         # Household quarantine
         quarantine_place_effectiveness = \
@@ -90,7 +99,8 @@ class TestPlaceInfection(TestPyEpiabm):
                 'household_quarantine']['quarantine_place_effectiveness']
         self.infector.quarantine_start_time = 1
         result_isolating = PlaceInfection.place_foi(self.place, self.infector,
-                                                    self.infectee, self.time)
+                                                    self.infectee, self.time,
+                                                    pe.SimulationConstants())
         place_idx = self.place.place_type.value - 1
         # foi scaled twice: infectiousness and susceptibility
         self.assertEqual(result*quarantine_place_effectiveness[place_idx]
@@ -100,7 +110,8 @@ class TestPlaceInfection(TestPyEpiabm):
     def test_place_social_distancing(self):
         # Not in social distancing (distancing_start_time = None)
         result = PlaceInfection.place_susc(self.place, self.infector,
-                                           self.infectee, self.time)
+                                           self.infectee, self.time,
+                                           pe.SimulationConstants())
         place_idx = self.place.place_type.value - 1
 
         # Normal social distancing
@@ -110,7 +121,8 @@ class TestPlaceInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_place_susc']
         result_distancing = PlaceInfection.place_susc(
-            self.place, self.infector, self.infectee, self.time)
+            self.place, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertEqual(result*distancing_place_susc[place_idx],
                          result_distancing)
         # Enhanced social distancing
@@ -119,7 +131,8 @@ class TestPlaceInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_place_enhanced_susc']
         result_distancing_enhanced = PlaceInfection.place_susc(
-            self.place, self.infector, self.infectee, self.time)
+            self.place, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertEqual(result*distancing_place_enhanced_susc[place_idx],
                          result_distancing_enhanced)
 
@@ -135,7 +148,8 @@ class TestPlaceInfection(TestPyEpiabm):
         self.infector.key_worker = True
         self.infectee.key_worker = False
         result = PlaceInfection.place_foi(self.place, self.infector,
-                                          self.infectee, self.time)
+                                          self.infectee, self.time,
+                                          pe.SimulationConstants())
         self.assertEqual(result, 2)
 
         self.assertEqual(mock_inf.call_count, 1)
@@ -35,7 +35,8 @@ class TestSpatialInfection(TestPyEpiabm):
 
     def test_spatial_susc(self):
         result = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
@@ -43,13 +44,14 @@ class TestSpatialInfection(TestPyEpiabm):
     def test_spatial_susc_no_age(self, mock_params):
         mock_params.return_value.use_ages = False
         result = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertIsInstance(result, float)
         self.assertEqual(result, 1.0)
 
     def test_spatial_inf(self):
         result = SpatialInfection.spatial_inf(
-            self.cell, self.infector, self.time)
+            self.cell, self.infector, self.time, pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
@@ -57,21 +59,21 @@ class TestSpatialInfection(TestPyEpiabm):
     def test_spatial_inf_no_age(self, mock_params):
         mock_params.return_value.use_ages = False
         result = SpatialInfection.spatial_inf(
-            self.cell, self.infector, self.time)
+            self.cell, self.infector, self.time, pe.SimulationConstants())
         self.assertIsInstance(result, float)
         self.assertEqual(result, self.infector.infectiousness)
 
     def test_spatial_foi(self):
         result = SpatialInfection.spatial_foi(
             self.cell, self.cell,
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertTrue(result > 0)
         self.assertIsInstance(result, float)
 
     def test_cell_inf(self):
         self.infector.update_status(InfectionStatus.InfectMild)
         result = SpatialInfection.cell_inf(self.cell,
-                                           self.time)
+                                           self.time, pe.SimulationConstants())
         self.assertIsInstance(result, float)
         self.assertTrue(result >= 0)
 
@@ -79,7 +81,7 @@ class TestSpatialInfection(TestPyEpiabm):
         # Not isolating (isolation_start_time = None)
         result = SpatialInfection.spatial_foi(
             self.cell, self.cell,
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
 
         # Case isolate
         isolation_effectiveness = \
@@ -88,7 +90,7 @@ class TestSpatialInfection(TestPyEpiabm):
         self.infector.isolation_start_time = 1
         result_isolating = SpatialInfection.spatial_foi(
             self.cell, self.cell,
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         self.assertEqual(result*isolation_effectiveness,
                          result_isolating)
 
@@ -96,9 +98,10 @@ class TestSpatialInfection(TestPyEpiabm):
         # Update place type, not place closure (closure_start_time = None)
         self.infector.place_types.append(PlaceType.PrimarySchool)
         result_susc = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         result_inf = SpatialInfection.spatial_inf(
-            self.cell, self.infector, self.time)
+            self.cell, self.infector, self.time, pe.SimulationConstants())
 
         # Update start time
         closure_spatial_params = \
@@ -108,13 +111,14 @@ class TestSpatialInfection(TestPyEpiabm):
 
         # Place closure susceptibility
         result_closure_susc = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertEqual(result_susc*closure_spatial_params,
                          result_closure_susc)
 
         # Place closure infectiousness
         result_closure_inf = SpatialInfection.spatial_inf(
-            self.cell, self.infector, self.time)
+            self.cell, self.infector, self.time, pe.SimulationConstants())
         self.assertEqual(result_inf*closure_spatial_params,
                          result_closure_inf)
 
@@ -122,7 +126,7 @@ class TestSpatialInfection(TestPyEpiabm):
         # Not in quarantine (quarantine_start_time = None)
         result = SpatialInfection.spatial_foi(
             self.cell, self.cell,
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
 
         quarantine_spatial_effectiveness = \
             pe.Parameters.instance().intervention_params[
@@ -130,7 +134,7 @@ class TestSpatialInfection(TestPyEpiabm):
         self.infector.quarantine_start_time = 1
         result_isolating = SpatialInfection.spatial_foi(
             self.cell, self.cell,
-            self.infector, self.infectee, self.time)
+            self.infector, self.infectee, self.time, pe.SimulationConstants())
         # foi scaled twice: infectiousness and susceptibility
         self.assertEqual(result*quarantine_spatial_effectiveness
                          * quarantine_spatial_effectiveness,
@@ -139,7 +143,8 @@ class TestSpatialInfection(TestPyEpiabm):
     def test_spatial_social_distancing(self):
         # Not in social distancing (distancing_start_time = None)
         result = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
 
         # Normal social distancing
         self.infector.microcell.distancing_start_time = 1
@@ -148,7 +153,8 @@ class TestSpatialInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_spatial_susc']
         result_distancing = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertEqual(result*distancing_spatial_susc,
                          result_distancing)
 
@@ -158,7 +164,8 @@ class TestSpatialInfection(TestPyEpiabm):
             intervention_params['social_distancing'][
                 'distancing_spatial_enhanced_susc']
         result_distancing_enhanced = SpatialInfection.spatial_susc(
-            self.cell, self.infector, self.infectee, self.time)
+            self.cell, self.infector, self.infectee, self.time,
+            pe.SimulationConstants())
         self.assertEqual(result*distancing_spatial_enhanced_susc,
                          result_distancing_enhanced)
 
@@ -174,21 +181,24 @@ class TestSpatialInfection(TestPyEpiabm):
         self.infectee.care_home_resident = False
         result = SpatialInfection.spatial_foi(self.cell, self.cell,
                                               self.infector, self.infectee,
-                                              self.time)
+                                              self.time,
+                                              pe.SimulationConstants())
         self.assertEqual(result, 4)
 
         self.infector.care_home_resident = False
         self.infectee.care_home_resident = True
         result = SpatialInfection.spatial_foi(self.cell, self.cell,
                                               self.infector, self.infectee,
-                                              self.time)
+                                              self.time,
+                                              pe.SimulationConstants())
         self.assertEqual(result, 2)
 
         self.infector.care_home_resident = True
         self.infectee.care_home_resident = True
         result = SpatialInfection.spatial_foi(self.cell, self.cell,
                                               self.infector, self.infectee,
-                                              self.time)
+                                              self.time,
+                                              pe.SimulationConstants())
         self.assertEqual(result, 4)
 
         self.assertEqual(mock_inf.call_count, 3)
@@ -2,7 +2,7 @@ import os
 import random
 import numpy as np
 import unittest
-from unittest.mock import patch, mock_open
+from unittest.mock import patch, mock_open, MagicMock
 
 import pyEpiabm as pe
 
@@ -145,6 +145,35 @@ class TestSimulation(TestMockedLogs):
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('pyEpiabm.routine.simulation.tqdm', notqdm)
+    @patch('os.makedirs')
+    def test_run_sweeps_async(self, mock_mkdir):
+        writer = pe.output.AbstractReporter(self.mock_output_dir)
+        writer.write = MagicMock()
+        writer.close = MagicMock()
+        for async_output in [True, False]:
+            file_params = dict(self.file_params)
+            file_params["async_output"] = async_output
+            mo = mock_open()
+            with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+                test_sim = pe.routine.Simulation()
+                test_sim.configure(self.test_population, self.initial_sweeps,
+                                   self.sweeps, self.sim_params, file_params)
+                test_sim.add_writer(writer)
+                threads = []
+                writer.set_thread = MagicMock(side_effect=threads.append)
+                test_sim.run_sweeps()
+            self.assertEqual(threads[0] is not None, async_output)
+            self.assertIsNone(threads[-1])
+            self.assertIsNone(test_sim.reporting_thread)
+            self.assertIsNone(test_sim.writer.f)
+            writer.close.assert_called()
+            # Header, and a chunk with a line for each time point
+            self.assertEqual(mo().write.call_count, 2)
+            zeros = ",0" * len(pe.property.InfectionStatus)
+            self.assertEqual(mo().write.call_args.args[0],
+                             f"0{zeros}\r\n1.0{zeros}\r\n")
+
     @patch('os.makedirs')
     @patch('logging.exception')
     @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
@@ -164,9 +193,46 @@ class TestSimulation(TestMockedLogs):
             broken_sim.run_sweeps()
             patch_log.assert_called_once_with("NotImplementedError in"
                                               + " Simulation.run_sweeps()")
+            # Output files are closed even though the simulation failed
+            self.assertIsNone(broken_sim.writer.f)
+            self.assertIsNone(broken_sim.reporting_thread)
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('os.makedirs')
+    @patch('logging.exception')
+    @patch('pyEpiabm.sweep.InitialInfectedSweep.__call__')
+    def test_run_sweeps_close_exception(self, patch_initial, patch_log,
+                                        mock_mkdir):
+        patch_initial.side_effect = NotImplementedError
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            broken_sim = pe.routine.Simulation()
+            broken_sim.configure(self.test_population, self.initial_sweeps,
+                                 self.sweeps, self.sim_params,
+                                 self.file_params)
+            with patch.object(broken_sim.recorder, 'close',
+                              side_effect=ValueError):
+                broken_sim.run_sweeps()
+        # The error of the simulation is raised, rather than the error
+        # closing the output
+        self.assertListEqual(
+            [call.args[0] for call in patch_log.call_args_list],
+            ["ValueError closing the output of a failed simulation",
+             "NotImplementedError in Simulation.run_sweeps()"])
+
+        # Errors closing the output are raised if the simulation succeeds
+        patch_initial.side_effect = None
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params,
+                               self.file_params)
+            with patch.object(test_sim.writer, 'close',
+                              side_effect=ValueError):
+                test_sim.run_sweeps()
+        patch_log.assert_called_with("ValueError in Simulation.run_sweeps()")
+
     @patch('os.makedirs')
     def test_write_to_file(self, mock_mkdir):
 
@@ -184,9 +250,12 @@ class TestSimulation(TestMockedLogs):
             data["age_group"] = len(pe.Parameters.instance().age_proportions)
             data["time"] = time
 
-            with patch.object(test_sim.writer, 'write') as mock:
+            with patch.object(test_sim.writer, 'write_frame') as mock:
                 test_sim.write_to_file(time)
-                mock.assert_called_with(data)
+                test_sim.export_csv()
+                mock.assert_called_once()
+                self.assertDictEqual(
+                    mock.call_args.args[0].iloc[-1].to_dict(), data)
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
@@ -203,9 +272,12 @@ class TestSimulation(TestMockedLogs):
             data["cell"] = test_sim.population.cells[0].id
             data['location_x'] = 0
             data['location_y'] = 0
-            with patch.object(test_sim.writer, 'write') as mock:
+            with patch.object(test_sim.writer, 'write_frame') as mock:
                 test_sim.write_to_file(time)
-                mock.assert_called_with(data)
+                test_sim.export_csv()
+                mock.assert_called_once()
+                self.assertDictEqual(
+                    mock.call_args.args[0].iloc[-1].to_dict(), data)
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
         with patch('pyEpiabm.output._csv_dict_writer.open', mo):
@@ -215,12 +287,34 @@ class TestSimulation(TestMockedLogs):
                                self.sweeps, self.sim_params, self.file_params)
             data = {s: 0 for s in list(pe.property.InfectionStatus)}
             data["time"] = time
-            with patch.object(test_sim.writer, 'write') as mock:
+            with patch.object(test_sim.writer, 'write_frame') as mock:
                 test_sim.write_to_file(time)
-                mock.assert_called_with(data)
+                test_sim.export_csv()
+                mock.assert_called_once()
+                self.assertDictEqual(
+                    mock.call_args.args[0].iloc[-1].to_dict(), data)
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('os.makedirs')
+    def test_export_csv_chunks(self, mock_mkdir):
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params, self.file_params)
+            test_sim.recorder.chunk_size = 2
+            with patch.object(test_sim.writer, 'write_frame') as mock:
+                test_sim.write_to_file(0)
+                mock.assert_not_called()
+                # Exported once a chunk of time points is recorded
+                test_sim.write_to_file(1.0)
+                mock.assert_called_once()
+                self.assertListEqual(
+                    list(mock.call_args.args[0]["time"]), [0, 1.0])
+                test_sim.export_csv()
+                mock.assert_called_once()
+
     @patch('os.makedirs')
     def test_s_write_to_file(self, mock_mkdir):
         # For spatial option to write to file
@@ -239,12 +333,55 @@ class TestSimulation(TestMockedLogs):
             data["location_x"] = cell.location[0]
             data["location_y"] = cell.location[0]
 
-            with patch.object(spatial_sim.writer, 'write') as mock:
+            with patch.object(spatial_sim.writer, 'write_frame') as mock:
                 spatial_sim.write_to_file(time)
-                mock.assert_called_with(data)
+                spatial_sim.export_csv()
+                mock.assert_called_once()
+                self.assertDictEqual(
+                    mock.call_args.args[0].iloc[-1].to_dict(), data)
         mock_mkdir.assert_called_with(os.path.join(os.getcwd(),
                                       self.file_params["output_dir"]))
 
+    @patch('os.makedirs')
+    def test_results(self, mock_mkdir):
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            spatial_sim = pe.routine.Simulation()
+            spatial_sim.configure(self.test_population, self.initial_sweeps,
+                                  self.sweeps, self.sim_params,
+                                  self.spatial_file_params)
+        nb_age_groups = len(pe.Parameters.instance().age_proportions)
+        self.assertEqual(spatial_sim.recorder.capacity, 2)
+        spatial_sim.write_to_file(0)
+        spatial_sim.write_to_file(1)
+        self.assertEqual(spatial_sim.recorder.counts.shape,
+                         (2, 1, len(pe.property.InfectionStatus),
+                          nb_age_groups))
+        results = spatial_sim.results
+        self.assertEqual(len(results), 2 * nb_age_groups)
+        self.assertListEqual(list(results.columns[:5]),
+                             ["time", "age_group", "cell", "location_x",
+                              "location_y"])
+        np.testing.assert_array_equal(results["time"].unique(), [0, 1])
+
+    @patch('pyEpiabm.output._binary_writer.open')
+    @patch('os.makedirs')
+    def test_no_csv_output(self, mock_mkdir, mock_open_recorder):
+        file_params = dict(self.file_params)
+        file_params["csv_output"] = False
+        file_params["results_file"] = "results.bin"
+        mo = mock_open()
+        with patch('pyEpiabm.output._csv_dict_writer.open', mo):
+            test_sim = pe.routine.Simulation()
+            test_sim.configure(self.test_population, self.initial_sweeps,
+                               self.sweeps, self.sim_params, file_params)
+        mo.assert_not_called()
+        self.assertIsNone(test_sim.writer)
+        mock_open_recorder.assert_called_once_with(
+            os.path.join(os.getcwd(), self.file_params["output_dir"],
+                         "results.bin"), 'wb')
+        test_sim.recorder.close()
+
     def test_set_random_seed(self):
         pe.routine.Simulation.set_random_seed(seed=0)
         value = random.random()
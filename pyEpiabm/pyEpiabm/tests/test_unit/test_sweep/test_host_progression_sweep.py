@@ -477,16 +477,13 @@ class TestHostProgressionSweep(TestPyEpiabm):
     @mock.patch(
         'pyEpiabm.sweep.HostProgressionSweep.asympt_uninf_testing_queue')
     @mock.patch('pyEpiabm.Parameters.instance')
-    @mock.patch('pyEpiabm.utility.InverseCdf.icdf_choose_noexp')
-    def test_call_main(self, mock_next_time, mock_param,
-                       mock_asympt, mock_sympt):
+    def test_call_main(self, mock_param, mock_asympt, mock_sympt):
         """Tests the main function of the Host Progression Sweep.
         Person 1 is set to susceptible and becoming exposed. Person 2 is set to
         exposed and becoming infectious in one time step. Checks the
         population updates as expected. Check that Person 3 stays as
         susceptible.
         """
-        mock_next_time.return_value = 1.0
         mock_param.return_value.host_progression_lists = self.coefficients
         mock_param.return_value.latent_to_sympt_delay = 1
         mock_param.return_value.time_steps_per_day = 1
@@ -494,6 +491,8 @@ class TestHostProgressionSweep(TestPyEpiabm):
         mock_param.return_value.asympt_infect_period = 14
         mock_param.return_value.sympt_infectiousness = 1.5
         mock_param.return_value.infectiousness_prof = self.mock_inf_prog
+        # Uninfected people are only listed if disease testing is used
+        mock_param.return_value.intervention_params = {"disease_testing": {}}
         # First check that people progress through the
         # infection stages correctly.
         self.person2.update_status(pe.property.InfectionStatus.Exposed)
@@ -506,6 +505,8 @@ class TestHostProgressionSweep(TestPyEpiabm):
             pe.property.InfectionStatus.Exposed
         test_sweep = pe.sweep.HostProgressionSweep()
         test_sweep.bind_population(self.test_population1)
+        # Every transition takes one day
+        test_sweep._fixed_times[:] = 1.0
 
         # Tests population bound successfully.
         self.assertEqual(test_sweep._population.cells[0].persons[1].
@@ -529,9 +530,10 @@ class TestHostProgressionSweep(TestPyEpiabm):
         self.assertIsInstance(self.person1.time_of_status_change, float)
         self.assertTrue(2.0 <= self.person2.time_of_status_change <= 11.0)
         self.assertTrue(0.0 <= self.person1.time_of_status_change)
-        self.assertEqual(mock_next_time.call_count, 2)
+        self.assertEqual(self.person1.time_of_status_change, 2.0)
 
-        mock_asympt.assert_called_once_with([(self.cell, self.person3)], 1.0)
+        mock_asympt.assert_called_once_with([(self.cell, self.person3)], 1.0,
+                                            test_sweep._constants)
         self.assertEqual(mock_sympt.call_count, 2)
 
     def test_call_specific(self):
@@ -588,10 +590,25 @@ class TestHostProgressionSweep(TestPyEpiabm):
 
         mock_asympt.assert_called_with([(self.cell, self.person1),
                                         (self.cell, self.person2),
-                                        (self.cell, self.person3)], 1.0)
+                                        (self.cell, self.person3)], 1.0,
+                                       test_sweep._constants)
 
-    @mock.patch('pyEpiabm.utility.InverseCdf.icdf_choose_noexp')
-    def test_multiple_transitions_in_one_time_step(self, mock_next_time):
+        # People who recover in a time step are listed from the next one
+        self.person3.next_infection_status = InfectionStatus.Recovered
+        self.person3.time_of_status_change = 2.0
+        test_sweep(2.0)
+        mock_asympt.assert_called_with([(self.cell, self.person1),
+                                        (self.cell, self.person2)], 2.0,
+                                       test_sweep._constants)
+        self.assertEqual(self.person3.infection_status,
+                         InfectionStatus.Recovered)
+        test_sweep(3.0)
+        mock_asympt.assert_called_with([(self.cell, self.person1),
+                                        (self.cell, self.person2),
+                                        (self.cell, self.person3)], 3.0,
+                                       test_sweep._constants)
+
+    def test_multiple_transitions_in_one_time_step(self):
         """Reconfigure population and check that a person is able to progress
         infection status multiple times in the same time step. This will be
         checked by setting the time transition time to 0 so Person 1 should
@@ -599,17 +616,203 @@ class TestHostProgressionSweep(TestPyEpiabm):
         up as either recovered or dead in one time step.
         """
 
-        mock_next_time.return_value = 0.0
         self.person1.time_of_status_change = 1.0
         self.person1.update_status(InfectionStatus.Susceptible)
         self.person1.next_infection_status = InfectionStatus.Exposed
         test_sweep = pe.sweep.HostProgressionSweep()
         test_sweep.bind_population(self.test_population1)
+        test_sweep._fixed_times[:] = 0.0
+        test_sweep.delay = 0
         test_sweep(1.0)
         self.assertIn(self.person1.infection_status,
                       [InfectionStatus.Recovered,
                        InfectionStatus.Dead])
 
+    @mock.patch('pyEpiabm.sweep.HostProgressionSweep.'
+                + 'update_time_status_change_batch')
+    @mock.patch('pyEpiabm.sweep.HostProgressionSweep.'
+                + 'update_next_infection_status_batch')
+    def test_call_event_driven(self, mock_next, mock_times):
+        """Tests that the event driven sweep only visits the people whose
+        status change is due.
+        """
+        def set_times(store, rows, time):
+            store.time_of_status_change[rows] = np.inf
+        mock_times.side_effect = set_times
+        self.person1.time_of_status_change = None
+        self.person2.time_of_status_change = 1.0
+        self.person2.update_status(InfectionStatus.Exposed)
+        self.person2.next_infection_status = InfectionStatus.InfectMild
+        self.person3.time_of_status_change = 5.0
+        self.person3.update_status(InfectionStatus.Exposed)
+        self.person3.next_infection_status = InfectionStatus.InfectMild
+        test_sweep = pe.sweep.HostProgressionSweep(event_driven=True)
+        test_sweep.bind_population(self.test_population1)
+
+        test_sweep(1.0)
+        mock_next.assert_called_once()
+        self.assertEqual(mock_next.call_args.args[1].tolist(),
+                         [self.person2._row])
+        self.assertEqual(self.person2.infection_status,
+                         InfectionStatus.InfectMild)
+        test_sweep(2.0)
+        self.assertEqual(mock_next.call_count, 1)
+        test_sweep(6.0)
+        self.assertEqual(mock_next.call_count, 2)
+        self.assertEqual(mock_next.call_args.args[1].tolist(),
+                         [self.person3._row])
+        self.assertEqual(self.person1.infection_status,
+                         InfectionStatus.Susceptible)
+
+    def test_update_store_infectiousness(self):
+        """Tests that the infectiousness of the infectious people of the
+        cell is scaled, without changing anyone else.
+        """
+        test_sweep = pe.sweep.HostProgressionSweep()
+        self.person2.update_status(InfectionStatus.InfectMild)
+        self.person2.infection_start_time = 0.0
+        self.person2.initial_infectiousness = 2.0
+        self.person3.update_status(InfectionStatus.InfectASympt)
+        self.person3.infectiousness = 0.5
+        self.person1.infectiousness = 1.0
+        test_sweep._update_store_infectiousness(self.cell, 2.0)
+        step = int(2.0 / test_sweep.model_time_step)
+        self.assertAlmostEqual(
+            self.person2.infectiousness,
+            2.0 * test_sweep.infectiousness_progression[step])
+        # Infections which have not started, and people who are not
+        # infectious, are left as they are
+        self.assertEqual(self.person3.infectiousness, 0.5)
+        self.assertEqual(self.person1.infectiousness, 1.0)
+
+    @mock.patch(
+        'pyEpiabm.sweep.HostProgressionSweep.asympt_uninf_testing_queue')
+    def test_event_driven_progression(self, mock_asympt):
+        """Tests that both modes take every initially infected person
+        through to recovery.
+        """
+        pop_params = {"population_size": 50, "cell_number": 1,
+                      "microcell_number": 1, "household_number": 5,
+                      "population_seed": 1}
+        sim_params = {"initial_infected_number": 10,
+                      "simulation_start_time": 0}
+        for event_driven in [False, True]:
+            population = pe.routine.ToyPopulationFactory.make_pop(pop_params)
+            test_sweep = pe.sweep.HostProgressionSweep(event_driven)
+            test_sweep.bind_population(population)
+            initial_sweep = pe.sweep.InitialInfectedSweep()
+            initial_sweep.bind_population(population)
+            pe.routine.Simulation.set_random_seed(2)
+            initial_sweep(sim_params)
+            infected = [p for p in population.cells[0].persons
+                        if p.infection_status != InfectionStatus.Susceptible]
+            self.assertEqual(len(infected), 10)
+            for t in range(1, 100):
+                test_sweep(float(t))
+            for person in infected:
+                self.assertEqual(person.infection_status,
+                                 InfectionStatus.Recovered)
+                self.assertEqual(person.infectiousness, 0)
+
+    @mock.patch(
+        'pyEpiabm.sweep.HostProgressionSweep.asympt_uninf_testing_queue')
+    def test_event_driven_matches_sweep(self, mock_asympt):
+        """Tests that both modes give the same population history, given
+        the same random seed.
+        """
+        pop_params = {"population_size": 50, "cell_number": 1,
+                      "microcell_number": 1, "household_number": 5,
+                      "population_seed": 1}
+        sim_params = {"initial_infected_number": 10,
+                      "simulation_start_time": 0}
+        histories = []
+        for event_driven in [False, True]:
+            population = pe.routine.ToyPopulationFactory.make_pop(pop_params)
+            test_sweep = pe.sweep.HostProgressionSweep(event_driven)
+            test_sweep.bind_population(population)
+            initial_sweep = pe.sweep.InitialInfectedSweep()
+            initial_sweep.bind_population(population)
+            pe.routine.Simulation.set_random_seed(2)
+            initial_sweep(sim_params)
+            history = []
+            for t in range(1, 30):
+                test_sweep(float(t))
+                history.append([(p.infection_status, p.infectiousness,
+                                 p.time_of_status_change)
+                                for p in population.cells[0].persons])
+            histories.append(history)
+        self.assertEqual(histories[0], histories[1])
+        # The population does change over time
+        self.assertNotEqual(histories[0][0], histories[0][-1])
+
+    def test_update_next_infection_status_batch(self):
+        """Tests that the batch update draws from the compiled transition
+        table, and sends carehome residents in ICU to death.
+        """
+        test_sweep = pe.sweep.HostProgressionSweep()
+        store = self.cell.population_store
+        rows = np.array([self.person1._row, self.person2._row,
+                         self.person3._row])
+        self.person1.update_status(InfectionStatus.Exposed)
+        self.person2.update_status(InfectionStatus.InfectICU)
+        self.person2.care_home_resident = True
+        self.person3.update_status(InfectionStatus.Recovered)
+        test_sweep._cumulative_probabilities[:] = 0
+        test_sweep._cumulative_probabilities[
+            :, InfectionStatus.Exposed.value - 1,
+            InfectionStatus.InfectMild.value - 1:] = 1
+        test_sweep.update_next_infection_status_batch(store, rows)
+        self.assertEqual(self.person1.next_infection_status,
+                         InfectionStatus.InfectMild)
+        self.assertEqual(self.person2.next_infection_status,
+                         InfectionStatus.Dead)
+        self.assertIsNone(self.person3.next_infection_status)
+
+        # Draws are kept to valid statuses, even if a row ends below one
+        test_sweep._cumulative_probabilities[
+            :, InfectionStatus.Exposed.value - 1, -1] = 0.9
+        with mock.patch('numpy.random.random', return_value=np.ones(3)):
+            test_sweep.update_next_infection_status_batch(store, rows)
+        self.assertEqual(self.person1.next_infection_status,
+                         InfectionStatus(len(InfectionStatus)))
+
+    def test_update_time_status_change_batch(self):
+        """Tests that the batch update uses fixed transition times where
+        available, and never schedules terminal states.
+        """
+        test_sweep = pe.sweep.HostProgressionSweep()
+        test_sweep.delay = 0
+        store = self.cell.population_store
+        rows = np.array([self.person1._row, self.person2._row])
+        self.person1.update_status(InfectionStatus.Exposed)
+        self.person1.next_infection_status = InfectionStatus.InfectMild
+        self.person2.update_status(InfectionStatus.Recovered)
+        self.person2.next_infection_status = None
+        test_sweep._fixed_times[InfectionStatus.Exposed.value - 1,
+                                InfectionStatus.InfectMild.value - 1] = 3.0
+        test_sweep.update_time_status_change_batch(store, rows, 2.0)
+        self.assertEqual(self.person1.time_of_status_change, 5.0)
+        self.assertEqual(self.person2.time_of_status_change, np.inf)
+
+        # Times of the same transition are drawn together from its icdf
+        self.person2.update_status(InfectionStatus.Exposed)
+        self.person2.next_infection_status = InfectionStatus.InfectMild
+        test_sweep._fixed_times[InfectionStatus.Exposed.value - 1,
+                                InfectionStatus.InfectMild.value - 1] = np.nan
+        icdf = mock.Mock()
+        icdf.icdf_choose_noexp_batch.return_value = np.array([1.0, 4.0])
+        test_sweep._icdfs[InfectionStatus.Exposed.value - 1,
+                          InfectionStatus.InfectMild.value - 1] = icdf
+        test_sweep.update_time_status_change_batch(store, rows, 2.0)
+        icdf.icdf_choose_noexp_batch.assert_called_once_with(2)
+        self.assertEqual(self.person1.time_of_status_change, 3.0)
+        self.assertEqual(self.person2.time_of_status_change, 6.0)
+
+        self.person1.update_status(InfectionStatus.Susceptible)
+        self.assertRaises(ValueError,
+                          test_sweep.update_time_status_change_batch,
+                          store, rows, 2.0)
+
     @mock.patch('random.random')
     def test_sympt_queue(self, mock_random):
         mock_random.return_value = 0
@@ -626,9 +829,12 @@ class TestHostProgressionSweep(TestPyEpiabm):
         self.person1.care_home_resident = True
         self.person2.key_worker = True
 
-        test_sweep.sympt_testing_queue(self.cell, self.person1)
-        test_sweep.sympt_testing_queue(self.cell, self.person2)
-        test_sweep.sympt_testing_queue(self.cell, self.person3)
+        test_sweep.sympt_testing_queue(self.cell, self.person1,
+                                       pe.SimulationConstants())
+        test_sweep.sympt_testing_queue(self.cell, self.person2,
+                                       pe.SimulationConstants())
+        test_sweep.sympt_testing_queue(self.cell, self.person3,
+                                       pe.SimulationConstants())
 
         self.assertEqual(self.cell.PCR_queue.qsize(), 3)
         self.assertEqual(self.cell.LFT_queue.qsize(), 0)
@@ -636,7 +842,8 @@ class TestHostProgressionSweep(TestPyEpiabm):
         self.person1.date_positive = 1
         self.person1.next_infection_status = InfectionStatus.Recovered
 
-        test_sweep.sympt_testing_queue(self.cell, self.person1)
+        test_sweep.sympt_testing_queue(self.cell, self.person1,
+                                       pe.SimulationConstants())
 
         self.assertIsNone(self.person1.date_positive)
 
@@ -656,11 +863,34 @@ class TestHostProgressionSweep(TestPyEpiabm):
                                        {'sympt_pcr': [-1, -1, -1],
                                         'testing_sympt': [0.5, 0.5, 0.5]}}
 
-            test_sweep.sympt_testing_queue(self.cell, self.person2)
+            test_sweep.sympt_testing_queue(self.cell, self.person2,
+                                           pe.SimulationConstants())
             self.assertEqual(self.cell.LFT_queue.qsize(), 1)
 
         self.assertEqual(mock_random.call_count, 2)
 
+    @mock.patch('random.random')
+    def test_key_worker_queue(self, mock_random):
+        mock_random.return_value = 0.5
+        test_sweep = pe.sweep.HostProgressionSweep()
+
+        self.person2.update_status(InfectionStatus.InfectMild)
+        self.person2.date_positive = None
+        self.person2.key_worker = True
+
+        with mock.patch('pyEpiabm.Parameters.instance') as mock_param:
+            mock_param.return_value.\
+                intervention_params = {'disease_testing':
+                                       {'sympt_pcr': [0, 1, 0],
+                                        'testing_sympt': [0, 1, 0]}}
+            constants = pe.SimulationConstants()
+
+        # Key workers use the second PCR probability
+        test_sweep.sympt_testing_queue(self.cell, self.person2, constants)
+        self.assertEqual(self.cell.PCR_queue.qsize(), 1)
+        self.assertEqual(self.cell.LFT_queue.qsize(), 0)
+        self.person2.key_worker = False
+
     @mock.patch('random.random')
     def test_asympt_queue(self, mock_random):
         mock_random.return_value = 0
@@ -681,7 +911,8 @@ class TestHostProgressionSweep(TestPyEpiabm):
         person_list = [(self.cell, self.person1), (self.cell, self.person2),
                        (self.cell, self.person3)]
 
-        test_sweep.asympt_uninf_testing_queue(person_list, 1.0)
+        test_sweep.asympt_uninf_testing_queue(person_list, 1.0,
+                                              pe.SimulationConstants())
 
         self.assertEqual(self.cell.PCR_queue.qsize(), 3)
         self.assertEqual(self.cell.LFT_queue.qsize(), 0)
@@ -689,13 +920,14 @@ class TestHostProgressionSweep(TestPyEpiabm):
         self.person3.date_positive = 0
         person_list_2 = [(self.cell, self.person3)]
 
-        test_sweep.asympt_uninf_testing_queue(person_list_2, 10.0)
+        test_sweep.asympt_uninf_testing_queue(person_list_2, 10.0,
+                                              pe.SimulationConstants())
         self.assertIsNone(self.person3.date_positive)
 
         self.person1.update_status(InfectionStatus.InfectMild)
         person_list_3 = [(self.cell, self.person1)]
         self.assertRaises(ValueError, test_sweep.asympt_uninf_testing_queue,
-                          person_list_3, 1.0)
+                          person_list_3, 1.0, pe.SimulationConstants())
 
         self.assertEqual(mock_random.call_count, 8)
 
@@ -1,4 +1,6 @@
+import random
 import unittest
+import numpy as np
 from unittest import mock
 from queue import Queue
 
@@ -81,6 +83,78 @@ class TestHouseholdSweep(TestPyEpiabm):
         self.test_sweep(self.time)
         self.assertTrue(self.cell.person_queue.empty())
 
+    def test_infection_probabilities(self):
+        foi = np.array([[0.5, 0.0, 2.0],
+                        [0.5, -1.0, 0.1]])
+        probabilities = pe.sweep.HouseholdSweep.infection_probabilities(foi)
+        np.testing.assert_array_almost_equal(probabilities, [0.75, 0, 1])
+
+    @mock.patch('pyEpiabm.property.HouseholdInfection'
+                + '.household_carehome_susc')
+    @mock.patch('pyEpiabm.property.HouseholdInfection.household_foi_susc')
+    @mock.patch('pyEpiabm.property.HouseholdInfection.household_foi_inf')
+    def test_aggregated_matches_pairwise(self, mock_inf, mock_susc,
+                                         mock_carehome):
+        """Tests that the aggregated sweep infects each household member
+        with the same probability as the pairwise sweep.
+        """
+        pop = pe.Population()
+        pop.add_cells(1)
+        cell = pop.cells[0]
+        cell.add_microcells(1)
+        microcell = cell.microcells[0]
+        microcell.add_people(5)
+        microcell.add_household(microcell.persons)
+        infectors = microcell.persons[:3]
+        infectees = microcell.persons[3:]
+        for infector in infectors:
+            infector.update_status(pe.property.InfectionStatus.Exposed)
+            infector.update_status(pe.property.InfectionStatus.InfectMild)
+        infectiousness = {infectors[0]: 0.1, infectors[1]: 0.2,
+                          infectors[2]: 0.3}
+        susceptibility = {infectees[0]: 1.0, infectees[1]: 0.5}
+        mock_inf.side_effect = lambda infector, time, constants: \
+            infectiousness[infector]
+        mock_susc.side_effect = lambda infector, infectee, time, constants: \
+            susceptibility[infectee]
+        # The aggregated sweep combines the infectee's part separately
+        mock_carehome.side_effect = lambda infectee, constants: \
+            susceptibility[infectee]
+        expected = [1 - 0.9 * 0.8 * 0.7, 1 - 0.95 * 0.9 * 0.85]
+
+        trials = 2000
+        np.random.seed(1)
+        random.seed(1)
+        for aggregated in [False, True]:
+            test_sweep = pe.sweep.HouseholdSweep(aggregated)
+            test_sweep.bind_population(pop)
+            counts = {infectee: 0 for infectee in infectees}
+            for _ in range(trials):
+                cell.person_queue = Queue()
+                test_sweep(self.time)
+                queued = set()
+                while not cell.person_queue.empty():
+                    queued.add(cell.person_queue.get())
+                for infectee in queued:
+                    counts[infectee] += 1
+            for infectee, p in zip(infectees, expected):
+                with self.subTest(aggregated=aggregated):
+                    tolerance = 4 * np.sqrt(p * (1 - p) / trials)
+                    self.assertAlmostEqual(counts[infectee] / trials, p,
+                                           delta=tolerance)
+
+    def test_aggregated_no_households(self):
+        pop_nh = pe.Population()
+        pop_nh.add_cells(1)
+        pop_nh.cells[0].add_microcells(1)
+        pop_nh.cells[0].microcells[0].add_people(1)
+        person_inf = pop_nh.cells[0].microcells[0].persons[0]
+        person_inf.infection_status = pe.property.InfectionStatus.InfectMild
+        test_sweep = pe.sweep.HouseholdSweep(aggregated=True)
+        test_sweep.bind_population(pop_nh)
+        with self.assertRaises(AttributeError):
+            test_sweep(1)
+
     def test_no_households(self):
         pop_nh = pe.Population()  # Population without households
         pop_nh.add_cells(1)
@@ -57,6 +57,129 @@ class TestInitialHouseholdSweep(TestPyEpiabm):
                 self.test_population.cells[0].microcells[0].households:
             self.assertEqual(len(household.persons), 2)
 
+    def test_household_allocation_batch(self):
+        test_sweep = pe.sweep.InitialHouseholdSweep(batch=True)
+        test_sweep.household_size_distribution = np.zeros(10)
+        test_sweep.household_size_distribution[1] = 1.0
+
+        test_sweep.household_allocation(self.test_population)
+        self.assertEqual(len(self.microcell.households), 3)
+        for household in self.microcell.households:
+            self.assertEqual(len(household.persons), 2)
+
+    def test_household_sizes(self):
+        test_sweep = pe.sweep.InitialHouseholdSweep(batch=True)
+        test_sweep.household_size_distribution = [0.5, 0.5]
+        test_sweep.max_household_size = 2
+        np.random.seed(1)
+        for n in [0, 1, 7, 100]:
+            sizes = test_sweep.household_sizes(n)
+            self.assertEqual(np.sum(sizes), n)
+            self.assertTrue(np.all((sizes >= 1) & (sizes <= 2)))
+
+        # Sizes are capped by the maximum household size
+        test_sweep.max_household_size = 1
+        np.testing.assert_array_equal(test_sweep.household_sizes(5),
+                                      np.ones(5))
+
+    def test_household_ages_batch(self):
+        """Tests that ages assigned in batches satisfy the conditions of
+        each type of household, and have the same distribution as ages
+        assigned one household at a time.
+        """
+        test_sweep = pe.sweep.InitialHouseholdSweep(batch=True)
+        self.microcell.add_people(4000)
+        people = self.microcell.persons[6:]
+        pe.routine.Simulation.set_random_seed(2)
+
+        test_sweep.one_person_household_ages_batch(people[:2000])
+        batch_ages = np.array([person.age for person in people[:2000]])
+        self.assertTrue(np.all(batch_ages >= self.age_params["min_adult_age"]))
+        for person in people[:2000]:
+            self.assertEqual(person.age_group, person.age // 5)
+        for person in people[:2000]:
+            test_sweep.one_person_household_age(person)
+        ages = np.array([person.age for person in people[:2000]])
+        self.assertAlmostEqual(np.mean(batch_ages), np.mean(ages), delta=1.5)
+        self.assertAlmostEqual(np.mean(batch_ages >= 44),
+                               np.mean(ages >= 44), delta=0.05)
+
+        households = [people[i:i + 2] for i in range(0, 4000, 2)]
+        test_sweep.two_person_household_ages_batch(households)
+        first = np.array([people[0].age for people in households])
+        second = np.array([people[1].age for people in households])
+        # Only the first person of a child and adult household is a child
+        child = first < self.age_params["min_adult_age"]
+        np.testing.assert_array_less(
+            first[child] + self.age_params["min_parent_age_gap"] - 1,
+            second[child])
+        partners = ((second <= first
+                     + self.age_params["max_MF_partner_age_gap"])
+                    & (second >= first
+                       - self.age_params["max_FM_partner_age_gap"]))
+        parents = ((second <= first + self.age_params["max_parent_age_gap"])
+                   & (second >= first
+                      + self.age_params["min_parent_age_gap"]))
+        self.assertTrue(np.all(partners | parents))
+        for people in households:
+            test_sweep.two_person_household_ages(people)
+        single_first = np.array([people[0].age for people in households])
+        self.assertAlmostEqual(np.mean(first), np.mean(single_first),
+                               delta=1.5)
+        self.assertAlmostEqual(np.mean(child),
+                               np.mean(single_first
+                                       < self.age_params["min_adult_age"]),
+                               delta=0.03)
+
+    def assertSameAgeDistribution(self, ages_1, ages_2):
+        """Chi-squared test that two samples of ages have the same
+        distribution over age groups, at the 0.1% significance level.
+        Age groups with fewer than 10 people in both samples combined are
+        left out.
+
+        """
+        bins = max(np.max(ages_1), np.max(ages_2)) // 5 + 1
+        counts = np.array([np.bincount(np.asarray(ages) // 5, minlength=bins)
+                           for ages in (ages_1, ages_2)])
+        counts = counts[:, counts.sum(axis=0) >= 10]
+        expected = (counts.sum(axis=1, keepdims=True)
+                    * counts.sum(axis=0) / counts.sum())
+        statistic = np.sum((counts - expected) ** 2 / expected)
+        # Wilson-Hilferty approximation of the 99.9% quantile of the
+        # chi-squared distribution
+        dof = counts.shape[1] - 1
+        critical = dof * (1 - 2 / (9 * dof)
+                          + 3.09 * np.sqrt(2 / (9 * dof))) ** 3
+        self.assertLess(statistic, critical)
+
+    def test_household_ages_batch_distribution(self):
+        """Tests that ages assigned in batches have the same distribution
+        over age groups as ages assigned one household at a time, for both
+        people in two person households.
+        """
+        test_sweep = pe.sweep.InitialHouseholdSweep(batch=True)
+        self.microcell.add_people(4000)
+        people = self.microcell.persons[6:]
+        pe.routine.Simulation.set_random_seed(3)
+
+        test_sweep.one_person_household_ages_batch(people)
+        batch_ages = [person.age for person in people]
+        for person in people:
+            test_sweep.one_person_household_age(person)
+        self.assertSameAgeDistribution(batch_ages,
+                                       [person.age for person in people])
+
+        households = [people[i:i + 2] for i in range(0, 4000, 2)]
+        test_sweep.two_person_household_ages_batch(households)
+        batch_ages = [[house[i].age for house in households]
+                      for i in range(2)]
+        for house in households:
+            test_sweep.two_person_household_ages(house)
+        for i in range(2):
+            with self.subTest(person=i):
+                self.assertSameAgeDistribution(
+                    batch_ages[i], [house[i].age for house in households])
+
     @mock.patch('random.random')
     def test_one_person_household_age_elderly_person_case(self, mocked_random):
         """Tests method that assigns age to someone in a one person
@@ -402,6 +525,24 @@ class TestInitialHouseholdSweep(TestPyEpiabm):
         for person in microcell.households[2].persons:
             self.assertTrue(0 <= person.age <= 100)
 
+    @mock.patch('logging.warning')
+    def test_call_batch(self, mock_log):
+        test_sweep = pe.sweep.InitialHouseholdSweep(batch=True)
+        test_sweep.bind_population(self.test_population)
+        self.microcell.add_household([self.person1])
+        self.microcell.add_household([self.person2, self.person3])
+        self.microcell.add_household([self.person4, self.person5,
+                                      self.person6])
+        for person in self.cell.persons:
+            person.age = None
+
+        test_sweep({})
+        self.assertTrue(self.person1.age >= self.age_params["min_adult_age"])
+        for person in self.cell.persons:
+            self.assertTrue(0 <= person.age <= 100)
+        self.assertEqual(np.sum(self.cell.compartment_counter.counts), 6)
+        mock_log.assert_not_called()
+
     @mock.patch('logging.warning')
     def test_log_warning(self, mock_log):
         test_sweep = pe.sweep.InitialHouseholdSweep()
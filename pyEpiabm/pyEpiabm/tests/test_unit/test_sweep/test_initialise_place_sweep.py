@@ -129,7 +129,8 @@ class TestInitialisePlaceSweep(TestPyEpiabm):
         [list, weights] = test_sweep.create_age_weights(place, self.params)
         self.assertListEqual([], list)
         self.assertEqual(weights, [])
-        mock_params.assert_called_once()
+        # Checked once for each call
+        self.assertEqual(mock_params.call_count, 2)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 import pyEpiabm as pe
 from pyEpiabm.sweep import InterventionSweep
@@ -105,6 +106,57 @@ class TestInterventionSweep(TestPyEpiabm):
                  if isinstance(key, CaseIsolation)][0]])
         self.assertIsNone(self.person_symp.isolation_start_time)
 
+    def test_fused_call(self):
+        population = self.pop_factory.make_pop(self.pop_params)
+        person_susc = population.cells[0].microcells[0].persons[0]
+        person_susc.update_status(InfectionStatus(1))
+        person_symp = population.cells[0].microcells[0].persons[1]
+        person_symp.update_status(InfectionStatus(4))
+        sweep = InterventionSweep(fused=True)
+        sweep.bind_population(population)
+        self.assertTrue(sweep.fused)
+
+        with mock.patch.object(pe.Cell, 'number_infectious',
+                               return_value=1) as mock_cases:
+            sweep(time=10)
+            # Case count is only computed once per time step
+            mock_cases.assert_called_once_with()
+        self.assertTrue(all(sweep.intervention_active_status.values()))
+
+        # Same outcome as applying the interventions one after another
+        self.assertIsNotNone(population.cells[0].microcells[0].
+                             closure_start_time)
+        self.assertIsNotNone(population.cells[0].microcells[0].
+                             distancing_start_time)
+        self.assertEqual(person_symp.isolation_start_time, 10)
+        self.assertIsNotNone(person_susc.quarantine_start_time)
+
+        # Interventions are turned off after the end of the policy
+        sweep(time=372)
+        self.assertFalse(any(sweep.intervention_active_status.values()))
+        self.assertIsNone(person_symp.isolation_start_time)
+        self.assertIsNone(person_susc.quarantine_start_time)
+
+    def test_fused_call_kernels(self):
+        cell_intervention = mock.Mock(kernel_level='cell')
+        person_intervention = mock.Mock(kernel_level='person')
+        other_intervention = mock.Mock(kernel_level=None)
+        sweep = InterventionSweep(fused=True)
+        sweep.bind_population(self._population)
+        sweep.fused_call(5, [cell_intervention, person_intervention,
+                             other_intervention])
+        cell_intervention.cell_kernel.assert_called_once_with(
+            5, self._population.cells[0])
+        self.assertEqual(person_intervention.person_kernel.call_count, 2)
+        person_intervention.person_kernel.assert_called_with(
+            5, self.person_symp)
+        cell_intervention.assert_not_called()
+        other_intervention.assert_called_once_with(5)
+
+        # Nothing to do without kernels
+        sweep.fused_call(5, [])
+        self.assertEqual(cell_intervention.cell_kernel.call_count, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
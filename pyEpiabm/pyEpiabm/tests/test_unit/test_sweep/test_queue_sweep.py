@@ -59,6 +59,40 @@ class TestQueueSweep(TestPyEpiabm):
         self.assertEqual(self.person2.time_of_status_change,
                          self.time)
 
+    def test_call_batch(self):
+        """Tests that many people, including people of other cells and both
+        vaccinated and unvaccinated people, are updated together.
+        """
+        self.cell.microcells[0].add_people(10)
+        people = self.cell.persons[2:]
+        for person in people[:5]:
+            person.is_vaccinated = True
+            person.date_vaccinated = 0
+        other_cell = pe.Cell()
+        other_cell.add_microcells(1)
+        other_cell.microcells[0].add_people(1)
+        other_person = other_cell.persons[0]
+        for person in people + [other_person]:
+            self.cell.enqueue_person(person)
+
+        test_sweep = pe.sweep.QueueSweep()
+        test_sweep.bind_population(self.test_population)
+        with mock.patch('pyEpiabm.Parameters.instance') as mock_params:
+            mock_params.return_value.intervention_params = {
+                'vaccine_params': {'time_to_efficacy': 0,
+                                   'vacc_protectiveness': 1}}
+            test_sweep(self.time)
+        mock_params.assert_called_once()
+        self.assertTrue(self.cell.person_queue.empty())
+        for person in people[:5]:
+            self.assertEqual(person.next_infection_status,
+                             pe.property.InfectionStatus.Vaccinated)
+        for person in people[5:] + [other_person]:
+            self.assertEqual(person.next_infection_status,
+                             pe.property.InfectionStatus.Exposed)
+        for person in people + [other_person]:
+            self.assertEqual(person.time_of_status_change, self.time)
+
     def test_vaccine_protection_full(self):
         """Tests that a vaccinated person will be moved to the vaccinated
         compartment.
@@ -115,6 +115,32 @@ class TestSpatialSweep(TestMockedLogs):
         self.assertEqual(test_sweep.bind_population(test_pop), None)
         self.assertEqual(test_sweep.bind_population(test_pop), None)
 
+    def test_neighbour_index(self):
+        Parameters.instance().infection_radius = 1000
+        test_pop = self.pop
+        test_pop.add_cells(1)
+        self.cell_susc.set_location((1.0, 0.0))
+        test_pop.cells[2].set_location((0.0, 4.0))
+        test_sweep = SpatialSweep()
+        test_sweep.bind_population(test_pop)
+        self.assertEqual(test_sweep._neighbour_ptr.tolist(), [0, 2, 4, 6])
+        self.assertEqual(test_sweep._neighbour_indices[:2].tolist(), [1, 2])
+        self.assertEqual(test_sweep._neighbour_weights[:2].tolist(),
+                         [1.0, 0.25])
+        self.assertEqual(test_sweep._neighbour_cum_weights[:2].tolist(),
+                         [1.0, 1.25])
+        self.assertEqual(test_sweep._susceptible_counts().tolist(),
+                         [0, 1, 0])
+
+        # Only neighbouring cells are chosen
+        with mock.patch('random.choices') as mock_choices:
+            mock_choices.return_value = [1]
+            test_list = test_sweep.find_infectees(self.cell_inf, None, 1)
+            self.assertEqual(test_list, [self.infectee])
+            self.assertEqual(mock_choices.call_args.args[0], [1, 2])
+            self.assertEqual(mock_choices.call_args.kwargs['cum_weights'],
+                             [1.0, 1.25])
+
     @mock.patch("logging.exception")
     @mock.patch("numpy.nan_to_num")
     @mock.patch("pyEpiabm.utility.DistanceFunctions.dist_euclid")
@@ -173,6 +199,36 @@ class TestSpatialSweep(TestMockedLogs):
         # test_list = test_sweep.find_infectees_Covidsim(self.infector,
         #                                               [cell_susc], 1)
 
+    def test_cached_kernels(self):
+        Parameters.instance().infection_radius = 3
+        Parameters.instance().do_CovidSim = True
+        test_pop = self.pop
+        test_pop.add_cells(1)
+        far_cell = test_pop.cells[2]
+        far_cell.add_microcells(1)
+        far_cell.microcells[0].add_people(1)
+        self.cell_susc.set_location((2.0, 0.0))
+        self.microcell_susc.set_location((1.0, 0.0))
+        far_cell.set_location((10.0, 0.0))
+        test_sweep = SpatialSweep()
+        test_sweep.bind_population(test_pop)
+        self.assertEqual(test_sweep._neighbour_kernels.tolist(),
+                         [1 / 3, 1 / 3])
+        # Minimum distance between the microcells is 1
+        self.assertEqual(test_sweep._neighbour_acceptance.tolist(),
+                         [2 / 3, 2 / 3])
+
+        # Cells outside the infection radius are never chosen
+        with mock.patch('random.random') as mock_random:
+            mock_random.return_value = 0
+            test_list = test_sweep.find_infectees_Covidsim(self.infector,
+                                                           None, 3)
+        self.assertEqual(test_list, [self.infectee] * 3)
+        # No infectees without susceptibles nearby
+        self.infectee.update_status(InfectionStatus.Recovered)
+        self.assertEqual(test_sweep.find_infectees_Covidsim(
+            self.infector, None, 3), [])
+
     @mock.patch("pyEpiabm.sweep.SpatialSweep.find_infectees_Covidsim")
     @mock.patch("pyEpiabm.sweep.SpatialSweep.find_infectees")
     @mock.patch("numpy.random.poisson")
@@ -278,6 +334,7 @@ class TestSpatialSweep(TestMockedLogs):
         fake_infectee = microcell_susc.persons[1]
         fake_infectee.update_status(InfectionStatus.Recovered)
         actual_infectee = microcell_susc.persons[0]
+        test_sweep.bind_population(test_pop)
 
         self.assertTrue(cell_susc.person_queue.empty())
         test_sweep.do_infection_event(self.infector, fake_infectee, 1)
@@ -120,6 +120,37 @@ class TestStateTransitionMatrix(TestPyEpiabm):
             self.assertAlmostEqual(0.26, output.loc['Exposed', 'InfectASympt'])
             self.assertAlmostEqual(0.74, output.loc['Exposed', 'InfectMild'])
 
+    def test_compile(self):
+        with mock.patch('pyEpiabm.Parameters.instance') as mock_param:
+            mock_param.return_value.age_proportions = self.age_prop
+            matrix = StateTransitionMatrix(self.list_coefficients,
+                                           use_ages=True).matrix
+            cumulative = StateTransitionMatrix.compile(matrix, 2)
+            n = len(InfectionStatus)
+            self.assertEqual(cumulative.shape, (2, n, n))
+            exposed = InfectionStatus.Exposed.value - 1
+            mild = InfectionStatus.InfectMild.value - 1
+            self.assertAlmostEqual(cumulative[0, exposed, mild], 1.0)
+            self.assertAlmostEqual(cumulative[1, exposed, mild - 1], 0.2)
+            self.assertAlmostEqual(cumulative[1, exposed, -1], 1.0)
+            # Rows without any transitions stay at zero
+            gp = InfectionStatus.InfectGP.value - 1
+            self.assertEqual(cumulative[0, gp, -1], 0.0)
+
+            with self.assertRaises(ValueError):
+                StateTransitionMatrix.compile(matrix.iloc[1:], 2)
+
+        # Rows with transitions end at exactly one, whatever the weights
+        np.random.seed(1)
+        weights = np.random.random((50, n, n))
+        weights[weights < 0.3] = 0
+        for row_weights in weights:
+            cumulative = StateTransitionMatrix.compile(
+                pd.DataFrame(row_weights), 1)
+            totals = cumulative[0, :, -1]
+            np.testing.assert_array_equal(
+                totals[row_weights.sum(axis=1) > 0], 1.0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -115,6 +115,29 @@ class TestTransitionTimeMatrix(TestPyEpiabm):
             matrix_object.update_transition_time_with_icdf(
                 row, column, neg_icdf, test_mean)
 
+    def test_compile(self):
+        """Tests that compile separates fixed transition times from inverse
+        CDFs."""
+        matrix_object = TransitionTimeMatrix()
+        matrix_object.matrix = matrix_object.create_transition_time_matrix()
+        matrix_object.update_transition_time_with_float(
+            InfectionStatus.InfectASympt, InfectionStatus.Recovered, 2.0)
+        fixed, icdfs = TransitionTimeMatrix.compile(matrix_object.matrix)
+        n = len(InfectionStatus)
+        self.assertEqual(fixed.shape, (n, n))
+        self.assertEqual(icdfs.shape, (n, n))
+
+        asympt = InfectionStatus.InfectASympt.value - 1
+        recovered = InfectionStatus.Recovered.value - 1
+        self.assertEqual(fixed[asympt, recovered], 2.0)
+        self.assertIsNone(icdfs[asympt, recovered])
+        exposed = InfectionStatus.Exposed.value - 1
+        mild = InfectionStatus.InfectMild.value - 1
+        self.assertTrue(np.isnan(fixed[exposed, mild]))
+        self.assertIs(icdfs[exposed, mild],
+                      matrix_object.matrix.loc['Exposed', 'InfectMild'])
+        self.assertEqual(fixed[recovered, exposed], -1)
+
 
 if __name__ == '__main__':
     unittest.main()
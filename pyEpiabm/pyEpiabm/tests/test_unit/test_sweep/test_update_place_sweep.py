@@ -52,20 +52,20 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
 
         test_sweep.update_place_group(place)
         self.assertTrue(place.persons)
-        self.assertDictEqual(place.person_groups, {0: [person]})
+        self.assertDictEqual(place.person_groups, {0: {person: None}})
         self.place.empty_place()
         mock_random.return_value = 1
         test_sweep.update_place_group(place, person_list=[person],
                                       group_size=1)
         self.assertDictEqual(place.person_groups,
-                             {0: [], 1: [person]})
+                             {0: {}, 1: {person: None}})
 
         # Test when max capacity not set
         self.place.empty_place([1])
         test_sweep.update_place_group(place, person_list=[person],
                                       power_law_params=[3, 1, 4])
         self.assertDictEqual(place.person_groups,
-                             {0: [], 1: [person]})
+                             {0: {}, 1: {person: None}})
         self.assertRaises(AssertionError, test_sweep.update_place_group,
                           place, person_list=[person], power_law_params=[3])
 
@@ -74,14 +74,14 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
         test_sweep.update_place_group(place, person_list=[person],
                                       group_index=1)
         self.assertDictEqual(place.person_groups,
-                             {0: [], 1: [person]})
+                             {0: {}, 1: {person: None}})
 
         # Test with weights
         self.place.empty_place([1])
         test_sweep.update_place_group(place, person_list=[person],
                                       person_weights=[1])
         self.assertDictEqual(place.person_groups,
-                             {0: [], 1: [person]})
+                             {0: {}, 1: {person: None}})
         self.place.empty_place()
         test_sweep.update_place_group(place, person_list=[])
         log_mock.assert_called
@@ -103,7 +103,7 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
         test_sweep.update_place_group(place, person_list=[person],
                                       group_size=1)
         self.assertDictEqual(place.person_groups,
-                             {0: [], 1: [person]})
+                             {0: {}, 1: {person: None}})
         self.assertTrue(person.care_home_resident)
 
         # Test for key worker
@@ -112,9 +112,53 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
         mock_random.return_value = 1
         test_sweep.update_place_group(place, person_list=[person],
                                       group_size=1)
-        self.assertDictEqual(place.person_groups, {0: [person], 1: []})
+        self.assertDictEqual(place.person_groups,
+                             {0: {person: None}, 1: {}})
         self.assertTrue(person.key_worker)
 
+    @mock.patch("numpy.random.poisson")
+    def test_update_place_eligibility(self, mock_poisson):
+        """Test that people are drawn without replacement, excluding
+        current members, people with a place of the same type and people
+        with zero weight.
+        """
+        self.microcell.add_people(5)
+        person_list = self.cell.persons
+        self.microcell.add_place(1, (1, 1), PlaceType.Workplace)
+        self.cell.places[1].add_person(person_list[1])
+        self.place.add_person(person_list[2])
+        test_sweep = UpdatePlaceSweep()
+        test_sweep.bind_population(self.pop)
+        mock_poisson.return_value = 10
+
+        test_sweep.update_place_group(
+            self.place, group_index=1, person_list=person_list,
+            person_weights=[1, 1, 1, 0, 2, 1])
+        self.assertDictEqual(self.place.person_groups,
+                             {0: {person_list[2]: None},
+                              1: {person_list[0]: None, person_list[4]: None,
+                                  person_list[5]: None}})
+
+        mock_poisson.return_value = 1
+        self.place.empty_place([1])
+        test_sweep.update_place_group(self.place, group_index=1,
+                                      person_list=person_list)
+        self.assertEqual(len(self.place.person_groups[1]), 1)
+
+        # Other lists of the people of the cell are looked up by person
+        self.place.empty_place([1])
+        test_sweep.update_place_group(self.place, group_index=1,
+                                      person_list=person_list[::-1])
+        self.assertEqual(len(self.place.person_groups[1]), 1)
+
+        # People from other cells may not be added
+        self.pop.add_cells(1)
+        self.pop.cells[1].add_microcells(1)
+        self.pop.cells[1].microcells[0].add_people(1)
+        with self.assertRaises(AssertionError):
+            test_sweep.update_place_group(
+                self.place, person_list=self.pop.cells[1].persons)
+
     @mock.patch('random.random')
     def test_key_worker_assignment(self, mock_random):
         mock_random.return_value = 0
@@ -145,7 +189,7 @@ class TestUpdatePlaceSweep(TestPyEpiabm):
         test_sweep.update_place_group(place, person_list=[person],
                                       group_size=1)
         self.assertDictEqual(place.person_groups,
-                             {0: [person]})
+                             {0: {person: None}})
 
     @mock.patch("pyEpiabm.sweep.UpdatePlaceSweep.update_place_group")
     def test__call__(self, mock_update):
@@ -36,6 +36,42 @@ class TestInverseCdf(TestPyEpiabm):
         value = icdf_object.icdf_choose_exp()
         self.assertTrue(0 <= value)
 
+    def test_exp_array(self):
+        icdf_array = np.linspace(0, 2, 21)
+        icdf_object = InverseCdf(3, icdf_array)
+        np.testing.assert_array_almost_equal(icdf_object.exp_icdf_array,
+                                             np.exp(-icdf_array))
+
+    def test_choose_noexp_batch(self):
+        icdf = 10 * np.sort(np.random.rand(21))
+        icdf_object = InverseCdf(3, icdf)
+        values = icdf_object.icdf_choose_noexp_batch(100)
+        self.assertEqual(values.shape, (100,))
+        self.assertTrue((values >= 0).all())
+        self.assertTrue((values <= np.floor(0.5 + 30 * icdf[-1])).all())
+
+        # Constant icdf gives the scaled mean
+        icdf_object = InverseCdf(3, np.ones(21))
+        np.testing.assert_array_equal(
+            icdf_object.icdf_choose_noexp_batch(10), 3 * np.ones(10))
+
+    def test_choose_exp_batch(self):
+        icdf = 10 * np.sort(np.random.rand(21))
+        icdf_object = InverseCdf(3, icdf)
+        values = icdf_object.icdf_choose_exp_batch(100)
+        self.assertEqual(values.shape, (100,))
+        self.assertTrue((values >= 0).all())
+
+    def test_batch_generator(self):
+        icdf = 10 * np.sort(np.random.rand(21))
+        icdf_object = InverseCdf(3, icdf)
+        values = icdf_object.icdf_choose_noexp_batch(
+            50, np.random.default_rng(1))
+        np.testing.assert_array_equal(values,
+                                      icdf_object.icdf_choose_noexp_batch(
+                                          50, np.random.default_rng(1)))
+        self.assertEqual(len(icdf_object.icdf_choose_exp_batch(0)), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+
+from pyEpiabm.utility import SpatialIndex
+
+
+class TestSpatialIndex(unittest.TestCase):
+    """Test the 'SpatialIndex' class.
+    """
+    def setUp(self) -> None:
+        np.random.seed(0)
+        self.locations = np.random.rand(200, 2)
+        self.points = np.random.rand(20, 2)
+
+    def brute_force_distances(self, point):
+        return np.linalg.norm(self.locations - point, axis=1)
+
+    def test_construct(self):
+        index = SpatialIndex(self.locations, 0.1)
+        self.assertEqual(len(index), 200)
+        self.assertEqual(index.bucket_size, 0.1)
+        self.assertGreater(SpatialIndex(self.locations).bucket_size, 0)
+        self.assertEqual(SpatialIndex([(0, 0)], 0).bucket_size, 1.0)
+        self.assertEqual(len(SpatialIndex([])), 0)
+
+    def test_candidates(self):
+        index = SpatialIndex(self.locations, 0.1)
+        for point in self.points:
+            candidates = index.candidates(point, 0.15)
+            within = np.flatnonzero(self.brute_force_distances(point) < 0.15)
+            self.assertTrue(np.isin(within, candidates).all())
+        self.assertEqual(len(SpatialIndex([]).candidates((0, 0), 1)), 0)
+
+    def test_query_radius(self):
+        for bucket_size in [0.05, 0.2, 5]:
+            index = SpatialIndex(self.locations, bucket_size)
+            results = index.query_radius(self.points, 0.2)
+            self.assertEqual(len(results), len(self.points))
+            for point, (indices, distances) in zip(self.points, results):
+                all_distances = self.brute_force_distances(point)
+                np.testing.assert_array_equal(
+                    indices, np.flatnonzero(all_distances < 0.2))
+                np.testing.assert_array_almost_equal(distances,
+                                                     all_distances[indices])
+
+    def test_query_nearest(self):
+        for bucket_size in [0.01, 0.1, None]:
+            index = SpatialIndex(self.locations, bucket_size)
+            indices, distances = index.query_nearest(self.points, 3)
+            self.assertEqual(indices.shape, (20, 3))
+            for n, point in enumerate(self.points):
+                all_distances = self.brute_force_distances(point)
+                np.testing.assert_array_almost_equal(
+                    distances[n], np.sort(all_distances)[:3])
+                np.testing.assert_array_almost_equal(
+                    all_distances[indices[n]], distances[n])
+
+        # Query points far outside the indexed region
+        indices, distances = index.query_nearest([(10, 10)])
+        self.assertEqual(indices[0, 0],
+                         np.argmin(self.brute_force_distances((10, 10))))
+
+        self.assertRaises(ValueError, index.query_nearest, self.points, 0)
+        self.assertRaises(ValueError, index.query_nearest, self.points, 201)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,7 @@ algorithms that are called throughout pyEpiabm.
 """
 
 from .distance_metrics import DistanceFunctions
+from .spatial_index import SpatialIndex
 from .covidsim_kernel import SpatialKernel
 from .random_methods import RandomMethods
 from .inverse_cdf import InverseCdf
@@ -5,6 +5,8 @@
 import typing
 import numpy as np
 
+from .spatial_index import SpatialIndex
+
 
 class DistanceFunctions:
     """Class which contains multiple distance functions
@@ -122,11 +124,10 @@ class DistanceFunctions:
         float
             Minimum distance between the two cells
         """
-        dist = np.inf
-        for microcell1 in cell1.microcells:
-            for microcell2 in cell2.microcells:
-                microcell_dist = DistanceFunctions.dist(microcell1.location,
-                                                        microcell2.location)
-                if microcell_dist < dist:
-                    dist = microcell_dist
-        return dist
+        if len(cell1.microcells) == 0 or len(cell2.microcells) == 0:
+            return np.inf
+        index = SpatialIndex([microcell.location
+                              for microcell in cell2.microcells])
+        _, distances = index.query_nearest([microcell.location for microcell
+                                            in cell1.microcells])
+        return float(distances.min())
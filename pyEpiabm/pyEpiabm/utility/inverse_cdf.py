@@ -33,6 +33,7 @@ class InverseCdf:
         # the simulation.
         self.mean = mean
         self.icdf_array = np.asarray(icdf_array)
+        self.exp_icdf_array = np.exp(-self.icdf_array)
         self.CDF_RES = len(icdf_array) - 1
         self.time_steps_per_day = pe.Parameters.instance().time_steps_per_day
 
@@ -67,7 +68,7 @@ class InverseCdf:
             Mean scaled relative to given icdf
 
         """
-        exp_icdf_array = np.exp(-self.icdf_array)
+        exp_icdf_array = self.exp_icdf_array
         rand_num = random.random()
         q = rand_num * self.CDF_RES
 
@@ -81,3 +82,81 @@ class InverseCdf:
             np.log((q * exp_icdf_array[i+1] + (1.0 - q) * exp_icdf_array[i]))
         value = float(math.floor(0.5 + (ti * self.time_steps_per_day)))
         return value
+
+    def _choose_quantiles(self, size: int,
+                          rng: np.random.Generator = None):
+        """Draws the indices and interpolation weights used to sample
+        several values from the icdf at once.
+
+        Parameters
+        ----------
+        size : int
+            Number of values to sample
+        rng : np.random.Generator
+            Random number generator to use. If None, the global numpy
+            random state is used
+
+        Returns
+        -------
+        np.ndarray
+            Array of indices into the icdf array
+        np.ndarray
+            Array of interpolation weights, on the unit interval
+
+        """
+        rand_nums = rng.random(size) if rng is not None \
+            else np.random.random(size)
+        q = rand_nums * self.CDF_RES
+        i = np.floor(q).astype(int)
+        q -= i
+        return i, q
+
+    def icdf_choose_noexp_batch(self, size: int,
+                                rng: np.random.Generator = None
+                                ) -> np.ndarray:
+        """Samples several values from the inverse cumulative distribution
+        function at once, as in :meth:`icdf_choose_noexp`.
+
+        Parameters
+        ----------
+        size : int
+            Number of values to sample
+        rng : np.random.Generator
+            Random number generator to use. If None, the global numpy
+            random state is used
+
+        Returns
+        -------
+        np.ndarray
+            Array of sampled values
+
+        """
+        i, q = self._choose_quantiles(size, rng)
+        ti = (self.mean
+              * (q * self.icdf_array[i+1] + (1.0 - q) * self.icdf_array[i]))
+        return np.floor(0.5 + (ti * self.time_steps_per_day))
+
+    def icdf_choose_exp_batch(self, size: int,
+                              rng: np.random.Generator = None
+                              ) -> np.ndarray:
+        """Samples several values from the inverse cumulative distribution
+        function at once, as in :meth:`icdf_choose_exp`.
+
+        Parameters
+        ----------
+        size : int
+            Number of values to sample
+        rng : np.random.Generator
+            Random number generator to use. If None, the global numpy
+            random state is used
+
+        Returns
+        -------
+        np.ndarray
+            Array of sampled values
+
+        """
+        i, q = self._choose_quantiles(size, rng)
+        ti = -self.mean * np.log(q * self.exp_icdf_array[i+1]
+                                 + (1.0 - q) * self.exp_icdf_array[i])
+        return np.floor(0.5 + (ti * self.time_steps_per_day))
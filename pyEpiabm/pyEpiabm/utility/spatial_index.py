@@ -0,0 +1,209 @@
+#
+# Uniform grid index for spatial queries on sets of points
+#
+
+import math
+import typing
+import numpy as np
+
+
+class SpatialIndex:
+    """Class which indexes a set of (x, y) points in a uniform grid of
+    square buckets, to answer radius and nearest neighbour queries
+    without comparing every pair of points. Distances are Euclidean, as in
+    :meth:`DistanceFunctions.dist_euclid`.
+
+    """
+    def __init__(self, locations: typing.Iterable[typing.Tuple[float, float]],
+                 bucket_size: float = None):
+        """Constructor Method.
+
+        Parameters
+        ----------
+        locations : typing.Iterable[typing.Tuple[float, float]]
+            (x, y) coordinates of the points to index. Query results refer
+            to points by their position in this list
+        bucket_size : float
+            Side length of the grid buckets. Queries are fastest when this
+            is close to the typical query radius. If not given, it is chosen
+            so that there is about one point per bucket
+
+        """
+        self.locations = np.asarray(locations, dtype=float).reshape(-1, 2)
+        if bucket_size is None or not (0 < bucket_size < np.inf):
+            bucket_size = self._default_bucket_size()
+        self.bucket_size = float(bucket_size)
+
+        self._buckets = {}
+        keys = np.floor(self.locations / self.bucket_size).astype(int)
+        for index, key in enumerate(map(tuple, keys.tolist())):
+            self._buckets.setdefault(key, []).append(index)
+        self._buckets = {key: np.array(value, dtype=int)
+                         for key, value in self._buckets.items()}
+        if len(self._buckets) > 0:
+            all_keys = np.array(list(self._buckets.keys()))
+            self._min_key = all_keys.min(axis=0)
+            self._max_key = all_keys.max(axis=0)
+
+    def __len__(self):
+        """Returns the number of indexed points.
+
+        Returns
+        -------
+        int
+            Number of points
+
+        """
+        return len(self.locations)
+
+    def _default_bucket_size(self) -> float:
+        """Returns a bucket size giving about one point per bucket.
+
+        Returns
+        -------
+        float
+            Side length of the buckets
+
+        """
+        if len(self.locations) < 2:
+            return 1.0
+        extent = np.ptp(self.locations, axis=0).max()
+        if extent == 0:
+            return 1.0
+        return extent / math.sqrt(len(self.locations))
+
+    def _key(self, point: typing.Tuple[float, float]):
+        """Returns the key of the bucket containing the given point.
+
+        """
+        return (math.floor(point[0] / self.bucket_size),
+                math.floor(point[1] / self.bucket_size))
+
+    def _ring(self, key, radius: int) -> np.ndarray:
+        """Returns the points in the buckets at the given Chebyshev
+        distance (in buckets) from the bucket with the given key.
+
+        """
+        kx, ky = key
+        if radius == 0:
+            keys = [(kx, ky)]
+        else:
+            keys = ([(kx + dx, ky + dy) for dx in (-radius, radius)
+                     for dy in range(-radius, radius + 1)]
+                    + [(kx + dx, ky + dy) for dx in range(-radius + 1, radius)
+                       for dy in (-radius, radius)])
+        found = [self._buckets[k] for k in keys if k in self._buckets]
+        if len(found) == 0:
+            return np.zeros(0, dtype=int)
+        return np.concatenate(found)
+
+    def candidates(self, point: typing.Tuple[float, float],
+                   radius: float) -> np.ndarray:
+        """Returns the points in all buckets overlapping the square of
+        half-width `radius` around the given point. This is a superset of
+        the points within the radius, which may be filtered with any
+        distance metric.
+
+        Parameters
+        ----------
+        point : typing.Tuple[float, float]
+            (x, y) coordinates of the query point
+        radius : float
+            Radius of the query
+
+        Returns
+        -------
+        np.ndarray
+            Array of indices of candidate points
+
+        """
+        if len(self._buckets) == 0:
+            return np.zeros(0, dtype=int)
+        low = np.maximum(np.floor((np.asarray(point) - radius)
+                                  / self.bucket_size), self._min_key)
+        high = np.minimum(np.floor((np.asarray(point) + radius)
+                                   / self.bucket_size), self._max_key)
+        found = [self._buckets[(kx, ky)]
+                 for kx in range(int(low[0]), int(high[0]) + 1)
+                 for ky in range(int(low[1]), int(high[1]) + 1)
+                 if (kx, ky) in self._buckets]
+        if len(found) == 0:
+            return np.zeros(0, dtype=int)
+        return np.sort(np.concatenate(found))
+
+    def query_radius(self, points: typing.Iterable[typing.Tuple[float, float]],
+                     radius: float) -> typing.List[typing.Tuple[np.ndarray,
+                                                                np.ndarray]]:
+        """Finds the indexed points strictly closer than `radius` to each
+        of the given points.
+
+        Parameters
+        ----------
+        points : typing.Iterable[typing.Tuple[float, float]]
+            (x, y) coordinates of the query points
+        radius : float
+            Radius of the query
+
+        Returns
+        -------
+        typing.List[typing.Tuple[np.ndarray, np.ndarray]]
+            For each query point, the indices of the points within the
+            radius (in increasing order) and their distances
+
+        """
+        results = []
+        for point in np.asarray(points, dtype=float).reshape(-1, 2):
+            indices = self.candidates(point, radius)
+            distances = np.linalg.norm(self.locations[indices] - point,
+                                       axis=1)
+            within = distances < radius
+            results.append((indices[within], distances[within]))
+        return results
+
+    def query_nearest(self, points: typing.Iterable[typing.Tuple[float,
+                                                                 float]],
+                      k: int = 1) -> typing.Tuple[np.ndarray, np.ndarray]:
+        """Finds the `k` nearest indexed points to each of the given points.
+
+        Parameters
+        ----------
+        points : typing.Iterable[typing.Tuple[float, float]]
+            (x, y) coordinates of the query points
+        k : int
+            Number of neighbours to find
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (number of points, k) of the indices of the
+            nearest points, closest first
+        np.ndarray
+            Array of the corresponding distances
+
+        """
+        if not 0 < k <= len(self):
+            raise ValueError(f"Cannot find {k} nearest neighbours among"
+                             + f" {len(self)} points")
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        all_indices = np.zeros((len(points), k), dtype=int)
+        all_distances = np.zeros((len(points), k))
+        for n, point in enumerate(points):
+            key = self._key(point)
+            # Rings beyond this one contain no points
+            max_ring = int(max(np.abs(np.subtract(key, self._min_key)).max(),
+                               np.abs(np.subtract(key, self._max_key)).max()))
+            indices = np.zeros(0, dtype=int)
+            distances = np.zeros(0)
+            for ring in range(max_ring + 1):
+                found = self._ring(key, ring)
+                indices = np.concatenate([indices, found])
+                distances = np.concatenate([distances, np.linalg.norm(
+                    self.locations[found] - point, axis=1)])
+                # Points in further rings are at least this far away
+                if (len(indices) >= k and np.partition(distances, k - 1)[k - 1]
+                        <= ring * self.bucket_size):
+                    break
+            order = np.lexsort((indices, distances))[:k]
+            all_indices[n] = indices[order]
+            all_distances[n] = distances[order]
+        return all_indices, all_distances
@@ -66,7 +66,7 @@ setup(
         'packaging',
         'parameterized',
         'pandas',
-        'pandas>=1.4;python_version>="3.8"',  # noqa
+        'pandas>=1.5;python_version>="3.8"',  # noqa
         'tqdm'
     ],
     extras_require={
@@ -14,7 +14,8 @@ from pyEpiabm.property import InfectionStatus
 from pyEpiabm.sweep import StateTransitionMatrix, TransitionTimeMatrix
 # csv input files should have the column headers:
 # time, infection_Status1, infection_status2, ..., age_range
-# so there will be multiple entries for each timepoint.
+# so there will be multiple entries for each timepoint. Binary output files
+# written by the simulation are converted to the same layout.
 
 
 class Plotter():
@@ -29,7 +30,7 @@ class Plotter():
         Parameters
         ----------
         filepath : str
-            Filepath to the .csv containing output data
+            Filepath to the .csv or binary .bin file containing output data
         start_date : str
             Starting date for the simulation, "day-month-year"
         sum_weekly : bool
@@ -37,9 +38,14 @@ class Plotter():
         age_list : list
             List of the explicit age ranges saved in the csv
         """
-        if not os.path.splitext(filepath)[1] == ".csv":
-            raise TypeError("input file" + filepath + "must be .csv")
-        self.data = pd.read_csv(filepath)
+        extension = os.path.splitext(filepath)[1]
+        if extension == ".csv":
+            self.data = pd.read_csv(filepath)
+        elif extension == ".bin":
+            reader = pe.output.BinaryReader(filepath)
+            self.data = reader.to_dataframe(reader.nb_age_groups > 1)
+        else:
+            raise TypeError("input file" + filepath + "must be .csv or .bin")
         self.age_list = age_list
         self.start_date = start_date
         self.sum_weekly = sum_weekly
@@ -4,7 +4,6 @@
 
 import os
 import logging
-import pandas as pd
 import matplotlib.pyplot as plt
 
 import pyEpiabm as pe
@@ -54,7 +53,8 @@ sim_params = {"simulation_start_time": 0, "simulation_end_time": 30,
 file_params = {"output_file": "output.csv",
                "output_dir": os.path.join(os.path.dirname(__file__),
                                           "spatial_outputs"),
-               "spatial_output": True, "age_stratified": False}
+               "spatial_output": True, "age_stratified": False,
+               "results_file": "output.bin"}
 
 # Create a simulation object, configure it with the parameters given, then
 # run the simulation.
@@ -84,8 +84,8 @@ del sim
 # Creation of a plot of results
 logging.getLogger("matplotlib").setLevel(logging.WARNING)
 filename = os.path.join(os.path.dirname(__file__), "spatial_outputs",
-                        "output.csv")
-df = pd.read_csv(filename)
+                        "output.bin")
+df = pe.output.BinaryReader(filename).to_dataframe(age_stratified=False)
 
 
 df = df.pivot(index="time", columns="cell",
@@ -16,6 +16,8 @@ from scipy.spatial import Voronoi, voronoi_plot_2d
 import glob
 from PIL import Image
 
+import pyEpiabm as pe
+
 
 def point_in_region(point: np.ndarray,
                     grid_lim: typing.List[typing.List[float]]):
@@ -322,10 +324,14 @@ def generate_animation(
                 os.remove(os.path.join(save_path, file))
 
 
-# Read in the data from simulation output
-filename = os.path.join(os.path.dirname(__file__), "spatial_outputs",
-                        "output.csv")
-df = pd.read_csv(filename)
+# Read in the data from simulation output, from the binary output file if
+# the simulation wrote one
+output_dir = os.path.join(os.path.dirname(__file__), "spatial_outputs")
+if os.path.exists(os.path.join(output_dir, "output.bin")):
+    df = pe.output.BinaryReader(os.path.join(
+        output_dir, "output.bin")).to_dataframe(age_stratified=False)
+else:
+    df = pd.read_csv(os.path.join(output_dir, "output.csv"))
 
 locations = np.unique(
     np.transpose(np.stack((df["location_x"], df["location_y"]))), axis=0